@@ -11,154 +11,86 @@
     На главной заставке правой кнопкой мыши можно посмотреть справку
     Приятной игры
 """
-import pygame
-import random
 import os
+import time
+
+START_TIME = time.perf_counter()  # для метрики "время до первого кадра"
+
+import pygame
 
 
 # Импортируем классы из соответствующих папок
+from audio.MusicPlayer import MusicPlayer
+from audio.SfxMixer import SfxMixer
+from audio.SoundCache import SoundCache
+from engine.settings import (
+    WIDTH, HEIGHT, FPS, TICK_MS, MAX_STEPS_PER_FRAME, MUSIC_DIR, LEVEL_MUSIC, SFX_CHANNELS, SFX_RULES,
+    ATLAS_DIR, ATLAS_SPRITES, splash_info
+)
+from engine.World import World
+from entities.EntityStore import EntityStore
 from entities.Ship import Ship
-from entities.Sprite import Sprite
-from entities.Explosion import Explosion
 from environment.Grid import Grid
-from utils.ImageInfo import ImageInfo
-from utils.vector import dist
+from render.ProfilerOverlay import ProfilerOverlay
+from render.Renderer import Renderer
+from utils.AssetLoader import AssetLoader
+from utils.AssetManager import AssetManager
+from utils.Profiler import profiler
+from utils.RotationCache import rotation_cache
+from utils.SpatialHash import SpatialHash
+from utils.SpriteAtlas import SpriteAtlas
 
 # --- Globals --- #
-WIDTH = 800
-HEIGHT = 600
-MAX_ROCK = 5
-score = 0
-lives = 3
-time = 0
-started = False
-loot_collected = 0
-game_over = False  # переменная для отслеживания состояния Game Over
 show_instructions = False  # показывать ли инструкцию
-current_level = 1  # текущий уровень
-score_to_next_level = 50  # очки для перехода на следующий уровень
-nebula_images = []
-levels_up = False
-
-
-# --- Helper Functions for Groups --- #
-def process_sprite_group(group, screen):
-    for sprite in set(group):  # Iterate over a copy to allow modification
-        sprite.update(WIDTH, HEIGHT)
-        sprite.draw(screen)
-        if sprite.update(WIDTH, HEIGHT):
-            group.remove(sprite)
-
-
-def group_collide(group, other):
-    collisions = 0
-    for sprite in set(group):
-        if sprite.collide(other):
-            # Создаем спрайт анимации взрыва
-            explosion = Explosion(sprite.pos, [0, 0], 0, 0, explosion_images, explosion_info, explosion_sound)
-            explosion_group.add(explosion)
-
-            group.remove(sprite)
-            collisions += 1
-    return collisions
-
-
-def group_group_collide(group1, group2):
-    collisions = 0
-    for sprite in set(group1):
-        if group_collide(group2, sprite):
-            group1.remove(sprite)
-            collisions += 1
-    return collisions
+# Запись команд для повтора включается явно: GAME_RECORD=.cache/last_run.replay (по умолчанию не пишется)
+RECORD_PATH = os.environ.get("GAME_RECORD") or None
+DIRTY_RECTS = False  # обновлять только изменившиеся участки экрана (для слабых машин)
+SORT_BLITS = False  # группировать объекты каждого слоя по изображению перед выводом
+ROTATION_RESOLUTION = 3  # шаг кэша поворотов в градусах
+ROTATION_CACHE_BYTES = 64 * 1024 * 1024  # лимит памяти кэша поворотов
+WARM_UP_ROTATIONS = True  # заранее поворачивать вращающиеся изображения при загрузке
+PROFILER_KEY = pygame.K_F3  # показать/скрыть оверлей профайлера
+TRACE_KEY = pygame.K_F4  # начать/закончить запись трассы профайлера
+TRACE_PATH = os.path.join(".cache", "trace.json")  # трасса для chrome://tracing или Perfetto
+SOUND_EVENTS = {"thrust_on": "thrust"}  # событие мира -> эффект (если имена различаются)
 
 
 # --- Game Logic Handlers --- #
-def next_level():
-    """Загружает следующий уровень."""
-    global current_level, grid, loot_collected, my_ship, score_to_next_level, nebula_images, nebula_image, MAX_ROCK
-
-    current_level += 1
-    level_filename = f"levels\level{current_level}.txt"
-    level_data = load_level(level_filename)
-
-    if level_data:
-        grid = Grid(WIDTH // 50, HEIGHT // 50, 50, wall_image, loot_image)  # Создаем новый Grid
-        generate_level(level_data, grid)
-        # Увеличиваем необходимые очки
-        score_to_next_level =  score_to_next_level * 2 + 25
-        MAX_ROCK += 1
-
-        # Меняем изображение фона (если есть)
-        if current_level - 1 < len(nebula_images) and nebula_images[current_level - 1]:
-            nebula_image = nebula_images[current_level - 1] # Update level image
-        else:
-            print(f"Нет изображения для уровня {current_level}, используем изображение по умолчанию")
-
-        print(f"Загружен уровень {current_level}")
-        return True
-    else:
-        print("Все уровни пройдены!")
-        return False
-
-
 def click(pos):
-    global started, score, lives, MAX_ROCK, my_ship, rock_group, missile_group, explosion_group, loot_collected
+    """Щелчок левой кнопкой: начало игры на заставке или новая цель корабля."""
     center = [WIDTH / 2, HEIGHT / 2]
     size = splash_info.get_size()
     inwidth = (center[0] - size[0] / 2) < pos[0] < (center[0] + size[0] / 2)
     inheight = (center[1] - size[1] / 2) < pos[1] < (center[1] + size[1] / 2)
-    if (not started) and inwidth and inheight:
-        started = True
-        score = 0
-        loot_collected = 0
-        lives = 3
-        my_ship = Ship([WIDTH / 2, HEIGHT / 2], [0, 0], 0, ship_image, ship_info, flight_image)
-        rock_group = set()
-        missile_group = set()
-        explosion_group = set()
-        soundtrack.play()
-    elif started:
-        # Устанавливаем цель для корабля при клике мышью
-        my_ship.set_target_position(pos)
-
-
-def start_game():
-    global started, score, lives, MAX_ROCK, my_ship, rock_group, missile_group, explosion_group, game_over, grid, loot_collected, current_level, score_to_next_level, nebula_images
-    started = True
-    game_over = False
-    score = 0
-    lives = 3
-    MAX_ROCK = 5
-    score_to_next_level = 50
-    loot_collected = 0
-
-    #Этот кусок кода нужен был, чтобы менять внешний вид котов - кораблей с каждым уровнем, этот функционал возможно, появится потом
-    #first_nebula_image = nebula_images[0] if len(nebula_images) > 0 and nebula_images[0] is not None else nebula_image
-    #nebula = Ship([WIDTH / 2, HEIGHT / 2], [0, 0], 0, nebula_image, ship_info)
-
-    my_ship = Ship([WIDTH / 2, HEIGHT / 2], [0, 0], 0, ship_image, ship_info)
-    rock_group = set()
-    missile_group = set()
-    explosion_group = set()
-    soundtrack.play(-1)
-    loot_collected = 0
-    current_level = 1
-
-    # load level
-    level_data = load_level("level1.txt")
-    if level_data:
-      grid = Grid(WIDTH // 50, HEIGHT // 50, 50, wall_image, loot_image)
-      generate_level(level_data, grid)
-
-def rock_spawner():
-    global rock_group, my_ship, started, MAX_ROCK, asteroid_info
-    if started and len(rock_group) < MAX_ROCK:
-        rock_pos = [random.randrange(0, WIDTH), random.randrange(0, HEIGHT)]
-        if dist(rock_pos, my_ship.get_position()) > 2 * asteroid_info.get_radius() + my_ship.get_radius():
-            rock_vel = [random.random() * .6 - .3, random.random() * .6 - .3]
-            rock_avel = random.random() * .2 - .1
-            rock = Sprite(rock_pos, rock_vel, 0, rock_avel, asteroid_image, asteroid_info)
-            rock_group.add(rock)
+    if (not world.started) and inwidth and inheight:
+        finish_loading()
+        world.commands.start()
+    elif world.started:
+        # Устанавливаем цель для корабля при клике мышью (экранные координаты -> мировые)
+        world.commands.target(renderer.camera.to_world(pos))
+
+
+def toggle_trace():
+    """Начинает или заканчивает запись трассы профайлера."""
+    if profiler.tracing:
+        count = profiler.stop_trace(TRACE_PATH)
+        print(f"Трасса сохранена: {TRACE_PATH} ({count} событий)")
+    else:
+        profiler.start_trace()
+
+
+def play_events(events):
+    """Проигрывает звуки для событий, которые сообщил мир."""
+    for event in events:
+        if event in ("music_start", "next_level"):
+            music.play_level(world.current_level)
+        elif event == "music_stop":
+            music.stop()
+        elif event == "thrust_off":
+            mixer.stop("thrust")
+        else:
+            mixer.play(SOUND_EVENTS.get(event, event))
+
 
 # --- Pygame Initialization --- #
 pygame.init()
@@ -179,15 +111,6 @@ def load_image(url):
         print(f"Ошибка загрузки изображения: {e}")
         return None
 
-#from local source
-def load_image_local(directory, filename):
-    try:
-        image = pygame.image.load(os.path.join(directory, filename))
-        return image.convert_alpha()
-    except Exception as e:
-        print(f"Ошибка загрузки изображения: {e}")
-        return None
-
 #from url
 def load_sound(url):
     try:
@@ -200,266 +123,178 @@ def load_sound(url):
         print(f"Ошибка загрузки музыки: {e}")
         return None
 
-#from local source
-def load_music_local(directory, filename):
-    try:
-        sound = pygame.mixer.Sound(os.path.join(directory, filename))
-        return sound
-    except Exception as e:
-        print(f"Ошибка загрузки музыки: {e}")
-
 # Load images
-wall_image = load_image_local("sprites", "туманность.png")
-wall_image = pygame.transform.scale(wall_image, (50, 50))
-loot_image = load_image_local("sprites", "лут.png")
-loot_image = pygame.transform.scale(loot_image, (50, 50))
-
-
-splash_image = load_image_local("screens", "Заставка 1.png")
-
-# Load images (moved here to be accessible before initialization)
-nebula_image = load_image_local("screens", "фон.png")
-nebula_image = pygame.transform.scale(nebula_image, (WIDTH, HEIGHT))
-# Load ship images for different levels
-nebula_images = [
-    load_image_local("screens", "фон.png"),
-    load_image_local("screens", "фон2.png"),
-    load_image_local("screens", "фон3.png")
-]
-
-# Scale the images
-nebula_images = [pygame.transform.scale(img, (WIDTH, HEIGHT)) if img else None for img in nebula_images]
-
-
-debris_image = load_image_local("screens", "debris_blend.png")
-ship_image = load_image_local("sprites", "кот1.png")
-ship_image = pygame.transform.scale(ship_image, (92, 92))
-flight_image = load_image_local("sprites", "кот2.png")
-flight_image = pygame.transform.scale(flight_image, (92, 92))
-missile_image = load_image_local("sprites", "снаряд.png")
-missile_image = pygame.transform.scale(flight_image, (20, 20))
-asteroid_image = load_image_local("sprites", "пончик.png")
-asteroid_image = pygame.transform.scale(asteroid_image, (90, 90))
-
-
-# instructions images
-instr_asteroid_image = load_image_local("sprites", "пончик.png")
-instr_asteroid_image = pygame.transform.scale(instr_asteroid_image, (40, 40))
-instr_wall_image = load_image_local("sprites", "туманность.png")
-instr_wall_image = pygame.transform.scale(instr_wall_image, (40, 40))
-instr_loot_image = load_image_local("sprites", "лут.png")
-instr_loot_image = pygame.transform.scale(instr_loot_image, (40, 40))
-
-
-game_over_image = load_image_local("screens", "game_over.jpg")  # Загружаем изображение Game Over
-
-exp_image1 = load_image_local("boom", "взрыв 2.1.png")
-exp_image1 = pygame.transform.scale(exp_image1, (90, 90))
-exp_image2 = load_image_local("boom", "взрыв 3.1.png")
-exp_image2 = pygame.transform.scale(exp_image2, (90, 90))
-exp_image3 = load_image_local("boom", "взрыв 4.1.png")
-exp_image3 = pygame.transform.scale(exp_image3, (90, 90))
-explosion_images = [
-    exp_image1,
-    exp_image2,
-    exp_image3
-]
+# Каждый вариант декодируется и масштабируется один раз, а затем берется из кэша
+assets = AssetManager()
+loader = AssetLoader()
 
-# Load sounds
-soundtrack = load_music_local('music', 'sound1.mp3')
-missile_sound = load_music_local('music', 'shoot.mp3')
-ship_thrust_sound = load_music_local('music', 'flight.mp3')
-explosion_sound = load_music_local('music', 'explosion_orange.mp3')
-loot_sound = load_music_local('music', 'loot.mp3')
+# Спрайты объектов лежат в одном атласе: один файл, читаемый через mmap
+# (при первом запуске или после изменения картинок атлас собирается заново)
+atlas = SpriteAtlas(ATLAS_DIR)
+if not atlas.ensure(ATLAS_SPRITES, assets):
+    print("Ошибка загрузки атласа спрайтов!")
+wall_image = atlas.get("wall")
+loot_image = atlas.get("loot")
+ship_image = atlas.get("ship")
+flight_image = atlas.get("flight")
+explosion_images = [atlas.get("explosion1"), atlas.get("explosion2"), atlas.get("explosion3")]
 
-if missile_sound:
-    missile_sound.set_volume(0.5)
+# Заставке нужны только эти изображения - загружаем их сразу
+splash_image = assets.image("screens", "Заставка 1.png")
+debris_image = assets.image("screens", "debris_blend.png")
 
-# --- Initialize Game Objects --- #
-debris_info = ImageInfo([320, 240], [640, 480])
-nebula_info = ImageInfo([400, 300], [800, 600])
-splash_info = ImageInfo([200, 150], [400, 300])
-ship_info = ImageInfo([45, 45], [90, 90], 35)
-missile_info = ImageInfo([5, 5], [10, 10], 3, 50)
-asteroid_info = ImageInfo([45, 45], [90, 90], 40)
-explosion_info = ImageInfo([64, 64], [128, 128], 17, 24, True)
-
-my_ship = Ship([WIDTH / 2, HEIGHT / 2], [0, 0], 0, ship_image, ship_info, flight_image)
-rock_group = set()
-missile_group = set()
-explosion_group = set()
-
-# create grid
-grid = Grid(WIDTH // 50, HEIGHT // 50, 50, wall_image, loot_image)
-
-
-def load_level(filename):
-    """Загружает уровень из файла."""
-    level_data = []
-    try:
-        with open(filename, 'r') as file:
-            for line in file:
-                level_data.append(line.strip())  # Удаляем лишние пробелы и переносы строк
-    except FileNotFoundError:
-        print(f"Ошибка: Файл уровня '{filename}' не найден.")
-        return None  # Или можно создать уровень по умолчанию
-    return level_data
+# Load ship images for different levels (фоны 2 и 3 догружаются в фоне)
+nebula_images = [assets.image("screens", "фон.png", (WIDTH, HEIGHT)), None, None]
 
 
-def generate_level(level_data, grid):
-    try:
-        for row_index, row in enumerate(level_data):
-            for col_index, cell in enumerate(row):
-                if cell == '#':
-                    grid.add_obstacle(row_index, col_index)
-                elif cell == '@':
-                    grid.grid[row_index][col_index] = '@'  # Place Loot
-    except Exception as e:
-        print(f"Ошибка при создании уровня: {e}")
+# Все остальное догружается в рабочем потоке, пока показывается заставка
+def load_image_in_background(name, directory, filename, size=None):
+    loader.submit(name, assets.image, directory, filename, size, True, False,
+                  finalize=AssetManager.convert_surface)
+
+
+load_image_in_background("nebula2", "screens", "фон2.png", (WIDTH, HEIGHT))
+load_image_in_background("nebula3", "screens", "фон3.png", (WIDTH, HEIGHT))
+load_image_in_background("game_over", "screens", "game_over.jpg")  # Загружаем изображение Game Over
+
+# Load sounds
+# Музыка проигрывается потоково и не декодируется заранее, короткие эффекты - из кэша
+music = MusicPlayer(MUSIC_DIR, LEVEL_MUSIC)
+sfx = SoundCache(MUSIC_DIR)
+loader.submit("sfx_shoot", sfx.load, "shoot", "shoot.mp3", 0.5)
+loader.submit("sfx_thrust", sfx.load, "thrust", "flight.mp3")
+loader.submit("sfx_explosion", sfx.load, "explosion", "explosion_orange.mp3")
+loader.submit("sfx_loot", sfx.load, "loot", "loot.mp3")
+mixer = SfxMixer(sfx, SFX_CHANNELS, SFX_RULES)
+
+# Кэш повернутых кадров для камней, ракет и корабля
+rotation_cache.configure(ROTATION_RESOLUTION, ROTATION_CACHE_BYTES)
+
+# Горячие места, которые замеряет профайлер (обертки ставятся, только пока он включен)
+for owner, method in [
+    (World, "rock_spawner"), (World, "process_sprite_group"), (Ship, "update"),
+    (World, "resolve_collisions"), (SpatialHash, "sync"), (SpatialHash, "query"), (SpatialHash, "pairs"),
+    (EntityStore, "query"), (EntityStore, "pairs"), (Grid, "blit_items"),
+    (Renderer, "draw_list"), (Renderer, "submit"),
+]:
+    profiler.hook(owner, method)
+
+
+def on_asset_loaded(name, value):
+    """Подставляет догруженный в фоне ресурс туда, где его ждут мир, отрисовщик и звуки."""
+    if name.startswith("nebula"):
+        nebula_images[int(name[-1]) - 1] = value
+    elif name == "game_over":
+        renderer.images[name] = value
+    # Эффекты (sfx_*) уже лежат в кэше sfx, подставлять их никуда не нужно
+
+
+def apply_loaded(loaded):
+    """Подставляет готовые ресурсы и сообщает, когда загрузка закончилась."""
+    for name, value in loaded:
+        on_asset_loaded(name, value)
+    if loaded and not loader.futures:
+        print(f"Все ресурсы загружены за {(time.perf_counter() - START_TIME) * 1000:.0f} мс")
+
+
+def finish_loading():
+    """Дожидается всех фоновых загрузок (игре нужны звуки)."""
+    apply_loaded(loader.wait_all())
 
-# Load the level
-level_data = load_level("levels\level1.txt") # директория файла
-if level_data:
-    generate_level(level_data, grid)
+
+# --- Initialize Game Objects --- #
+world = World(WIDTH, HEIGHT, {
+    "ship": ship_image,
+    "flight": flight_image,
+    "missile": atlas.get("missile"),
+    "asteroid": atlas.get("asteroid"),
+    "explosion": explosion_images,
+    "wall": wall_image,
+    "loot": loot_image,
+})
+if RECORD_PATH:
+    world.start_recording()
+renderer = Renderer(screen, {
+    "nebula": nebula_images,
+    "debris": debris_image,
+    "splash": splash_image,
+    "instr_asteroid": atlas.get("instr_asteroid"),
+    "instr_wall": atlas.get("instr_wall"),
+    "instr_loot": atlas.get("instr_loot"),
+}, DIRTY_RECTS, SORT_BLITS)
+renderer.overlay = ProfilerOverlay(profiler, text_renderer=renderer.text)
 
 
 # --- Game Loop --- #
 running = True
+accumulator = 0.0
+first_frame = True
 while running:
+    # Симуляция идет фиксированными шагами независимо от частоты кадров
+    accumulator += clock.tick(FPS)  # Limit frame rate to 60 FPS
+    profiler.begin_frame()  # Кадр профайлера - работа без ожидания clock.tick
+
     # --- Event Handling --- #
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:  # Левая кнопка мыши
-                click(event.pos)
-                my_ship.set_thrust(True, started, ship_thrust_sound)
-            elif event.button == 3 and not started and not game_over:  # Правая кнопка мыши
-                show_instructions = True
-        elif event.type == pygame.MOUSEBUTTONUP:
-            if event.button == 3:  # Правая кнопка мыши отпущена
-                show_instructions = False
-            elif event.button == 1:  # Правая кнопка мыши отпущена
-                my_ship.set_thrust(False,started, ship_thrust_sound)  # Выключаем звук тяги
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE:
-                my_ship.shoot(missile_group, started, missile_image, missile_info, missile_sound, ship_info)
-        elif event.type == pygame.KEYUP:
-            if event.key == pygame.K_SPACE:
-                my_ship.reset_image(ship_info)  # Возвращаем исходное изображение корабля
+    # Ввод только складывает команды в очередь мира; выполняются они в начале следующего шага
+    with profiler.scope("events"):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1:  # Левая кнопка мыши
+                    click(event.pos)
+                    world.commands.thrust(True)
+                elif event.button == 3 and not world.started and not world.game_over:  # Правая кнопка мыши
+                    show_instructions = True
+            elif event.type == pygame.MOUSEBUTTONUP:
+                if event.button == 3:  # Правая кнопка мыши отпущена
+                    show_instructions = False
+                elif event.button == 1:  # Правая кнопка мыши отпущена
+                    world.commands.thrust(False)  # Выключаем звук тяги
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    world.commands.shoot()
+                elif event.key == PROFILER_KEY:
+                    profiler.toggle()
+                elif event.key == TRACE_KEY:
+                    toggle_trace()
+            elif event.type == pygame.KEYUP:
+                if event.key == pygame.K_SPACE:
+                    world.commands.stop_shooting()  # Возвращаем исходное изображение корабля
 
     # --- Game Logic --- #
-    if started:
-        rock_spawner()
-
-        # Проверка условия перехода на следующий уровень
-        if score >= score_to_next_level and grid.get_loot_count() == 0:
-            if next_level():
-                # Переход на следующий уровень успешен
-                continue
-            else:
-                # Все уровни пройдены
-                started = False
-                levels_up = True
+    with profiler.scope("simulation"):
+        steps = 0
+        while accumulator >= TICK_MS and steps < MAX_STEPS_PER_FRAME:
+            world.step()
+            accumulator -= TICK_MS
+            steps += 1
+        if steps == MAX_STEPS_PER_FRAME:
+            accumulator = min(accumulator, TICK_MS)  # Не пытаемся догнать слишком большое отставание
+    play_events(world.drain_events())
 
     # --- Draw --- #
-    screen.blit(nebula_image, (0, 0))
-    time_value = (time / 4) % WIDTH
-    screen.blit(debris_image, (time_value - WIDTH / 2, 0))
-    screen.blit(debris_image, (time_value + WIDTH / 2, 0))
-    process_sprite_group(rock_group, screen)
-    process_sprite_group(missile_group, screen)
-    process_sprite_group(explosion_group, screen)
-    loot_collected = my_ship.update(started, grid, loot_collected, loot_sound, WIDTH, HEIGHT)
-    my_ship.draw(screen)
-    grid.draw(screen)
-
-    # draw UI
-    font = pygame.font.Font(None, 38)
-    lives_text = font.render(f"Lives: {lives}", True, (255, 255, 255))
-    score_text = font.render(f"Score: {score}", True, (255, 255, 255))
-    loot_text = font.render(f"Loot: {loot_collected}", True, (255, 255, 255))
-    screen.blit(lives_text, (50, 50))
-    screen.blit(score_text, (680, 50))
-    screen.blit(loot_text, (350, 50))
-
-    # update lives
-    if group_collide(rock_group, my_ship):
-        lives -= 1
-
-    # update score
-    score += group_group_collide(rock_group, missile_group)
-
-    # update loot
-    loot_collected += group_group_collide(rock_group, missile_group)
-
-    # Game Over
-    if lives <= 0:
-        game_over = True  # Устанавливаем флаг Game Over
-        started = False
-        soundtrack.stop()
-        my_ship = Ship([WIDTH / 2, HEIGHT / 2], [0, 0], 0, ship_image, ship_info, flight_image)
-        rock_group = set()
-        missile_group = set()
-        explosion_group = set()
-        grid = Grid(WIDTH // 50, HEIGHT // 50, 50, wall_image, loot_image)  # Создаем новый объект Grid
-        level_data = load_level("levels\level1.txt")  # Загружаем данные первого уровня
-        if level_data:
-            generate_level(level_data, grid)  # Генерируем уровень заново
-        else:
-            print("Ошибка загрузки первого уровня!")
-    if not started:
-        if game_over:
-            screen.blit(game_over_image, (0, 0))  # Отображаем экран Game Over
-            if levels_up == True:
-                final_level_text = font.render(f"Вы прошли все уровни!", True, (255, 255, 255))
-                level_rect = final_level_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 200))
-                screen.blit(final_level_text, level_rect)
-            # Отображаем счет на экране Game Over
-            final_score_text = font.render(f"Score: {score}", True, (255, 255, 255))
-            final_loot_text = font.render(f"Loot: {loot_collected}", True, (255, 255, 255))
-            score_rect = final_score_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 150))
-            loot_rect = final_loot_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 100))
-            screen.blit(final_score_text, score_rect)
-            screen.blit(final_loot_text, loot_rect)
-        else:
-            screen.blit(splash_image, (50, 50))
-            time_value = (time / 4) % WIDTH
-            screen.blit(debris_image, (time_value - WIDTH / 2, 0))
-            screen.blit(debris_image, (time_value + WIDTH / 2, 0))
-
-            # Draw instructions
-            if show_instructions:
-                instruction_font = pygame.font.Font(None, 24)
-                line_spacing = 30
-                text_color = (255, 255, 255)
-                x_offset = 50
-                y_start = 220
-
-                instruction_texts = [
-                    "1. Стрелять пробелом",
-                    "2. Двигаться : щелчек левой кнопкой мыши",
-                    "3. Собирайте лут:",
-                    "4. Избегайте стен:",
-                    "5. Разрушайте пончики:"
-                ]
-
-                for i, text in enumerate(instruction_texts):
-                    text_surface = instruction_font.render(text, True, text_color)
-                    screen.blit(text_surface, (x_offset, y_start + i * line_spacing))
-
-                # Blit images for loot and wall
-                screen.blit(instr_loot_image,
-                            (x_offset + 150, y_start + 2 * line_spacing - 10))  # Сдвиг -10 для выравнивания
-                screen.blit(instr_wall_image, (x_offset + 150, y_start + 3 * line_spacing - 5))
-                # Blit image for asteroid
-                screen.blit(instr_asteroid_image,
-                            (x_offset + 190, y_start + 4 * line_spacing - 15))  # Уменьшаем сдвиг
+    with profiler.scope("draw"):
+        renderer.draw(world, accumulator / TICK_MS, show_instructions)
 
     # --- Update Display --- #
-    pygame.display.flip()
-    time += 1
-    clock.tick(60)  # Limit frame rate to 60 FPS
+    with profiler.scope("display.flip"):
+        renderer.present()
+    if first_frame:
+        first_frame = False
+        print(f"Время до первого кадра: {(time.perf_counter() - START_TIME) * 1000:.0f} мс")
+        if WARM_UP_ROTATIONS:
+            rotation_cache.warm_up([ship_image, flight_image, world.images["missile"], world.images["asteroid"]])
+    if loader.futures:
+        apply_loaded(loader.poll())
+    if profiler.enabled:
+        profiler.end_frame(rocks=len(world.rock_group), missiles=len(world.missile_group),
+                           explosions=len(world.explosion_group))
 
 # --- Quit Pygame --- #
-pygame.quit()
\ No newline at end of file
+if profiler.tracing:
+    toggle_trace()
+if world.recorder is not None:
+    world.recorder.save(RECORD_PATH, world.time)
+loader.shutdown()
+pygame.quit()
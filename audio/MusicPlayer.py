@@ -0,0 +1,85 @@
+import os
+
+import pygame
+
+
+class MusicPlayer:
+    """
+    Потоковое воспроизведение музыки через pygame.mixer.music.
+    Трек декодируется небольшими порциями во время игры, а не целиком
+    в память, как pygame.mixer.Sound. Для каждого уровня свой трек.
+    """
+    def __init__(self, directory, level_tracks, volume=1.0):
+        """
+        Инициализация.
+        Args:
+            directory: Папка с музыкой.
+            level_tracks: Список имен файлов треков по уровням (начиная с первого).
+            volume: Громкость музыки (0..1).
+        """
+        self.directory = directory
+        self.level_tracks = list(level_tracks)
+        self.volume = volume
+        self.current = None  # имя файла играющего трека
+
+    @staticmethod
+    def available():
+        """
+        Проверяет, инициализирован ли микшер.
+        Returns:
+            True, если музыку можно проигрывать.
+        """
+        return pygame.mixer.get_init() is not None
+
+    def track_for_level(self, level):
+        """
+        Возвращает трек уровня (треки повторяются по кругу, если уровней больше).
+        Args:
+            level: Номер уровня (начиная с 1).
+        Returns:
+            Имя файла трека.
+        """
+        return self.level_tracks[(level - 1) % len(self.level_tracks)]
+
+    def play(self, filename, loops=-1, fade_ms=0):
+        """
+        Начинает потоковое воспроизведение трека (тот же трек не перезапускается).
+        Args:
+            filename: Имя файла в папке музыки.
+            loops: Количество повторов (-1 - бесконечно).
+            fade_ms: Длительность плавного появления в миллисекундах.
+        """
+        if not self.available():
+            return
+        if filename == self.current and pygame.mixer.music.get_busy():
+            return
+        try:
+            pygame.mixer.music.load(os.path.join(self.directory, filename))
+            pygame.mixer.music.set_volume(self.volume)
+            pygame.mixer.music.play(loops, fade_ms=fade_ms)
+            self.current = filename
+        except pygame.error as e:
+            print(f"Ошибка загрузки музыки: {e}")
+
+    def play_level(self, level, fade_ms=500):
+        """
+        Включает трек уровня.
+        Args:
+            level: Номер уровня (начиная с 1).
+            fade_ms: Длительность плавного появления в миллисекундах.
+        """
+        self.play(self.track_for_level(level), fade_ms=fade_ms)
+
+    def stop(self, fade_ms=0):
+        """
+        Останавливает музыку.
+        Args:
+            fade_ms: Длительность плавного затухания в миллисекундах (0 - сразу).
+        """
+        if not self.available():
+            return
+        if fade_ms:
+            pygame.mixer.music.fadeout(fade_ms)
+        else:
+            pygame.mixer.music.stop()
+        self.current = None
@@ -0,0 +1,132 @@
+import pygame
+
+
+class SfxMixer:
+    """
+    Слой над каналами микшера для коротких эффектов.
+    У каждого эффекта есть предел одновременных голосов, окно склейки
+    (повторные запросы того же звука в течение N мс игнорируются) и приоритет:
+    если свободных каналов нет, звук с более высоким приоритетом забирает канал
+    у самого старого звука с меньшим приоритетом.
+    """
+    def __init__(self, cache, channels=16, rules=None, clock=pygame.time.get_ticks):
+        """
+        Инициализация.
+        Args:
+            cache: Кэш эффектов SoundCache.
+            channels: Количество каналов микшера для эффектов.
+            rules: Словарь имя -> (max_voices, cooldown_ms, priority) (необязательно).
+            clock: Функция текущего времени в миллисекундах.
+        """
+        self.cache = cache
+        self.channels = channels
+        self.clock = clock
+        self.rules = {}
+        for name, (max_voices, cooldown_ms, priority) in (rules or {}).items():
+            self.configure(name, max_voices, cooldown_ms, priority)
+        self.voices = {}  # номер канала -> (имя, приоритет, время запуска)
+        self.last_played = {}  # имя -> время последнего запуска
+        self.played = 0
+        self.coalesced = 0
+        self.stolen = 0
+        self.dropped = 0
+        if pygame.mixer.get_init():
+            pygame.mixer.set_num_channels(channels)
+
+    def configure(self, name, max_voices=4, cooldown_ms=0, priority=0):
+        """
+        Задает правила для эффекта.
+        Args:
+            name: Имя эффекта.
+            max_voices: Максимум одновременно звучащих копий.
+            cooldown_ms: Окно склейки повторных запросов в миллисекундах.
+            priority: Приоритет при нехватке каналов (больше - важнее).
+        """
+        self.rules[name] = (max_voices, cooldown_ms, priority)
+
+    def _active(self):
+        """
+        Убирает из учета закончившиеся голоса.
+        Returns:
+            Словарь звучащих голосов номер канала -> (имя, приоритет, время запуска).
+        """
+        for index in [i for i in self.voices if not pygame.mixer.Channel(i).get_busy()]:
+            del self.voices[index]
+        return self.voices
+
+    def _pick_channel(self, name, max_voices, priority):
+        """
+        Выбирает канал для нового голоса.
+        Args:
+            name: Имя эффекта.
+            max_voices: Предел голосов эффекта.
+            priority: Приоритет эффекта.
+        Returns:
+            Номер канала или None, если звук нужно пропустить.
+        """
+        voices = self._active()
+        own = [(started, index) for index, (n, _, started) in voices.items() if n == name]
+        if len(own) >= max_voices:
+            # Предел голосов: перезапускаем самую старую копию этого же звука
+            return min(own)[1]
+        for index in range(self.channels):
+            if index not in voices and not pygame.mixer.Channel(index).get_busy():
+                return index
+        victims = [(p, started, index) for index, (_, p, started) in voices.items() if p < priority]
+        if victims:
+            self.stolen += 1
+            return min(victims)[2]  # самый неважный, а среди равных - самый старый
+        return None
+
+    def play(self, name):
+        """
+        Проигрывает эффект с учетом правил.
+        Args:
+            name: Имя эффекта.
+        Returns:
+            Объект pygame.mixer.Channel или None, если звук склеен или пропущен.
+        """
+        sound = self.cache.get(name)
+        if sound is None or not pygame.mixer.get_init():
+            return None
+        max_voices, cooldown_ms, priority = self.rules.get(name, (4, 0, 0))
+        now = self.clock()
+        last = self.last_played.get(name)
+        if last is not None and now - last < cooldown_ms:
+            self.coalesced += 1
+            return None
+        index = self._pick_channel(name, max_voices, priority)
+        if index is None:
+            self.dropped += 1
+            return None
+        channel = pygame.mixer.Channel(index)
+        channel.play(sound)
+        self.voices[index] = (name, priority, now)
+        self.last_played[name] = now
+        self.played += 1
+        return channel
+
+    def stop(self, name):
+        """
+        Останавливает все голоса эффекта.
+        Args:
+            name: Имя эффекта.
+        """
+        for index, (n, _, _) in list(self.voices.items()):
+            if n == name:
+                pygame.mixer.Channel(index).stop()
+                del self.voices[index]
+
+    def stats(self):
+        """
+        Возвращает статистику микшера.
+        Returns:
+            Словарь с ключами "played", "coalesced", "stolen", "dropped", "voices".
+        """
+        return {
+            "played": self.played,
+            "coalesced": self.coalesced,
+            "stolen": self.stolen,
+            "dropped": self.dropped,
+            "voices": len(self._active()),
+        }
@@ -0,0 +1,89 @@
+import os
+import threading
+
+import pygame
+
+
+class SoundCache:
+    """
+    Небольшой кэш коротких звуковых эффектов, заранее декодированных в память.
+    Длинные треки сюда не кладутся - для них есть потоковый MusicPlayer.
+    """
+    def __init__(self, directory, max_seconds=15):
+        """
+        Инициализация.
+        Args:
+            directory: Папка со звуками.
+            max_seconds: Предельная длительность эффекта; более длинные звуки
+                загружаются с предупреждением, так как им место в MusicPlayer.
+        """
+        self.directory = directory
+        self.max_seconds = max_seconds
+        self.sounds = {}  # имя -> pygame.mixer.Sound
+        self.lock = threading.Lock()  # эффекты могут загружаться из фонового потока
+
+    def load(self, name, filename, volume=None):
+        """
+        Декодирует эффект и кладет его в кэш.
+        Args:
+            name: Имя эффекта.
+            filename: Имя файла в папке звуков.
+            volume: Громкость эффекта (необязательно).
+        Returns:
+            Объект pygame.mixer.Sound или None при ошибке загрузки.
+        """
+        try:
+            sound = pygame.mixer.Sound(os.path.join(self.directory, filename))
+        except Exception as e:
+            print(f"Ошибка загрузки музыки: {e}")
+            return None
+        if sound.get_length() > self.max_seconds:
+            print(f"Звук '{filename}' длиннее {self.max_seconds} с - лучше проигрывать его через MusicPlayer")
+        if volume is not None:
+            sound.set_volume(volume)
+        with self.lock:
+            self.sounds[name] = sound
+        return sound
+
+    def get(self, name):
+        """
+        Возвращает эффект из кэша.
+        Args:
+            name: Имя эффекта.
+        Returns:
+            Объект pygame.mixer.Sound или None, если эффект еще не загружен.
+        """
+        return self.sounds.get(name)
+
+    def play(self, name):
+        """
+        Проигрывает эффект, если он загружен.
+        Args:
+            name: Имя эффекта.
+        """
+        sound = self.sounds.get(name)
+        if sound:
+            sound.play()
+
+    def stop(self, name):
+        """
+        Останавливает эффект, если он загружен.
+        Args:
+            name: Имя эффекта.
+        """
+        sound = self.sounds.get(name)
+        if sound:
+            sound.stop()
+
+    def memory_bytes(self):
+        """
+        Оценивает объем памяти, занятой декодированными эффектами.
+        Returns:
+            Объем в байтах (int).
+        """
+        init = pygame.mixer.get_init()
+        if not init:
+            return 0
+        frequency, size, channels = init
+        bytes_per_second = frequency * (abs(size) // 8) * channels
+        return int(sum(sound.get_length() for sound in self.sounds.values()) * bytes_per_second)
@@ -0,0 +1,134 @@
+import math
+import time
+
+
+def percentile(values, fraction):
+    """
+    Возвращает перцентиль выборки (ближайший ранг).
+    Args:
+        values: Отсортированный список чисел.
+        fraction: Доля от 0 до 1 (0.5 - медиана).
+    Returns:
+        Значение перцентиля (0.0 для пустой выборки).
+    """
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, math.ceil(fraction * len(values)) - 1))
+    return values[index]
+
+
+def summarize(samples):
+    """
+    Сводка по времени кадров или подсистемы.
+    Args:
+        samples: Список времен в миллисекундах.
+    Returns:
+        Словарь с ключами "total", "mean", "p50", "p90", "p99", "max" (мс).
+    """
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        "total": round(total, 3),
+        "mean": round(total / len(ordered), 4) if ordered else 0.0,
+        "p50": round(percentile(ordered, 0.50), 4),
+        "p90": round(percentile(ordered, 0.90), 4),
+        "p99": round(percentile(ordered, 0.99), 4),
+        "max": round(ordered[-1], 4) if ordered else 0.0,
+    }
+
+
+class Benchmark:
+    """
+    Замер одного сценария: время каждого кадра (шаг мира + отрисовка)
+    и время подсистем внутри кадра. Подсистемы измеряются обертками над
+    методами конкретных объектов (мира, отрисовщика, сетки), так что
+    игровой код для замеров менять не нужно. У объектов со слотами (корабль)
+    метод экземпляра не подменить, поэтому оборачивается метод их класса,
+    который close восстанавливает.
+    """
+    def __init__(self, name):
+        """
+        Инициализация.
+        Args:
+            name: Имя сценария.
+        """
+        self.name = name
+        self.frames = []  # время кадров, мс
+        self.subsystems = {}  # подсистема -> список времен по кадрам, мс
+        self.current = {}  # подсистема -> время в текущем кадре, с
+        self.wrapped = {}  # (id объекта, имя метода) -> объект, чтобы не оборачивать дважды
+        self.patched = []  # (класс, имя метода, исходный атрибут класса или None) для close
+        self.frame_start = 0.0
+
+    def wrap(self, obj, method_name, subsystem):
+        """
+        Подменяет метод объекта оберткой, которая копит время в подсистему.
+        Args:
+            obj: Объект (подмена действует только на него, не на класс;
+                для объекта со слотами - на его класс до вызова close).
+            method_name: Имя метода.
+            subsystem: Имя подсистемы в отчете.
+        """
+        if not hasattr(obj, "__dict__"):
+            obj = type(obj)
+        key = (id(obj), method_name)
+        if self.wrapped.get(key) is obj:
+            return
+        original = getattr(obj, method_name)
+        current = self.current
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                current[subsystem] = current.get(subsystem, 0.0) + perf_counter() - start
+
+        if isinstance(obj, type):
+            self.patched.append((obj, method_name, obj.__dict__.get(method_name)))
+        setattr(obj, method_name, timed)
+        self.wrapped[key] = obj
+        self.subsystems.setdefault(subsystem, [])
+
+    def close(self):
+        """Восстанавливает методы классов, обернутые для объектов со слотами."""
+        for cls, method_name, original in reversed(self.patched):
+            if original is None:
+                delattr(cls, method_name)  # метод был унаследован
+            else:
+                setattr(cls, method_name, original)
+        self.patched.clear()
+        self.wrapped.clear()
+
+    def begin_frame(self):
+        """Начинает замер кадра."""
+        self.current.clear()
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self, record=True):
+        """
+        Заканчивает замер кадра.
+        Args:
+            record: Сохранять ли результаты (False для кадров прогрева).
+        """
+        elapsed = time.perf_counter() - self.frame_start
+        if not record:
+            return
+        self.frames.append(elapsed * 1000)
+        for subsystem, samples in self.subsystems.items():
+            samples.append(self.current.get(subsystem, 0.0) * 1000)
+
+    def report(self):
+        """
+        Возвращает результаты в виде, пригодном для JSON.
+        Returns:
+            Словарь с ключами "frames", "frame_ms", "fps", "subsystems_ms".
+        """
+        frame_ms = summarize(self.frames)
+        return {
+            "frames": len(self.frames),
+            "frame_ms": frame_ms,
+            "fps": round(1000 / frame_ms["mean"], 1) if frame_ms["mean"] else 0.0,
+            "subsystems_ms": {name: summarize(samples) for name, samples in sorted(self.subsystems.items())},
+        }
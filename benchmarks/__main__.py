@@ -0,0 +1,217 @@
+"""
+    Бенчмарки игры без окна.
+    Каждый сценарий прогоняет мир с фиксированным зерном и скриптом команд,
+    отрисовывая каждый шаг, и сообщает время кадров (перцентили) и время
+    подсистем в JSON. Отпечаток состояния мира в конце прогона показывает,
+    не изменилась ли игра, так что результаты разных коммитов сравнимы.
+
+    python -m benchmarks [--scenario rocks_500 ...] [--frames 600] [--backend numpy]
+                         [--dirty-rects] [--sort-blits] [--output result.json] [--compare old.json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.Benchmark import Benchmark
+from benchmarks.scenarios import SCENARIOS
+from engine import settings
+from engine.InputLog import InputLog
+from engine.World import World
+from environment.LevelCompiler import level_cache
+from render.Renderer import Renderer
+from utils.AssetManager import AssetManager
+from utils.RotationCache import rotation_cache
+from utils.SpriteAtlas import SpriteAtlas
+
+SEED = 20240601
+
+
+def load_images(assets):
+    """
+    Загружает изображения так же, как игра.
+    Args:
+        assets: Объект AssetManager.
+    Returns:
+        Кортеж (изображения мира, изображения экрана).
+    """
+    size = (settings.WIDTH, settings.HEIGHT)
+    atlas = SpriteAtlas(settings.ATLAS_DIR)
+    atlas.ensure(settings.ATLAS_SPRITES, assets)
+    world_images = {name: atlas.get(name) for name in ("ship", "flight", "missile", "asteroid", "wall", "loot")}
+    world_images["explosion"] = [atlas.get(f"explosion{n}") for n in (1, 2, 3)]
+    screen_images = {
+        "nebula": [assets.image("screens", name, size) for name in ("фон.png", "фон2.png", "фон3.png")],
+        "debris": assets.image("screens", "debris_blend.png"),
+        "splash": assets.image("screens", "Заставка 1.png"),
+    }
+    return world_images, screen_images
+
+
+def instrument(bench, world, renderer):
+    """
+    Оборачивает подсистемы для замера (повторно - только новые объекты,
+    например сетку после смены уровня или корабль после рестарта).
+    Args:
+        bench: Объект Benchmark.
+        world: Объект World.
+        renderer: Объект Renderer.
+    """
+    bench.wrap(world, "process_sprite_group", "update")
+    bench.wrap(world.ship, "update", "update_ship")
+    bench.wrap(world, "resolve_collisions", "collisions")
+    bench.wrap(renderer.background, "draw", "draw_background")
+    bench.wrap(renderer, "draw_list", "draw_list")
+    bench.wrap(world.grid, "blit_items", "grid_list")
+    bench.wrap(renderer, "submit", "blits")
+    for counter, _ in renderer.hud:
+        bench.wrap(counter, "draw", "draw_hud")
+    bench.wrap(renderer, "present", "present")
+
+
+def run_scenario(name, screen, world_images, screen_images, frames, warmup, backend, dirty_rects,
+                 sort_blits=False):
+    """
+    Прогоняет один сценарий.
+    Args:
+        name: Имя сценария из SCENARIOS.
+        screen: Поверхность дисплея.
+        world_images: Изображения мира.
+        screen_images: Изображения экрана.
+        frames: Число измеряемых кадров.
+        warmup: Число кадров прогрева (не учитываются).
+        backend: Хранилище сущностей мира.
+        dirty_rects: Режим грязных прямоугольников отрисовщика.
+        sort_blits: Группировать ли объекты по изображению перед выводом.
+    Returns:
+        Словарь с результатами.
+    """
+    setup, level = SCENARIOS[name]
+    levels_dir = settings.LEVELS_DIR
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if level is not None:
+            with open(os.path.join(temp_dir, "level1.txt"), "w") as file:
+                file.write("\n".join(level) + "\n")
+            settings.LEVELS_DIR = temp_dir
+        try:
+            world = World(settings.WIDTH, settings.HEIGHT, world_images, backend, seed=SEED)
+        finally:
+            settings.LEVELS_DIR = levels_dir
+    rotation_cache.clear()  # каждый сценарий начинает с пустого кэша поворотов
+    renderer = Renderer(screen, screen_images, dirty_rects, sort_blits)
+    drive = setup(world, random.Random(SEED))
+    bench = Benchmark(name)
+    try:
+        for frame in range(warmup + frames):
+            instrument(bench, world, renderer)
+            bench.begin_frame()
+            drive(frame)
+            world.step()
+            renderer.draw(world, 1.0)
+            renderer.present()
+            world.drain_events()
+            bench.end_frame(record=frame >= warmup)
+    finally:
+        bench.close()
+    result = bench.report()
+    result.update({
+        "digest": InputLog.digest(world),
+        "ticks": world.time,
+        "rocks": len(world.rock_group),
+        "missiles": len(world.missile_group),
+        "explosions": len(world.explosion_group),
+        "score": world.score,
+    })
+    return result
+
+
+def git_revision():
+    """Возвращает короткий хеш текущего коммита или None."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(old, new):
+    """
+    Печатает сравнение с предыдущим прогоном.
+    Args:
+        old: Результаты предыдущего прогона (словарь из JSON).
+        new: Результаты текущего прогона.
+    """
+    print(f"{'сценарий':<18} {'было мс':>9} {'стало мс':>9} {'изм.':>8}  p99 было/стало")
+    for name, result in new["scenarios"].items():
+        before = old["scenarios"].get(name)
+        if before is None:
+            continue
+        was, now = before["frame_ms"]["mean"], result["frame_ms"]["mean"]
+        change = (now - was) / was * 100 if was else 0.0
+        note = "" if before["digest"] == result["digest"] else "  (игра изменилась: другой отпечаток)"
+        print(f"{name:<18} {was:>9.3f} {now:>9.3f} {change:>+7.1f}%  "
+              f"{before['frame_ms']['p99']:.3f}/{result['frame_ms']['p99']:.3f}{note}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Бенчмарки игры без окна")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="сценарий (можно несколько; по умолчанию все)")
+    parser.add_argument("--frames", type=int, default=600, help="измеряемых кадров на сценарий")
+    parser.add_argument("--warmup", type=int, default=60, help="кадров прогрева")
+    parser.add_argument("--backend", choices=("python", "numpy"), default="python")
+    parser.add_argument("--dirty-rects", action="store_true", help="режим грязных прямоугольников")
+    parser.add_argument("--sort-blits", action="store_true", help="группировать объекты по изображению")
+    parser.add_argument("--output", help="файл для JSON (по умолчанию - стандартный вывод)")
+    parser.add_argument("--compare", help="JSON предыдущего прогона для сравнения")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    screen = pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
+    world_images, screen_images = load_images(AssetManager())
+    level_cache.cache_dir = None  # уровни сценариев временные, на диск их не кэшируем
+
+    results = {
+        "meta": {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "backend": args.backend,
+            "dirty_rects": args.dirty_rects,
+            "sort_blits": args.sort_blits,
+            "frames": args.frames,
+            "warmup": args.warmup,
+            "seed": SEED,
+        },
+        "scenarios": {},
+    }
+    for name in args.scenario or SCENARIOS:
+        results["scenarios"][name] = run_scenario(name, screen, world_images, screen_images, args.frames,
+                                                  args.warmup, args.backend, args.dirty_rects,
+                                                  args.sort_blits)
+        print(f"{name}: {results['scenarios'][name]['frame_ms']['mean']:.3f} мс/кадр", file=sys.stderr)
+    pygame.quit()
+
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            compare(json.load(file), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+    Отчет о памяти сущностей.
+    Для каждого типа объектов показывает размер одного экземпляра, а для
+    роя из заданного числа объектов - сколько байт уходит на одну сущность
+    (вместе с группой) и сколько всего занимает куча Python с этим роем.
+    Так можно проверить, укладываются ли уровни с большими роями в бюджет.
+
+    python -m benchmarks.memory [--count 10000 ...] [--backend numpy]
+                                [--budget-mb 64] [--output memory.json]
+"""
+import tracemalloc
+
+tracemalloc.start()  # до импорта игры, чтобы в отчет попала вся куча Python
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from engine import settings
+from entities.EntityStore import EntityStore
+from entities.Ship import Ship
+from entities.Sprite import Sprite
+from entities.SpriteGroup import SpriteGroup
+
+SEED = 20240601
+COUNTS = (1000, 10000, 100000)
+
+
+def make_rock(rng, width, height):
+    """Камень с теми же случайными параметрами, что дает World.rock_spawner."""
+    return Sprite([rng.randrange(0, width), rng.randrange(0, height)],
+                  [rng.random() * .6 - .3, rng.random() * .6 - .3], 0, rng.random() * .2 - .1,
+                  None, settings.asteroid_info)
+
+
+def make_missile(rng, width, height):
+    """Ракета в случайной точке поля со скоростью выстрела."""
+    angle = rng.random() * 6.283
+    return Sprite([rng.randrange(0, width), rng.randrange(0, height)],
+                  [6 * rng.random(), 6 * rng.random()], angle, 0, None, settings.missile_info)
+
+
+KINDS = {
+    "rock": make_rock,
+    "missile": make_missile,
+}
+
+
+def instance_info(obj):
+    """
+    Размер одного объекта без того, на что он ссылается.
+    Args:
+        obj: Объект сущности.
+    Returns:
+        Словарь с ключами "bytes" (объект и словарь экземпляра, если он есть) и "has_dict".
+    """
+    size = sys.getsizeof(obj)
+    has_dict = hasattr(obj, "__dict__")
+    if has_dict:
+        size += sys.getsizeof(obj.__dict__)
+    return {"bytes": size, "has_dict": has_dict}
+
+
+def measure_swarm(kind, count, backend):
+    """
+    Строит рой из count объектов в группе выбранного хранилища и замеряет кучу.
+    Args:
+        kind: Тип объектов из KINDS.
+        count: Число объектов.
+        backend: Хранилище ("python" - SpriteGroup, "numpy" - EntityStore).
+    Returns:
+        Словарь с байтами на сущность, приростом кучи и всей кучей Python с роем.
+    """
+    width, height = settings.WIDTH, settings.HEIGHT
+    factory = KINDS[kind]
+    rng = random.Random(SEED)
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    group = EntityStore(width, height) if backend == "numpy" else SpriteGroup()
+    for _ in range(count):
+        group.add(factory(rng, width, height))
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    result = {
+        "kind": kind,
+        "count": count,
+        "bytes": current - before,
+        "bytes_per_entity": round((current - before) / count, 1) if count else 0.0,
+        "peak_bytes": peak - before,  # с временными объектами (например, при росте массивов)
+        "heap_bytes": current,
+    }
+    del group
+    gc.collect()
+    return result
+
+
+def max_rss():
+    """Пиковый размер процесса в байтах или None, если его не узнать."""
+    try:
+        import resource
+    except ImportError:  # нет на Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024  # macOS - байты, Linux - килобайты
+
+
+def report(counts, backend):
+    """
+    Собирает отчет.
+    Args:
+        counts: Размеры роев.
+        backend: Хранилище сущностей.
+    Returns:
+        Словарь, пригодный для JSON.
+    """
+    rng = random.Random(SEED)
+    ship = Ship([settings.WIDTH / 2, settings.HEIGHT / 2], [0, 0], 0, None, settings.ship_info, None)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backend": backend,
+            "seed": SEED,
+        },
+        "entities": {
+            "rock": instance_info(make_rock(rng, settings.WIDTH, settings.HEIGHT)),
+            "missile": instance_info(make_missile(rng, settings.WIDTH, settings.HEIGHT)),
+            "ship": instance_info(ship),
+        },
+        "swarms": [measure_swarm(kind, count, backend) for kind in KINDS for count in counts],
+        "max_rss_bytes": max_rss(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.memory", description="Отчет о памяти сущностей")
+    parser.add_argument("--count", type=int, action="append",
+                        help="размер роя (можно несколько; по умолчанию 1000, 10000, 100000)")
+    parser.add_argument("--backend", choices=("python", "numpy"), default="python")
+    parser.add_argument("--budget-mb", type=float, help="предел кучи Python с роем; выход с кодом 1, если превышен")
+    parser.add_argument("--output", help="файл для JSON")
+    args = parser.parse_args(argv)
+
+    result = report(args.count or COUNTS, args.backend)
+    for kind, info in result["entities"].items():
+        print(f"{kind:<8} {info['bytes']:>5} байт на объект{' (со словарем экземпляра)' if info['has_dict'] else ''}")
+    print(f"{'рой':<8} {'объектов':>9} {'байт/шт':>9} {'рой МБ':>9} {'куча МБ':>9}")
+    over = []
+    for swarm in result["swarms"]:
+        print(f"{swarm['kind']:<8} {swarm['count']:>9} {swarm['bytes_per_entity']:>9.1f} "
+              f"{swarm['bytes'] / 2 ** 20:>9.2f} {swarm['heap_bytes'] / 2 ** 20:>9.2f}")
+        if args.budget_mb is not None and swarm["heap_bytes"] > args.budget_mb * 2 ** 20:
+            over.append(swarm)
+    if args.output:
+        try:
+            with open(args.output, "w", encoding="utf-8") as file:
+                json.dump(result, file, indent=2, ensure_ascii=False)
+        except OSError as e:
+            print(f"Не удалось сохранить отчет: {e}")
+    for swarm in over:
+        print(f"Не укладывается в {args.budget_mb} МБ: {swarm['kind']} x {swarm['count']}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+    Сценарии нагрузки для бенчмарков.
+    Сценарий - функция setup(world, rng), которая готовит мир и возвращает
+    функцию drive(frame), выдающую команды игрока перед каждым шагом.
+    Все случайности берутся из rng и из зерна мира, поэтому прогоны
+    сценария повторяются точно и их можно сравнивать между коммитами.
+"""
+import math
+import random
+
+
+def fill_rocks(world, count):
+    """
+    Заполняет поле камнями через rock_spawner.
+    Args:
+        world: Объект World (игра уже начата).
+        count: Сколько камней должно быть на поле.
+    """
+    world.max_rock = count
+    for _ in range(count * 4):  # rock_spawner не ставит камни вплотную к кораблю
+        if len(world.rock_group) >= count:
+            break
+        world.rock_spawner()
+
+
+def start(world):
+    """Начинает игру с бесконечными жизнями, чтобы сценарий не прерывался на Game Over."""
+    world.start()
+    world.lives = 10 ** 9
+
+
+def rocks(count):
+    """
+    Сценарий "много камней": корабль стоит, поле заполнено камнями.
+    Args:
+        count: Число камней (MAX_ROCK).
+    Returns:
+        Функция setup.
+    """
+    def setup(world, rng):
+        start(world)
+        fill_rocks(world, count)
+        return lambda frame: None
+    return setup
+
+
+def circle_target(world, frame, period, radius):
+    """
+    Точка на окружности вокруг центра поля, по которой корабль ходит по кругу.
+    Args:
+        world: Объект World.
+        frame: Номер кадра.
+        period: За сколько кадров проходится окружность.
+        radius: Радиус окружности.
+    Returns:
+        Позиция [x, y].
+    """
+    angle = 2 * math.pi * frame / period
+    return [world.width / 2 + radius * math.cos(angle), world.height / 2 + radius * math.sin(angle)]
+
+
+def sustained_fire(world, rng):
+    """Непрерывная стрельба на ходу: пул ракет, столкновения ракет с камнями."""
+    start(world)
+    fill_rocks(world, 50)
+
+    def drive(frame):
+        if frame % 20 == 0:
+            world.set_target(circle_target(world, frame, 600, 200))
+            world.set_thrust(True)
+        if frame % 2 == 0:
+            world.shoot()
+        else:
+            world.stop_shooting()
+    return drive
+
+
+def explosion_chains(world, rng):
+    """Плотные цепочки взрывов: тысячи записей анимаций (шаг группы, списание истекших) и вывод их кадров."""
+    start(world)
+    fill_rocks(world, 200)
+
+    def drive(frame):
+        for _ in range(12):
+            world.explode([rng.randrange(world.width), rng.randrange(world.height)])
+        if frame % 3 == 0:
+            world.shoot()
+    return drive
+
+
+def dense_level(width, height, walls, loot, seed):
+    """
+    Генерирует текст уровня.
+    Args:
+        width: Ширина в клетках.
+        height: Высота в клетках.
+        walls: Доля стен.
+        loot: Доля лута.
+        seed: Зерно генератора.
+    Returns:
+        Список строк уровня.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(height):
+        row = []
+        for _ in range(width):
+            value = rng.random()
+            row.append("#" if value < walls else "@" if value < walls + loot else ".")
+        rows.append("".join(row))
+    # Центр свободен, чтобы корабль не стоял в стене
+    center_row, center_col = height // 2, width // 2
+    for r in range(center_row - 1, center_row + 2):
+        rows[r] = rows[r][:center_col - 1] + "..." + rows[r][center_col + 2:]
+    return rows
+
+
+def grid_heavy(world, rng):
+    """Плотная сетка размером с экран: сбор лута и перерисовка изменившихся клеток."""
+    start(world)
+    fill_rocks(world, 20)
+
+    def drive(frame):
+        if frame % 15 == 0:
+            world.set_target([rng.randrange(world.width), rng.randrange(world.height)])
+            world.set_thrust(True)
+    return drive
+
+
+def large_level(world, rng):
+    """Уровень 128x96 клеток: камера, подгрузка чанков, грубая симуляция вдали от корабля."""
+    start(world)
+    fill_rocks(world, 500)
+
+    def drive(frame):
+        if frame % 30 == 0:
+            world.set_target(circle_target(world, frame, 900, min(world.width, world.height) / 3))
+            world.set_thrust(True)
+        if frame % 4 == 0:
+            world.shoot()
+    return drive
+
+
+# имя -> (setup, уровень 1 для сценария или None - обычный первый уровень)
+SCENARIOS = {
+    "rocks_5": (rocks(5), None),
+    "rocks_50": (rocks(50), None),
+    "rocks_500": (rocks(500), None),
+    "rocks_5000": (rocks(5000), None),
+    "sustained_fire": (sustained_fire, None),
+    "explosion_chains": (explosion_chains, None),
+    "grid_heavy": (grid_heavy, dense_level(16, 12, 0.35, 0.3, 1)),
+    "large_level": (large_level, dense_level(128, 96, 0.1, 0.03, 2)),
+}
@@ -0,0 +1,350 @@
+import argparse
+import contextlib
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # рабочие процессы не печатают приветствие pygame
+
+from engine import settings
+from engine.World import World
+from environment.Grid import LOOT
+
+
+# --- Политики ввода --- #
+# Политика - функция policy(world, rng), которая возвращает функцию act(tick),
+# отдающую команды в очередь мира перед каждым шагом (как игрок мышью и пробелом,
+# с той же склейкой команд и ограничением частоты выстрелов).
+# Все случайности политики берутся из rng, поэтому игра повторяется по зерну.
+
+def idle_policy(world, rng):
+    """Игрок ничего не делает: базовая линия выживания."""
+    return lambda tick: None
+
+
+def random_policy(world, rng):
+    """Случайные щелчки, тяга и стрельба через случайные промежутки."""
+    next_move = [0]
+
+    def act(tick):
+        if tick >= next_move[0]:
+            world.commands.target([rng.randrange(world.width), rng.randrange(world.height)])
+            world.commands.thrust(rng.random() < 0.7)
+            next_move[0] = tick + rng.randint(20, 90)
+        if rng.random() < 0.1:
+            world.commands.shoot()
+    return act
+
+
+def nearest(origin, points, width, height):
+    """
+    Ближайшая точка с учетом того, что поле замкнуто по краям.
+    Args:
+        origin: Позиция (x, y).
+        points: Итерируемое точек (x, y).
+        width: Ширина поля.
+        height: Высота поля.
+    Returns:
+        Ближайшая точка или None, если точек нет.
+    """
+    best, best_distance = None, math.inf
+    for point in points:
+        dx = abs(point[0] - origin[0])
+        dy = abs(point[1] - origin[1])
+        distance = min(dx, width - dx) ** 2 + min(dy, height - dy) ** 2
+        if distance < best_distance:
+            best, best_distance = point, distance
+    return best
+
+
+def loot_positions(grid):
+    """
+    Центры клеток с лутом.
+    Args:
+        grid: Объект Grid.
+    Returns:
+        Генератор позиций (x, y).
+    """
+    size = grid.cell_size
+    width = grid.width
+    index = grid.cells.find(LOOT)
+    while index != -1:
+        row, col = divmod(index, width)
+        yield (col * size + size / 2, row * size + size / 2)
+        index = grid.cells.find(LOOT, index + 1)
+
+
+def hunter_policy(world, rng):
+    """
+    Сценарный игрок: пока очков мало, летит к ближайшему камню и стреляет,
+    потом собирает ближайший лут, чтобы перейти на следующий уровень.
+    """
+    def act(tick):
+        if tick % 30 == 0:
+            position = world.ship.get_position()
+            target = None
+            if world.score < world.score_to_next_level:
+                target = nearest(position, (rock.get_position() for rock in world.rock_group),
+                                 world.width, world.height)
+            if target is None:
+                target = nearest(position, loot_positions(world.grid), world.width, world.height)
+            if target is not None:
+                world.commands.target([target[0] + rng.uniform(-10, 10), target[1] + rng.uniform(-10, 10)])
+                world.commands.thrust(True)
+        if tick % 8 == 0:
+            world.commands.shoot()
+        elif tick % 8 == 4:
+            world.commands.stop_shooting()
+    return act
+
+
+POLICIES = {
+    "idle": idle_policy,
+    "random": random_policy,
+    "hunter": hunter_policy,
+}
+
+
+def play_game(job):
+    """
+    Играет одну игру без окна (выполняется в рабочем процессе).
+    Args:
+        job: Кортеж (номер игры, зерно, политика, предел шагов, шаг выборки кривой счета, backend).
+    Returns:
+        Словарь с результатами игры.
+    """
+    index, seed, policy, max_ticks, sample_every, backend = job
+    with contextlib.redirect_stdout(None):  # мир сообщает о смене уровней в консоль
+        world = World(seed=seed, backend=backend)
+        act = POLICIES[policy](world, random.Random(seed ^ 0x5DEECE66D))  # свой генератор, мир не сбивается
+        world.start()
+        level = level_reached = world.current_level
+        lives = world.lives
+        level_ups = []  # шаг перехода на каждый следующий уровень
+        lives_lost = []  # шаги потери жизней
+        score_curve = []  # счет через каждые sample_every шагов
+        tick = 0
+        while tick < max_ticks and world.started:
+            act(tick)
+            world.step()
+            tick += 1
+            if world.current_level != level:
+                if world.current_level > level:
+                    level_ups.append(tick)
+                level = world.current_level
+                level_reached = max(level_reached, level)
+            if world.lives != lives:
+                if world.lives < lives:
+                    lives_lost.append(tick)
+                lives = world.lives
+            if tick % sample_every == 0:
+                score_curve.append(world.score)
+    if world.levels_up:
+        outcome = "all_levels"
+    elif world.game_over:
+        outcome = "game_over"
+    else:
+        outcome = "timeout"
+    return {
+        "game": index,
+        "seed": seed,
+        "outcome": outcome,
+        "ticks": tick,
+        "score": world.score,
+        "loot": world.loot_collected,
+        "level_reached": level_reached,
+        "score_to_next_level": world.score_to_next_level,
+        "level_ups": level_ups,
+        "lives_lost": lives_lost,
+        "score_curve": score_curve,
+    }
+
+
+def stats(values):
+    """
+    Сводка по выборке (перцентили - ближайший ранг).
+    Args:
+        values: Список чисел.
+    Returns:
+        Словарь с ключами "count", "mean", "min", "p10", "p50", "p90", "max".
+    """
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+
+    def rank(fraction):
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))]
+
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), 3),
+        "min": ordered[0],
+        "p10": rank(0.1),
+        "p50": rank(0.5),
+        "p90": rank(0.9),
+        "max": ordered[-1],
+    }
+
+
+class BatchRunner:
+    """
+    Пакетный прогон игр без окна в пуле процессов.
+    Каждая игра получает свое зерно, выведенное из общего зерна по номеру
+    игры, поэтому результаты не зависят от числа процессов и порядка их
+    работы. Игры независимы, так что пропускная способность растет с числом
+    ядер; результаты сводятся в статистику для баланса и тестов сложности.
+    """
+    def __init__(self, games=1000, policy="hunter", seed=0, max_ticks=settings.FPS * 300,
+                 sample_every=settings.FPS * 10, workers=None, backend="python"):
+        """
+        Инициализация.
+        Args:
+            games: Сколько игр сыграть.
+            policy: Имя политики ввода из POLICIES.
+            seed: Общее зерно прогона.
+            max_ticks: Предел длины одной игры в шагах.
+            sample_every: Раз во сколько шагов записывать счет для кривой счета.
+            workers: Число процессов (None - по числу ядер, 1 - без пула, в этом процессе).
+            backend: Хранилище сущностей мира ("python" или "numpy").
+        Raises:
+            ValueError: Если политика неизвестна.
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Неизвестная политика: {policy}")
+        self.games = games
+        self.policy = policy
+        self.seed = seed
+        self.max_ticks = max_ticks
+        self.sample_every = sample_every
+        self.workers = workers or os.cpu_count() or 1
+        self.backend = backend
+        self.results = []
+        self.elapsed = 0.0
+
+    def jobs(self):
+        """
+        Задания для рабочих процессов.
+        Returns:
+            Список кортежей для play_game.
+        """
+        rng = random.Random(self.seed)
+        return [(index, rng.getrandbits(63), self.policy, self.max_ticks, self.sample_every, self.backend)
+                for index in range(self.games)]
+
+    def run(self):
+        """
+        Играет все игры.
+        Returns:
+            Список результатов игр по порядку номеров.
+        """
+        jobs = self.jobs()
+        start = time.perf_counter()
+        if self.workers == 1:
+            self.results = [play_game(job) for job in jobs]
+        else:
+            # Крупные порции заданий: меньше обмена между процессами, ядра заняты равномерно
+            chunksize = max(1, len(jobs) // (self.workers * 8))
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                self.results = list(pool.map(play_game, jobs, chunksize=chunksize))
+        self.elapsed = time.perf_counter() - start
+        return self.results
+
+    def summary(self, per_game=False):
+        """
+        Сводка результатов (время - в секундах игры).
+        Args:
+            per_game: Добавить ли результаты каждой игры.
+        Returns:
+            Словарь, пригодный для JSON.
+        """
+        results = self.results
+        fps = settings.FPS
+        ticks = sum(result["ticks"] for result in results)
+        outcomes = {}
+        levels = {}
+        level_up_times = {}
+        for result in results:
+            outcomes[result["outcome"]] = outcomes.get(result["outcome"], 0) + 1
+            levels[str(result["level_reached"])] = levels.get(str(result["level_reached"]), 0) + 1
+            for level, tick in enumerate(result["level_ups"], start=2):
+                level_up_times.setdefault(str(level), []).append(round(tick / fps, 2))
+
+        # Кривая счета: сколько игр еще идет и их счет в каждой точке выборки
+        score_curve = []
+        samples = max((len(result["score_curve"]) for result in results), default=0)
+        for point in range(samples):
+            scores = [result["score_curve"][point] for result in results if len(result["score_curve"]) > point]
+            score_curve.append({"time_s": (point + 1) * self.sample_every / fps,
+                                "alive": len(scores), **stats(scores)})
+
+        summary = {
+            "meta": {
+                "games": len(results),
+                "policy": self.policy,
+                "seed": self.seed,
+                "max_ticks": self.max_ticks,
+                "backend": self.backend,
+                "workers": self.workers,
+                "elapsed_s": round(self.elapsed, 3),
+                "games_per_s": round(len(results) / self.elapsed, 2) if self.elapsed else 0.0,
+                "ticks_per_s": round(ticks / self.elapsed) if self.elapsed else 0,
+            },
+            "outcomes": outcomes,
+            "survival_s": stats([round(result["ticks"] / fps, 2) for result in results]),
+            "score": stats([result["score"] for result in results]),
+            "loot": stats([result["loot"] for result in results]),
+            "level_reached": dict(sorted(levels.items())),
+            "level_up_s": {level: stats(times) for level, times in sorted(level_up_times.items())},
+            "score_to_next_level": stats([result["score_to_next_level"] for result in results]),
+            "first_life_lost_s": stats([round(result["lives_lost"][0] / fps, 2)
+                                        for result in results if result["lives_lost"]]),
+            "score_curve": score_curve,
+        }
+        if per_game:
+            summary["games"] = results
+        return summary
+
+    def save(self, path, per_game=False):
+        """
+        Сохраняет сводку в файл JSON.
+        Args:
+            path: Путь к файлу.
+            per_game: Добавить ли результаты каждой игры.
+        """
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(self.summary(per_game), file, indent=2, ensure_ascii=False)
+        except OSError as e:
+            print(f"Не удалось сохранить сводку: {e}")
+
+
+if __name__ == "__main__":
+    # python -m engine.BatchRunner --games 1000 --policy hunter --workers 8 --output .cache/batch.json
+    parser = argparse.ArgumentParser(prog="python -m engine.BatchRunner", description="Пакетный прогон игр без окна")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="hunter")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=settings.FPS * 300, help="предел длины игры в шагах")
+    parser.add_argument("--sample-every", type=int, default=settings.FPS * 10, help="шаг выборки кривой счета")
+    parser.add_argument("--workers", type=int, default=None, help="число процессов (по умолчанию - ядра)")
+    parser.add_argument("--backend", choices=("python", "numpy"), default="python")
+    parser.add_argument("--output", default=os.path.join(".cache", "batch.json"))
+    parser.add_argument("--per-game", action="store_true", help="сохранить результаты каждой игры")
+    args = parser.parse_args()
+
+    runner = BatchRunner(args.games, args.policy, args.seed, args.max_ticks, args.sample_every,
+                         args.workers, args.backend)
+    runner.run()
+    runner.save(args.output, args.per_game)
+    summary = runner.summary()
+    meta = summary["meta"]
+    print(f"Игр: {meta['games']} за {meta['elapsed_s']} с ({meta['games_per_s']} игр/с, "
+          f"{meta['ticks_per_s']} шагов/с, процессов: {meta['workers']})")
+    print(f"Исходы: {summary['outcomes']}, уровни: {summary['level_reached']}")
+    print(f"Выживание, с: {summary['survival_s']}")
+    print(f"Счет: {summary['score']}")
+    print(f"Сводка: {args.output}")
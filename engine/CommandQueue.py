@@ -0,0 +1,135 @@
+from engine.InputLog import InputLog
+
+# Команды одной группы склеиваются: в очереди остается только последняя
+_GROUPS = {
+    InputLog.START: "start",
+    InputLog.TARGET: "target",
+    InputLog.THRUST_ON: "thrust",
+    InputLog.THRUST_OFF: "thrust",
+    InputLog.SHOOT: "shoot",
+    InputLog.STOP_SHOOTING: "stop_shooting",
+}
+
+
+class CommandQueue:
+    """
+    Очередь команд игрока между вводом и симуляцией.
+    Ввод (события мыши и клавиатуры, сценарии, политики ботов) только
+    кладет команды в очередь, а мир выполняет их один раз за шаг в начале
+    World.step. Команды - те же типы, что в записи InputLog, с позицией для
+    TARGET. Повторные команды одной группы до шага склеиваются в последнюю
+    (несколько щелчков - одна цель, пачка нажатий пробела - один выстрел),
+    поэтому за шаг выполняется не больше одной команды каждой группы, а
+    выстрелы дополнительно ограничены по частоте.
+    """
+    def __init__(self, shot_interval=0):
+        """
+        Инициализация.
+        Args:
+            shot_interval: Минимум шагов между выстрелами (0 - без ограничения).
+        """
+        self.shot_interval = shot_interval
+        self.pending = []  # список (тип, позиция или None, как есть)
+        self.next_shot = 0  # шаг, начиная с которого разрешен следующий выстрел
+        self.coalesced = 0  # сколько команд поглощено склейкой
+        self.dropped = 0  # сколько выстрелов отброшено ограничением частоты
+
+    def __len__(self):
+        return len(self.pending)
+
+    def push(self, kind, pos=None, exact=False):
+        """
+        Добавляет команду.
+        Args:
+            kind: Тип команды (InputLog.START, InputLog.TARGET и т.д.).
+            pos: Позиция [x, y] в мировых координатах для TARGET.
+            exact: Выполнить как есть, без склейки и ограничения выстрелов
+                (для повтора записи: записанные команды уже прошли через очередь).
+        """
+        if not exact:
+            group = _GROUPS[kind]
+            for i, (other, _, other_exact) in enumerate(self.pending):
+                if not other_exact and _GROUPS[other] == group:
+                    del self.pending[i]  # в группе не больше одной команды, дальше искать не нужно
+                    self.coalesced += 1
+                    break
+        self.pending.append((kind, pos, exact))
+
+    def start(self):
+        """Команда начала игры."""
+        self.push(InputLog.START)
+
+    def target(self, pos):
+        """
+        Команда полета к точке.
+        Args:
+            pos: Позиция [x, y] в мировых координатах.
+        """
+        self.push(InputLog.TARGET, pos)
+
+    def thrust(self, on):
+        """
+        Команда включения/выключения тяги.
+        Args:
+            on: True для включения тяги, False для выключения.
+        """
+        self.push(InputLog.THRUST_ON if on else InputLog.THRUST_OFF)
+
+    def shoot(self):
+        """Команда выстрела."""
+        self.push(InputLog.SHOOT)
+
+    def stop_shooting(self):
+        """Команда окончания выстрела (кнопка отпущена)."""
+        self.push(InputLog.STOP_SHOOTING)
+
+    def clear(self):
+        """Удаляет невыполненные команды."""
+        self.pending.clear()
+
+    def execute(self, world):
+        """
+        Выполняет накопленные команды над миром (вызывается в начале шага).
+        Args:
+            world: Объект World.
+        """
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, []
+        for kind, pos, exact in pending:
+            if kind == InputLog.SHOOT and not exact:
+                if world.time < self.next_shot:
+                    self.dropped += 1
+                    continue
+                self.next_shot = world.time + self.shot_interval
+            self.apply(world, kind, pos)
+
+    @staticmethod
+    def apply(world, kind, pos=None):
+        """
+        Выполняет одну команду над миром.
+        Args:
+            world: Объект World.
+            kind: Тип команды.
+            pos: Позиция для TARGET.
+        """
+        if kind == InputLog.START:
+            world.start()
+        elif kind == InputLog.TARGET:
+            world.set_target(list(pos))
+        elif kind == InputLog.THRUST_ON:
+            world.set_thrust(True)
+        elif kind == InputLog.THRUST_OFF:
+            world.set_thrust(False)
+        elif kind == InputLog.SHOOT:
+            world.shoot()
+        elif kind == InputLog.STOP_SHOOTING:
+            world.stop_shooting()
+
+    def stats(self):
+        """
+        Возвращает счетчики очереди.
+        Returns:
+            Словарь с ключами "pending", "coalesced", "dropped".
+        """
+        return {"pending": len(self.pending), "coalesced": self.coalesced, "dropped": self.dropped}
@@ -0,0 +1,192 @@
+import hashlib
+import os
+import struct
+import sys
+import time
+
+
+class InputLog:
+    """
+    Запись команд игрока для точного повтора игры.
+    Хранит зерно генератора случайных чисел мира, размер поля и поток команд
+    с номерами шагов. В двоичном виде команда занимает 2 байта (разность
+    шагов в varint и тип), а щелчок еще 8 байт координат. Поскольку мир
+    детерминирован при том же зерне, повтор команд без окна на максимальной
+    скорости дает ту же самую игру.
+    """
+    MAGIC = b"MEYR"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHQIII")  # сигнатура, версия, зерно, ширина и высота поля, число шагов
+    POS = struct.Struct("<ii")
+
+    # Типы команд
+    START, TARGET, THRUST_ON, THRUST_OFF, SHOOT, STOP_SHOOTING = range(6)
+
+    def __init__(self, seed, width, height):
+        """
+        Инициализация.
+        Args:
+            seed: Зерно генератора случайных чисел мира.
+            width: Ширина экрана, под который создан мир.
+            height: Высота экрана, под который создан мир.
+        """
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.events = []  # список (шаг, тип, позиция или None)
+        self.ticks = 0  # сколько шагов длилась записанная игра
+
+    def record(self, tick, kind, pos=None):
+        """
+        Добавляет команду в запись.
+        Args:
+            tick: Номер шага, перед которым команда выполнена.
+            kind: Тип команды (InputLog.START, InputLog.TARGET и т.д.).
+            pos: Позиция [x, y] для TARGET (необязательно).
+        """
+        self.events.append((tick, kind, (int(pos[0]), int(pos[1])) if pos is not None else None))
+        self.ticks = max(self.ticks, tick + 1)
+
+    def to_bytes(self):
+        """
+        Кодирует запись в двоичный вид.
+        Returns:
+            Двоичные данные (bytes).
+        """
+        out = bytearray(self.HEADER.pack(self.MAGIC, self.VERSION, self.seed, self.width, self.height, self.ticks))
+        last_tick = 0
+        for tick, kind, pos in self.events:
+            delta = tick - last_tick
+            last_tick = tick
+            while delta >= 0x80:  # varint: по 7 бит, старший бит - продолжение
+                out.append((delta & 0x7F) | 0x80)
+                delta >>= 7
+            out.append(delta)
+            out.append(kind)
+            if kind == self.TARGET:
+                out += self.POS.pack(*pos)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Декодирует запись.
+        Args:
+            data: Двоичные данные.
+        Returns:
+            Объект InputLog.
+        Raises:
+            ValueError: Если данные в другом формате или обрезаны.
+        """
+        if len(data) < cls.HEADER.size:
+            raise ValueError("файл записи слишком короткий")
+        magic, version, seed, width, height, ticks = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("неизвестный формат файла записи")
+        log = cls(seed, width, height)
+        log.ticks = ticks
+        offset = cls.HEADER.size
+        tick = 0
+        try:
+            while offset < len(data):
+                delta = shift = 0
+                while True:
+                    byte = data[offset]
+                    offset += 1
+                    delta |= (byte & 0x7F) << shift
+                    shift += 7
+                    if byte < 0x80:
+                        break
+                tick += delta
+                kind = data[offset]
+                offset += 1
+                pos = None
+                if kind == cls.TARGET:
+                    pos = cls.POS.unpack_from(data, offset)
+                    offset += cls.POS.size
+                log.events.append((tick, kind, pos))
+        except (IndexError, struct.error):
+            raise ValueError("файл записи обрезан")
+        return log
+
+    def save(self, path, ticks=None):
+        """
+        Сохраняет запись в файл.
+        Args:
+            path: Путь к файлу.
+            ticks: Сколько шагов длилась игра (обычно world.time; по умолчанию - до последней команды).
+        """
+        if ticks is not None:
+            self.ticks = max(self.ticks, ticks)
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(self.to_bytes())
+        except OSError as e:
+            print(f"Не удалось сохранить запись игры: {e}")
+
+    @classmethod
+    def load(cls, path):
+        """
+        Загружает запись из файла.
+        Args:
+            path: Путь к файлу.
+        Returns:
+            Объект InputLog.
+        """
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+    def replay(self, world, ticks=None):
+        """
+        Повторяет записанную игру без отрисовки, с максимальной скоростью.
+        Команды подаются через очередь мира (world.commands) как есть: при
+        записи они уже прошли склейку и ограничение выстрелов.
+        Args:
+            world: Новый объект World, созданный с зерном и размерами записи.
+            ticks: Сколько шагов прогнать (по умолчанию столько, сколько длилась записанная игра).
+        Returns:
+            Тот же объект World после повтора.
+        """
+        if ticks is None:
+            ticks = self.ticks
+        events = self.events
+        push = world.commands.push
+        index = 0
+        while world.time < ticks:
+            while index < len(events) and events[index][0] <= world.time:
+                _, kind, pos = events[index]
+                push(kind, pos, exact=True)
+                index += 1
+            world.step()
+        return world
+
+    @staticmethod
+    def digest(world):
+        """
+        Отпечаток состояния мира для сравнения прогонов (например, до и после оптимизации).
+        Args:
+            world: Объект World.
+        Returns:
+            Шестнадцатеричная строка SHA-1.
+        """
+        state = hashlib.sha1()
+        state.update(repr((world.time, world.current_level, world.score, world.lives,
+                           world.loot_collected, world.started, world.game_over)).encode())
+        for obj in [world.ship, *world.rock_group, *world.missile_group]:
+            state.update(struct.pack("<dd", *obj.get_position()))
+        return state.hexdigest()
+
+
+if __name__ == "__main__":
+    # Повтор записи без окна: python -m engine.InputLog путь_к_записи [numpy]
+    from engine.World import World
+
+    log = InputLog.load(sys.argv[1])
+    world = World(log.width, log.height, seed=log.seed, backend=sys.argv[2] if len(sys.argv) > 2 else "python")
+    start = time.perf_counter()
+    log.replay(world)
+    elapsed = time.perf_counter() - start
+    print(f"Шагов: {world.time}, уровень: {world.current_level}, счет: {world.score}, "
+          f"жизни: {world.lives}, лут: {world.loot_collected}")
+    print(f"Скорость: {world.time / max(elapsed, 1e-9):.0f} шагов/с, отпечаток: {InputLog.digest(world)}")
@@ -0,0 +1,413 @@
+import random
+
+from engine import settings
+from engine.CommandQueue import CommandQueue
+from engine.InputLog import InputLog
+from entities.Animation import Animation, AnimationGroup
+from entities.EntityStore import EntityStore
+from entities.Ship import Ship
+from entities.Sprite import Sprite
+from entities.SpriteGroup import SpriteGroup
+from environment.Grid import Grid
+from environment.LevelCompiler import level_cache
+from utils.Pool import Pool
+from utils.SpatialHash import SpatialHash
+from utils.vector import dist
+
+
+class World:
+    """
+    Состояние игры и ее симуляция с фиксированным шагом.
+    Не использует ни экран, ни микшер: звуки сообщаются событиями,
+    которые забирает внешний код (см. drain_events), поэтому мир можно
+    крутить без окна и быстрее реального времени.
+    Ввод кладет команды в очередь commands (CommandQueue), и мир выполняет
+    их в начале шага; методы раздела "Команды игрока" выполняют команду сразу.
+    """
+    def __init__(self, width=settings.WIDTH, height=settings.HEIGHT, images=None, backend="python", seed=None):
+        """
+        Инициализация мира.
+        Args:
+            width: Ширина экрана (и наименьшая ширина поля; уровень может быть больше).
+            height: Высота экрана (и наименьшая высота поля).
+            images: Словарь изображений для создаваемых объектов (необязательно):
+                "ship", "flight", "missile", "asteroid", "explosion" (список кадров),
+                "wall", "loot". Без изображений мир работает в безголовом режиме.
+            backend: Хранилище камней и ракет: "python" (множества спрайтов)
+                или "numpy" (массивы EntityStore для тысяч сущностей).
+            seed: Зерно генератора случайных чисел мира (None - случайное). С тем же зерном
+                и теми же командами по шагам игра повторяется точно (см. InputLog).
+        """
+        if backend not in ("python", "numpy"):
+            raise ValueError(f"Неизвестный backend: {backend}")
+        self.view_width = width
+        self.view_height = height
+        self.width = width
+        self.height = height
+        self.backend = backend
+        self.seed = random.randrange(2 ** 63) if seed is None else seed
+        self.random = random.Random(self.seed)  # Свой генератор: глобальный random миру не нужен
+        self.recorder = None  # InputLog, если команды записываются
+        self.commands = CommandQueue(settings.SHOT_INTERVAL)  # команды ввода, выполняются в начале шага
+        self.images = images or {}
+        # Кадры взрыва запекаются один раз; сами взрывы - записи в группе анимаций
+        self.explosion_animation = Animation(self.images.get("explosion") or [None] * settings.EXPLOSION_FRAMES,
+                                             settings.EXPLOSION_FRAME_RATE,
+                                             fade=settings.EXPLOSION_FADE, scale=settings.EXPLOSION_SCALE)
+        self.explosion_group = AnimationGroup()
+        self.explosion_id = self.explosion_group.register(self.explosion_animation)
+        self.events = []
+        self.rock_hash = SpatialHash(width, height, 80)
+        self.missile_pool = Pool(Sprite, settings.MISSILE_POOL_SIZE)
+        self.destroyed = {}  # Сбитые за шаг камни (словарь без значений: порядок удаления не зависит от адресов)
+        self.started = False
+        self.game_over = False
+        self.levels_up = False
+        self.time = 0
+        self.score = 0
+        self.lives = settings.LIVES
+        self.loot_collected = 0
+        self.reset_level()
+
+    # --- Состояние --- #
+    def reset_level(self):
+        """Возвращает мир к первому уровню (при запуске, после Game Over и после прохождения всех уровней)."""
+        self.current_level = 1
+        self.score_to_next_level = settings.SCORE_TO_NEXT_LEVEL
+        self.max_rock = settings.MAX_ROCK
+        self.grid = self._build_grid(1)
+        if self.grid is None:
+            print("Ошибка загрузки первого уровня!")
+            self.grid = self._new_grid()
+        self._fit_to_grid()
+        self.ship = self._new_ship()
+        self.rock_group = self._new_group()
+        self.missile_group = self._new_group()
+        self.explosion_group.clear()
+        self.rock_hash.clear()
+
+    def _fit_to_grid(self):
+        """
+        Подгоняет размер поля под сетку уровня. Если размер изменился,
+        группы и хеш создаются заново.
+        Returns:
+            True, если размер поля изменился.
+        """
+        width = self.grid.width * self.grid.cell_size
+        height = self.grid.height * self.grid.cell_size
+        if (width, height) == (self.width, self.height):
+            return False
+        self.width = width
+        self.height = height
+        self.rock_hash = SpatialHash(width, height, 80)
+        self.rock_group = self._new_group()
+        self.missile_group = self._new_group()
+        self.explosion_group.clear()
+        return True
+
+    def active_region(self):
+        """
+        Область поля вокруг корабля, где объекты симулируются каждый шаг.
+        Returns:
+            Кортеж (cx, cy, half_w, half_h) или None, если поле не больше экрана.
+        """
+        if self.width <= self.view_width and self.height <= self.view_height:
+            return None
+        x, y = self.ship.get_position()
+        return (x, y, self.view_width / 2 + settings.SIM_MARGIN, self.view_height / 2 + settings.SIM_MARGIN)
+
+    def _new_group(self):
+        """Создает пустую группу сущностей выбранного хранилища."""
+        if self.backend == "numpy":
+            return EntityStore(self.width, self.height)
+        return SpriteGroup()
+
+    def _new_ship(self):
+        """Создает корабль в центре поля."""
+        return Ship([self.width / 2, self.height / 2], [0, 0], 0,
+                    self.images.get("ship"), settings.ship_info, self.images.get("flight"))
+
+    def _new_grid(self, width=0, height=0):
+        """
+        Создает пустую сетку не меньше экрана.
+        Args:
+            width: Ширина уровня в клетках.
+            height: Высота уровня в клетках.
+        Returns:
+            Объект Grid.
+        """
+        return Grid(max(width, self.view_width // settings.CELL_SIZE),
+                    max(height, self.view_height // settings.CELL_SIZE),
+                    settings.CELL_SIZE, self.images.get("wall"), self.images.get("loot"),
+                    settings.CHUNK_CELLS, settings.MAX_CHUNK_LAYERS)
+
+    def _build_grid(self, number):
+        """
+        Создает сетку уровня.
+        Args:
+            number: Номер уровня.
+        Returns:
+            Объект Grid или None, если файла уровня нет.
+        """
+        level = level_cache.load(settings.level_path(number))
+        if level is None:
+            return None
+        grid = self._new_grid(level.width, level.height)
+        level.apply(grid)
+        return grid
+
+    def recycle(self, pool, objects):
+        """
+        Возвращает отжившие ракеты в пул. В хранилище NumPy
+        группы держат копии данных, поэтому там возвращать нечего.
+        Args:
+            pool: Пул Pool.
+            objects: Удаленные из группы объекты.
+        """
+        if self.backend == "python":
+            pool.release_all(objects)
+
+    def pool_stats(self):
+        """
+        Возвращает статистику пулов для настройки их емкости.
+        Returns:
+            Словарь {"missile": {...}} (см. Pool.stats).
+        """
+        return {"missile": self.missile_pool.stats()}
+
+    def drain_events(self):
+        """
+        Забирает накопленные события (звуки, музыка) для внешнего кода.
+        Returns:
+            Список имен событий в порядке их возникновения.
+        """
+        events, self.events = self.events, []
+        return events
+
+    def start_recording(self):
+        """
+        Начинает запись команд игрока.
+        Returns:
+            Объект InputLog, в который будут записываться команды.
+        """
+        self.recorder = InputLog(self.seed, self.view_width, self.view_height)
+        return self.recorder
+
+    def _record(self, kind, pos=None):
+        """
+        Записывает команду, если идет запись.
+        Args:
+            kind: Тип команды InputLog.
+            pos: Позиция для InputLog.TARGET.
+        """
+        if self.recorder is not None:
+            self.recorder.record(self.time, kind, pos)
+
+    # --- Команды игрока --- #
+    def start(self):
+        """Начинает новую игру (щелчок по заставке)."""
+        self._record(InputLog.START)
+        if self.levels_up:
+            self.reset_level()
+        self.started = True
+        self.game_over = False
+        self.levels_up = False
+        self.score = 0
+        self.loot_collected = 0
+        self.lives = settings.LIVES
+        self.ship = self._new_ship()
+        self.rock_group = self._new_group()
+        self.missile_group = self._new_group()
+        self.explosion_group.clear()
+        self.events.append("music_start")
+
+    def set_target(self, pos):
+        """
+        Задает точку, к которой летит корабль.
+        Args:
+            pos: Позиция [x, y] (округляется до пикселя, как и в записи команд).
+        """
+        pos = [int(pos[0]), int(pos[1])]
+        self._record(InputLog.TARGET, pos)
+        if self.started:
+            # Через край летим только на полях больше экрана: на одном экране корабль летит прямо к курсору
+            wrap = self.width > self.view_width or self.height > self.view_height
+            self.ship.set_target_position(pos, self.width, self.height, wrap)
+
+    def set_thrust(self, on):
+        """
+        Включение/выключение тяги корабля.
+        Args:
+            on: True для включения тяги, False для выключения.
+        """
+        self._record(InputLog.THRUST_ON if on else InputLog.THRUST_OFF)
+        self.ship.set_thrust(on, self.started, None)
+        self.events.append("thrust_on" if on and self.started else "thrust_off")
+
+    def shoot(self):
+        """Выстрел ракетой."""
+        self._record(InputLog.SHOOT)
+        if self.started:
+            missile = self.ship.shoot(self.missile_group, self.started, self.images.get("missile"),
+                                      settings.missile_info, None, settings.ship_info, self.missile_pool)
+            if self.backend == "numpy":
+                self.missile_pool.release(missile)  # Хранилище уже скопировало данные ракеты
+            self.events.append("shoot")
+
+    def stop_shooting(self):
+        """Возвращает кораблю исходное изображение после выстрела."""
+        self._record(InputLog.STOP_SHOOTING)
+        self.ship.reset_image(settings.ship_info)
+
+    # --- Игровая логика --- #
+    def next_level(self):
+        """
+        Загружает следующий уровень.
+        Returns:
+            True, если уровень загружен, False, если уровни закончились.
+        """
+        grid = self._build_grid(self.current_level + 1)
+        if grid is None:
+            print("Все уровни пройдены!")
+            return False
+        self.current_level += 1
+        self.grid = grid
+        if self._fit_to_grid():
+            # Поле изменило размер: переносим корабль в его пределы
+            self.ship.x %= self.width
+            self.ship.y %= self.height
+            self.ship.save_position()
+        # Увеличиваем необходимые очки
+        self.score_to_next_level = self.score_to_next_level * 2 + 25
+        self.max_rock += 1
+        self.events.append("next_level")
+        print(f"Загружен уровень {self.current_level}")
+        return True
+
+    def rock_spawner(self):
+        """Создает новый камень, если их меньше максимума и он не появится рядом с кораблем."""
+        if self.started and len(self.rock_group) < self.max_rock:
+            rock_pos = [self.random.randrange(0, self.width), self.random.randrange(0, self.height)]
+            if dist(rock_pos, self.ship.get_position()) > 2 * settings.asteroid_info.get_radius() + self.ship.get_radius():
+                rock_vel = [self.random.random() * .6 - .3, self.random.random() * .6 - .3]
+                rock_avel = self.random.random() * .2 - .1
+                rock = Sprite(rock_pos, rock_vel, 0, rock_avel, self.images.get("asteroid"), settings.asteroid_info)
+                self.rock_group.add(rock)
+
+    def process_sprite_group(self, group, region=None):
+        """
+        Обновляет спрайты группы (один раз за шаг) и удаляет отжившие.
+        Args:
+            group: Группа SpriteGroup или EntityStore.
+            region: Область полной симуляции (см. active_region); вне ее объекты
+                обновляются грубо, раз в settings.COARSE_STEP шагов.
+        Returns:
+            Список удаленных за шаг объектов.
+        """
+        if region is None:
+            return group.step(self.width, self.height)
+        return group.step(self.width, self.height, region, self.time, settings.COARSE_STEP)
+
+    def explode(self, pos):
+        """Запускает анимацию взрыва в заданной позиции."""
+        self.explosion_group.add(self.explosion_id, self.time, pos)
+        self.events.append("explosion")
+
+    def resolve_collisions(self):
+        """
+        Обрабатывает все столкновения шага одним запросом к широкой фазе
+        (пространственному хешу камней или векторной проверке EntityStore).
+        Returns:
+            Кортеж (число камней, врезавшихся в корабль, число камней, сбитых ракетами).
+        """
+        if self.backend == "numpy":
+            # Хранилище само проверяет столкновения векторно
+            broad_phase = self.rock_group
+            missiles = self.missile_group
+        else:
+            broad_phase = self.rock_hash
+            broad_phase.sync(self.rock_group)
+            missiles = self.missile_group  # pairs собирает все пары до того, как мы начнем удалять
+
+        ship_hits = 0
+        for rock in broad_phase.query(self.ship.get_position(), self.ship.get_radius()):
+            self.explode(rock.pos)
+            self.rock_group.remove(rock)
+            self.rock_hash.remove(rock)
+            ship_hits += 1
+
+        destroyed = self.destroyed
+        destroyed.clear()
+        for rock, missile in broad_phase.pairs(missiles):
+            if missile not in self.missile_group:  # ракета уже попала в другой камень
+                continue
+            self.explode(missile.pos)
+            self.missile_group.remove(missile)
+            self.recycle(self.missile_pool, (missile,))
+            destroyed[rock] = None
+        for rock in destroyed:
+            self.rock_group.remove(rock)
+            self.rock_hash.remove(rock)
+        return ship_hits, len(destroyed)
+
+    def end_game(self):
+        """Game Over: останавливает игру и возвращает мир к первому уровню (счет остается для экрана Game Over)."""
+        self.game_over = True
+        self.started = False
+        self.events.append("music_stop")
+        self.reset_level()
+
+    def save_positions(self):
+        """Запоминает позиции объектов перед шагом (для интерполяции при отрисовке)."""
+        self.ship.save_position()
+        for group in (self.rock_group, self.missile_group):
+            group.save_positions()
+
+    def step(self):
+        """Один шаг симуляции фиксированной длительности."""
+        self.commands.execute(self)
+        self.save_positions()
+
+        if self.started:
+            self.rock_spawner()
+
+            # Проверка условия перехода на следующий уровень
+            if self.score >= self.score_to_next_level and self.grid.get_loot_count() == 0:
+                if self.next_level():
+                    # Переход на следующий уровень успешен; шаг все равно считается,
+                    # иначе команды этого и следующего шага попадут в запись с одним временем
+                    self.time += 1
+                    return
+                # Все уровни пройдены
+                self.started = False
+                self.levels_up = True
+
+        # Ракеты живут недолго и рядом с кораблем, грубо симулируются только камни
+        self.process_sprite_group(self.rock_group, self.active_region())
+        self.recycle(self.missile_pool, self.process_sprite_group(self.missile_group))
+        self.explosion_group.step(self.time)
+        loot_before = self.loot_collected
+        self.loot_collected = self.ship.update(self.started, self.grid, self.loot_collected, None,
+                                               self.width, self.height)
+        if self.loot_collected != loot_before:
+            self.events.append("loot")
+
+        # update lives and score
+        ship_hits, rock_hits = self.resolve_collisions()
+        if ship_hits:
+            self.lives -= 1
+        self.score += rock_hits
+
+        # Game Over
+        if self.lives <= 0:
+            self.end_game()
+        self.time += 1
+
+    def run(self, ticks):
+        """
+        Прогоняет симуляцию без отрисовки.
+        Args:
+            ticks: Количество шагов.
+        """
+        for _ in range(ticks):
+            self.step()
@@ -0,0 +1,89 @@
+"""
+    Общие настройки игры: размеры поля, темп симуляции, параметры уровней
+    и информация об изображениях игровых объектов.
+"""
+import os
+
+from utils.ImageInfo import ImageInfo
+
+# --- Поле и время --- #
+WIDTH = 800
+HEIGHT = 600
+FPS = 60  # число шагов симуляции в секунду
+TICK_MS = 1000 / FPS  # длительность одного шага симуляции в миллисекундах
+MAX_STEPS_PER_FRAME = 5  # сколько шагов можно догнать за один кадр отрисовки
+
+# --- Правила --- #
+CELL_SIZE = 50
+MAX_ROCK = 5
+LIVES = 3
+SCORE_TO_NEXT_LEVEL = 50
+LEVELS_DIR = "levels"
+
+# --- Большие уровни --- #
+CHUNK_CELLS = 16  # сторона чанка сетки в клетках
+MAX_CHUNK_LAYERS = 16  # сколько отрисованных чанков держать в памяти
+SIM_MARGIN = 200  # на сколько пикселей за краем экрана объекты симулируются каждый шаг
+COARSE_STEP = 4  # объекты дальше обновляются раз в столько шагов (сразу на столько шагов)
+
+# --- Ввод --- #
+SHOT_INTERVAL = 6  # минимум шагов между выстрелами из очереди команд (10 выстрелов в секунду)
+
+# --- Звук --- #
+MUSIC_DIR = "music"
+LEVEL_MUSIC = ["sound1.mp3", "soundtrack.mp3", "sound1.mp3"]  # трек для каждого уровня
+SFX_CHANNELS = 16
+# эффект -> (максимум голосов, окно склейки в мс, приоритет); подбор лута важнее всего
+SFX_RULES = {
+    "shoot": (3, 60, 1),
+    "explosion": (4, 40, 2),
+    "thrust": (1, 0, 3),
+    "loot": (2, 0, 10),
+}
+
+# --- Пулы объектов --- #
+MISSILE_POOL_SIZE = 64
+
+# --- Взрывы --- #
+EXPLOSION_FRAMES = 3
+EXPLOSION_FRAME_RATE = 0.08  # сколько кадров анимации проходит за один шаг
+EXPLOSION_FADE = None  # функция доли жизни (0..1) -> непрозрачность, например lambda p: 1 - p * p
+EXPLOSION_SCALE = None  # функция доли жизни (0..1) -> масштаб кадра
+
+# --- Атлас спрайтов --- #
+ATLAS_DIR = os.path.join(".cache", "atlas")
+# имя -> (папка, файл, размер); все варианты собираются в один лист (python -m utils.SpriteAtlas)
+ATLAS_SPRITES = {
+    "ship": ("sprites", "кот1.png", (92, 92)),
+    "flight": ("sprites", "кот2.png", (92, 92)),
+    "missile": ("sprites", "кот2.png", (20, 20)),  # снаряд - уменьшенный кот в полете
+    "asteroid": ("sprites", "пончик.png", (90, 90)),
+    "explosion1": ("boom", "взрыв 2.1.png", (90, 90)),
+    "explosion2": ("boom", "взрыв 3.1.png", (90, 90)),
+    "explosion3": ("boom", "взрыв 4.1.png", (90, 90)),
+    "wall": ("sprites", "туманность.png", (50, 50)),
+    "loot": ("sprites", "лут.png", (50, 50)),
+    # картинки справки на заставке
+    "instr_asteroid": ("sprites", "пончик.png", (40, 40)),
+    "instr_wall": ("sprites", "туманность.png", (40, 40)),
+    "instr_loot": ("sprites", "лут.png", (40, 40)),
+}
+
+# --- Информация об изображениях --- #
+debris_info = ImageInfo([320, 240], [640, 480])
+nebula_info = ImageInfo([400, 300], [800, 600])
+splash_info = ImageInfo([200, 150], [400, 300])
+ship_info = ImageInfo([45, 45], [90, 90], 35)
+missile_info = ImageInfo([5, 5], [10, 10], 3, 50)
+asteroid_info = ImageInfo([45, 45], [90, 90], 40)
+
+
+def level_path(number):
+    """
+    Возвращает путь к файлу уровня.
+    Args:
+        number: Номер уровня (начиная с 1).
+    Returns:
+        Путь к файлу уровня (str).
+    """
+    return os.path.join(LEVELS_DIR, f"level{number}.txt")
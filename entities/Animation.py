@@ -0,0 +1,170 @@
+import math
+from collections import deque
+
+import pygame
+
+
+class Animation:
+    """
+    Заранее рассчитанная таблица кадров анимации: для каждого шага жизни
+    хранится готовый кадр и смещение его левого верхнего угла от центра.
+    Затухание и масштаб (если заданы) тоже запекаются в таблицу, поэтому
+    при отрисовке не остается никаких вычислений, кроме сложения координат.
+    Без изображений (безголовый мир) таблица хранит только длительность.
+    """
+    def __init__(self, frames, frame_rate, fade=None, scale=None):
+        """
+        Инициализация.
+        Args:
+            frames: Список кадров (pygame.Surface или None).
+            frame_rate: Сколько кадров проходит за один шаг симуляции.
+            fade: Функция доли жизни (0..1) -> непрозрачность (0..1) или None.
+            scale: Функция доли жизни (0..1) -> масштаб кадра или None.
+        """
+        self.frames = list(frames)
+        self.frame_rate = frame_rate
+        self.length = math.ceil(len(self.frames) / frame_rate)  # время жизни в шагах
+        self.radius = 0  # радиус для отсечения за краем экрана
+        self.table = []  # шаг жизни -> (кадр, dx, dy) или None
+        baked = {}  # (кадр, непрозрачность, масштаб) -> запись таблицы, одинаковые шаги делят кадр
+        for age in range(self.length):
+            frame = self.frames[min(len(self.frames) - 1, int(age * frame_rate))]
+            if frame is None:
+                self.table.append(None)
+                continue
+            progress = age / self.length
+            alpha = int(round(255 * fade(progress))) if fade else 255
+            factor = round(scale(progress), 3) if scale else 1
+            key = (frame, alpha, factor)
+            entry = baked.get(key)
+            if entry is None:
+                entry = baked[key] = self._bake(frame, alpha, factor)
+                image, dx, dy = entry
+                far_x = max(abs(dx), abs(dx + image.get_width()))
+                far_y = max(abs(dy), abs(dy + image.get_height()))
+                self.radius = max(self.radius, math.hypot(far_x, far_y))
+            self.table.append(entry)
+
+    @staticmethod
+    def _bake(frame, alpha, factor):
+        """
+        Готовит кадр таблицы.
+        Args:
+            frame: Исходный кадр (pygame.Surface).
+            alpha: Непрозрачность 0..255.
+            factor: Масштаб.
+        Returns:
+            Кортеж (кадр, dx, dy): dx, dy - смещение левого верхнего угла кадра от центра.
+        """
+        if factor != 1:
+            width, height = frame.get_size()
+            frame = pygame.transform.smoothscale(frame, (max(1, round(width * factor)), max(1, round(height * factor))))
+        if alpha != 255:
+            frame = frame.copy()
+            frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        # Прозрачные поля кадра не рисуем: blit только непрозрачной части, смещение учитывает обрезку
+        bounds = frame.get_bounding_rect()
+        dx = bounds.x - frame.get_width() / 2
+        dy = bounds.y - frame.get_height() / 2
+        if bounds.size != frame.get_size() and bounds.width and bounds.height:
+            frame = frame.subsurface(bounds)
+        return frame, dx, dy
+
+
+class AnimationGroup:
+    """
+    Проигрываемые анимации (например, взрывы) в виде записей
+    (шаг создания, x, y) - без объектов-спрайтов. Записи одной анимации
+    живут одинаково долго и добавляются по порядку времени, поэтому
+    отжившие всегда стоят в начале очереди и удаляются с головы, а
+    отрисовка - это один проход по записям без вызовов blit.
+    """
+    def __init__(self):
+        self.animations = []  # номер анимации -> Animation
+        self.records = []  # номер анимации -> deque записей (шаг создания, x, y)
+
+    def register(self, animation):
+        """
+        Добавляет анимацию.
+        Args:
+            animation: Объект Animation.
+        Returns:
+            Номер анимации для add.
+        """
+        self.animations.append(animation)
+        self.records.append(deque())
+        return len(self.animations) - 1
+
+    def add(self, animation_id, tick, pos):
+        """
+        Запускает анимацию. Запись создается во время шага tick, первый кадр
+        показывается после этого шага.
+        Args:
+            animation_id: Номер анимации (см. register).
+            tick: Номер текущего шага.
+            pos: Позиция центра [x, y].
+        """
+        self.records[animation_id].append((tick, float(pos[0]), float(pos[1])))
+
+    def __len__(self):
+        return sum(len(records) for records in self.records)
+
+    def step(self, tick):
+        """
+        Удаляет отыгравшие анимации.
+        Args:
+            tick: Номер текущего шага.
+        Returns:
+            Сколько записей удалено.
+        """
+        removed = 0
+        for animation, records in zip(self.animations, self.records):
+            end = tick - animation.length
+            while records and records[0][0] <= end:
+                records.popleft()
+                removed += 1
+        return removed
+
+    def clear(self):
+        """Удаляет все записи."""
+        for records in self.records:
+            records.clear()
+
+    def blit_items(self, camera, tick, items):
+        """
+        Добавляет кадры всех анимаций в список пакетной отрисовки
+        (вне экрана - отсекаются), не обращаясь к экрану.
+        Args:
+            camera: Объект Camera.
+            tick: Текущее время мира (world.time).
+            items: Список пар (изображение, левый верхний угол) для Surface.blits.
+        """
+        to_screen = camera.to_screen
+        visible = camera.visible
+        append = items.append
+        for animation, records in zip(self.animations, self.records):
+            table = animation.table
+            radius = animation.radius
+            last = animation.length - 1
+            for start, x, y in records:
+                entry = table[min(last, max(0, tick - start - 1))]
+                if entry is None:
+                    continue
+                sx, sy = to_screen((x, y))
+                if visible((sx, sy), radius):
+                    frame, dx, dy = entry
+                    append((frame, (sx + dx, sy + dy)))
+
+    def draw(self, screen, camera, tick):
+        """
+        Отрисовка всех анимаций одним вызовом blits.
+        Args:
+            screen: Объект pygame.Surface, на котором рисуем.
+            camera: Объект Camera.
+            tick: Текущее время мира (world.time).
+        Returns:
+            Список прямоугольников экрана, на которых что-то нарисовано.
+        """
+        items = []
+        self.blit_items(camera, tick, items)
+        return screen.blits(items) if items else []
@@ -0,0 +1,335 @@
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для этого хранилища
+    np = None
+
+from utils.RotationCache import rotation_cache
+
+
+class EntityView:
+    """
+    Легкое представление одной сущности из EntityStore с интерфейсом Sprite,
+    чтобы существующий код отрисовки и столкновений работал без изменений.
+    """
+    __slots__ = ("store", "index")
+
+    def __init__(self, store, index):
+        """
+        Args:
+            store: Хранилище EntityStore.
+            index: Номер сущности в массивах хранилища.
+        """
+        self.store = store
+        self.index = index
+
+    @property
+    def pos(self):
+        return self.store.pos[self.index]
+
+    @property
+    def prev_pos(self):
+        return self.store.prev_pos[self.index]
+
+    @property
+    def vel(self):
+        return self.store.vel[self.index]
+
+    @property
+    def angle(self):
+        return float(self.store.angle[self.index])
+
+    @property
+    def age(self):
+        return int(self.store.age[self.index])
+
+    @property
+    def radius(self):
+        return float(self.store.radius[self.index])
+
+    @property
+    def image(self):
+        return self.store.images[self.index]
+
+    def get_position(self):
+        """
+        Возвращает текущую позицию сущности.
+        Returns:
+            Строка массива позиций [x, y].
+        """
+        return self.store.pos[self.index]
+
+    def get_radius(self):
+        """
+        Возвращает радиус сущности.
+        Returns:
+            Радиус (float).
+        """
+        return float(self.store.radius[self.index])
+
+    def save_position(self):
+        """Запоминает текущую позицию (хранилище обычно делает это сразу для всех)."""
+        self.store.prev_pos[self.index] = self.store.pos[self.index]
+
+    def blit_item(self, pos=None):
+        """
+        Готовит сущность к пакетной отрисовке (как Sprite.blit_item).
+        Args:
+            pos: Позиция для отрисовки [x, y] (необязательно, по умолчанию текущая позиция).
+        Returns:
+            Кортеж (изображение, левый верхний угол) для Surface.blits.
+        """
+        store = self.store
+        i = self.index
+        if pos is None:
+            pos = store.pos[i]
+        rotated_image = rotation_cache.get(store.images[i], store.angle[i])
+        return rotated_image, rotated_image.get_rect(center=(pos[0], pos[1])).topleft
+
+    def draw(self, screen, pos=None):
+        """
+        Отрисовка сущности на экране (как Sprite.draw).
+        Args:
+            screen: Объект pygame.Surface, представляющий экран для отрисовки.
+            pos: Позиция для отрисовки [x, y] (необязательно, по умолчанию текущая позиция).
+        Returns:
+            Прямоугольник экрана, на котором нарисован объект (pygame.Rect), или None.
+        """
+        return screen.blit(*self.blit_item(pos))
+
+
+class EntityStore:
+    """
+    Хранилище сущностей (камней и ракет) в виде структуры массивов NumPy.
+    Интегрирование, зацикливание по краям, истечение времени жизни и
+    столкновения кругов выполняются векторными операциями над всей группой.
+    Предоставляет тот же интерфейс, что и SpriteGroup, поэтому мир может
+    использовать его вместо множества спрайтов.
+    """
+    def __init__(self, width, height, capacity=256, wrap=True):
+        """
+        Инициализация хранилища.
+        Args:
+            width: Ширина игрового поля.
+            height: Высота игрового поля.
+            capacity: Начальная емкость массивов (растет по мере необходимости).
+            wrap: True, если поле зациклено по краям (учитывается при столкновениях).
+        """
+        if np is None:
+            raise ImportError("Для EntityStore нужен пакет numpy")
+        self.width = width
+        self.height = height
+        self.wrap = wrap
+        self.size = 0
+        self.capacity = 0
+        self.pos = np.zeros((0, 2))
+        self.prev_pos = np.zeros((0, 2))
+        self.vel = np.zeros((0, 2))
+        self.angle = np.zeros(0)
+        self.angle_vel = np.zeros(0)
+        self.age = np.zeros(0)
+        self.lifespan = np.zeros(0)
+        self.radius = np.zeros(0)
+        self.images = []  # изображения (объекты Python) по номеру сущности
+        self.views = []
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        """
+        Увеличивает емкость массивов с сохранением данных.
+        Args:
+            capacity: Новая емкость.
+        """
+        def resized(array):
+            new = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            new[:self.size] = array[:self.size]
+            return new
+
+        for name in ("pos", "prev_pos", "vel", "angle", "angle_vel", "age", "lifespan", "radius"):
+            setattr(self, name, resized(getattr(self, name)))
+        self.capacity = capacity
+
+    # --- Интерфейс группы --- #
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return iter(self.views[:self.size])
+
+    def __contains__(self, view):
+        return isinstance(view, EntityView) and view.store is self and view.index >= 0
+
+    def add(self, sprite):
+        """
+        Добавляет сущность, копируя поля из объекта Sprite.
+        Args:
+            sprite: Объект с атрибутами pos, vel, angle, angle_vel, image, radius, lifespan, age.
+        Returns:
+            EntityView для новой сущности.
+        """
+        if self.size == self.capacity:
+            self._grow(max(16, self.capacity * 2))
+        i = self.size
+        self.pos[i] = sprite.pos
+        self.prev_pos[i] = sprite.pos
+        self.vel[i] = sprite.vel
+        self.angle[i] = sprite.angle
+        self.angle_vel[i] = sprite.angle_vel
+        self.age[i] = sprite.age
+        self.radius[i] = sprite.radius
+        self.lifespan[i] = sprite.lifespan
+        view = EntityView(self, i)
+        if i < len(self.views):
+            self.images[i] = sprite.image
+            self.views[i] = view
+        else:
+            self.images.append(sprite.image)
+            self.views.append(view)
+        self.size += 1
+        return view
+
+    def _remove_index(self, i):
+        """
+        Удаляет сущность, перенося на ее место последнюю.
+        Args:
+            i: Номер удаляемой сущности.
+        """
+        last = self.size - 1
+        self.views[i].index = -1
+        if i != last:
+            for array in (self.pos, self.prev_pos, self.vel, self.angle, self.angle_vel,
+                          self.age, self.lifespan, self.radius):
+                array[i] = array[last]
+            self.images[i] = self.images[last]
+            self.views[i] = self.views[last]
+            self.views[i].index = i
+        self.images[last] = None
+        self.views[last] = None
+        self.size = last
+
+    def remove(self, view):
+        """
+        Удаляет сущность из хранилища.
+        Args:
+            view: EntityView этого хранилища.
+        """
+        if view not in self:
+            raise KeyError(view)
+        self._remove_index(view.index)
+
+    def discard(self, view):
+        """
+        Удаляет сущность, если она есть в хранилище.
+        Args:
+            view: EntityView.
+        """
+        if view in self:
+            self._remove_index(view.index)
+
+    def clear(self):
+        """Удаляет все сущности."""
+        for view in self.views[:self.size]:
+            view.index = -1
+        self.images = [None] * len(self.images)
+        self.views = [None] * len(self.views)
+        self.size = 0
+
+    def save_positions(self):
+        """Запоминает позиции всех сущностей перед шагом симуляции."""
+        n = self.size
+        self.prev_pos[:n] = self.pos[:n]
+
+    def step(self, width, height, region=None, tick=0, coarse=1):
+        """
+        Один шаг симуляции всей группы: движение, вращение, старение, удаление отживших.
+        Args:
+            width: Ширина игрового поля.
+            height: Высота игрового поля.
+            region: Область полной симуляции (cx, cy, half_w, half_h) или None - все поле.
+                Сущности вне области обновляются раз в coarse шагов сразу на coarse шагов.
+            tick: Номер текущего шага (для грубой симуляции).
+            coarse: Период обновления сущностей вне области.
+        Returns:
+            Список удаленных EntityView.
+        """
+        n = self.size
+        pos = self.pos[:n]
+        if region is None:
+            pos += self.vel[:n]
+            self.angle[:n] += self.angle_vel[:n]
+            self.age[:n] += 1
+        else:
+            cx, cy, half_w, half_h = region
+            near = np.all(self._offsets(pos - (cx, cy)) <= (half_w, half_h), axis=1)
+            steps = np.where(near, 1.0, coarse if tick % coarse == 0 else 0.0)
+            pos += self.vel[:n] * steps[:, None]
+            self.angle[:n] += self.angle_vel[:n] * steps
+            self.age[:n] += steps
+        np.mod(pos, (width, height), out=pos)
+        expired = np.flatnonzero(self.age[:n] >= self.lifespan[:n])
+        removed = []
+        # С конца, чтобы перенос последней сущности не сдвигал еще не удаленные
+        for i in expired[::-1]:
+            removed.append(self.views[i])
+            self._remove_index(i)
+        return removed
+
+    # --- Столкновения --- #
+    def _offsets(self, delta):
+        """
+        Переводит разности координат в кратчайшие с учетом зацикливания поля.
+        Args:
+            delta: Массив разностей [..., 2].
+        Returns:
+            Массив абсолютных разностей той же формы.
+        """
+        delta = np.abs(delta)
+        if self.wrap:
+            np.minimum(delta, (self.width, self.height) - delta, out=delta)
+        return delta
+
+    def query(self, pos, radius):
+        """
+        Находит сущности, круг которых пересекается с заданным кругом.
+        Args:
+            pos: Центр круга [x, y].
+            radius: Радиус круга.
+        Returns:
+            Список EntityView.
+        """
+        n = self.size
+        delta = self._offsets(self.pos[:n] - (pos[0], pos[1]))
+        reach = self.radius[:n] + radius
+        hits = np.flatnonzero((delta * delta).sum(axis=1) <= reach * reach)
+        return [self.views[i] for i in hits]
+
+    def pairs(self, other, block=1 << 20):
+        """
+        Находит все пары пересекающихся кругов между этим и другим хранилищем.
+        Расстояния считаются матрицей блоками строк, чтобы ограничить память.
+        Args:
+            other: Другое хранилище EntityStore.
+            block: Максимальное число пар в одном блоке вычислений.
+        Returns:
+            Список пар (EntityView этого хранилища, EntityView другого хранилища)
+            в порядке (номер в другом хранилище, номер в этом) - так же, как у SpatialHash.pairs.
+        """
+        n = self.size
+        m = other.size
+        if not n or not m:
+            return []
+        other_pos = other.pos[:m]
+        other_radius = other.radius[:m]
+        rows = max(1, block // m)
+        found_i = []
+        found_j = []
+        for start in range(0, n, rows):
+            stop = min(n, start + rows)
+            delta = self._offsets(self.pos[start:stop, None, :] - other_pos[None, :, :])
+            reach = self.radius[start:stop, None] + other_radius[None, :]
+            ii, jj = np.nonzero((delta * delta).sum(axis=2) <= reach * reach)
+            found_i.append(ii + start)
+            found_j.append(jj)
+        ii = np.concatenate(found_i)
+        jj = np.concatenate(found_j)
+        order = np.lexsort((ii, jj))
+        return [(self.views[i], other.views[j]) for i, j in zip(ii[order], jj[order])]
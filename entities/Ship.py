@@ -1,14 +1,24 @@
 import pygame
 import math
 
-from utils.vector import dist, angle_to_vector
+from utils.RotationCache import rotation_cache
+from utils.vector import angle_to_vector, wrapped_delta
 from entities.Sprite import Sprite
 
 
 class Ship:
     """
     Класс, представляющий корабль игрока.
+    Поля хранятся в слотах, позиция и скорость - числами с плавающей точкой;
+    радиус берется из описателя типа ImageInfo, а параметры управления общие
+    для всех кораблей и заданы на классе.
     """
+    __slots__ = ("x", "y", "prev_x", "prev_y", "vx", "vy", "thrust", "angle", "image", "info",
+                 "target_pos", "initial_distance", "wrap_steering", "original_image", "flight_image")
+    acceleration_rate = 0.1
+    max_speed = 5
+    deceleration_range = 0.5
+
     def __init__(self, pos, vel, angle, image, info, flight_image):
         """
         Args:
@@ -16,37 +26,63 @@ class Ship:
             vel: Начальная скорость корабля [x, y].
             angle: Начальный угол поворота корабля (в радианах).
             image: Объект pygame.Surface, представляющий изображение корабля.
-            info: Объект ImageInfo, содержащий информацию об изображении.
+            info: Объект ImageInfo - описатель типа корабля.
             flight_image: Изображение корабля в состоянии полета.
         """
-        self.pos = list(pos)
-        self.vel = list(vel)
+        self.x = self.prev_x = float(pos[0])
+        self.y = self.prev_y = float(pos[1])
+        self.vx = float(vel[0])
+        self.vy = float(vel[1])
         self.thrust = False
         self.angle = angle
-        self.angle_vel = 0
         self.image = image
-        self.image_center = info.get_center()
-        self.image_size = info.get_size()
-        self.radius = info.get_radius()
+        self.info = info
         self.target_pos = None
         self.initial_distance = 0
-        self.acceleration_rate = 0.1
-        self.max_speed = 5
-        self.deceleration_range = 0.5
+        self.wrap_steering = False  # лететь к цели кратчайшим путем через край поля
         self.original_image = image
         self.flight_image = flight_image
-        self.is_shooting = False
 
-    def draw(self, screen):
+    @property
+    def pos(self):
+        """Текущая позиция (x, y)."""
+        return self.x, self.y
+
+    @property
+    def prev_pos(self):
+        """Позиция до последнего шага симуляции (x, y)."""
+        return self.prev_x, self.prev_y
+
+    @property
+    def vel(self):
+        """Скорость (x, y)."""
+        return self.vx, self.vy
+
+    @property
+    def radius(self):
+        return self.info.radius
+
+    def blit_item(self, pos=None):
+        """
+        Готовит корабль к пакетной отрисовке, не обращаясь к экрану.
+        Args:
+            pos: Позиция для отрисовки [x, y] (необязательно, по умолчанию текущая позиция).
+        Returns:
+            Кортеж (изображение, левый верхний угол) для Surface.blits.
+        """
+        rotated_image = rotation_cache.get(self.image, self.angle)
+        return rotated_image, rotated_image.get_rect(center=(self.x, self.y) if pos is None else pos).topleft
+
+    def draw(self, screen, pos=None):
         """
         Отрисовка корабля на экране.
         Args:
             screen: Объект pygame.Surface, представляющий экран для отрисовки.
+            pos: Позиция для отрисовки [x, y] (необязательно, по умолчанию текущая позиция).
+        Returns:
+            Прямоугольник экрана, на котором нарисован объект (pygame.Rect), или None.
         """
-        img_rect = self.image.get_rect(center=self.image_center)
-        rotated_image = pygame.transform.rotate(self.image, math.degrees(self.angle))
-        new_rect = rotated_image.get_rect(center=self.pos)
-        screen.blit(rotated_image, new_rect.topleft)
+        return screen.blit(*self.blit_item(pos))
 
     def update(self, started, grid, loot_collected, loot_sound, width, height):
         """
@@ -55,7 +91,7 @@ class Ship:
             started: Флаг, указывающий, началась ли игра.
             grid: Объект Grid, представляющий карту уровня.
             loot_collected: Переменная, хранящая количество собранной добычи.
-            loot_sound: Звук, воспроизводимый при сборе добычи.
+            loot_sound: Звук, воспроизводимый при сборе добычи (или None).
             width: Ширина игрового поля.
             height: Высота игрового поля.
         Returns:
@@ -63,53 +99,52 @@ class Ship:
         """
         if started:
             if self.target_pos:
-                distance_to_target = dist(self.pos, self.target_pos)
-                angle_to_target = math.atan2(
-                    self.target_pos[1] - self.pos[1],
-                    self.target_pos[0] - self.pos[0]
-                )
+                dx, dy = self._target_delta(width, height)
+                distance_to_target = math.sqrt(dx ** 2 + dy ** 2)
+                angle_to_target = math.atan2(dy, dx)
                 self.angle = -angle_to_target
 
                 if distance_to_target > self.initial_distance * self.deceleration_range:
                     acceleration_direction = angle_to_vector(-self.angle)
-                    self.vel[0] += acceleration_direction[0] * self.acceleration_rate
-                    self.vel[1] += acceleration_direction[1] * self.acceleration_rate
+                    self.vx += acceleration_direction[0] * self.acceleration_rate
+                    self.vy += acceleration_direction[1] * self.acceleration_rate
 
-                    speed = math.sqrt(self.vel[0] ** 2 + self.vel[1] ** 2)
+                    speed = math.sqrt(self.vx ** 2 + self.vy ** 2)
                     if speed > self.max_speed:
                         scale = self.max_speed / speed
-                        self.vel[0] *= scale
-                        self.vel[1] *= scale
+                        self.vx *= scale
+                        self.vy *= scale
                 else:
                     deceleration_speed = 0.95
-                    self.vel[0] *= deceleration_speed
-                    self.vel[1] *= deceleration_speed
+                    self.vx *= deceleration_speed
+                    self.vy *= deceleration_speed
 
                     if distance_to_target < 5:
                         self.target_pos = None
-                        self.vel = [0, 0]
-
-            new_x = (self.pos[0] + self.vel[0]) % width
-            new_y = (self.pos[1] + self.vel[1]) % height
+                        self.vx = self.vy = 0.0
 
-            ship_col = int(new_x // grid.cell_size)
-            ship_row = int(new_y // grid.cell_size)
+            new_x = (self.x + self.vx) % width
+            new_y = (self.y + self.vy) % height
 
-            if not grid.is_obstacle(new_x, new_y):
-                self.pos[0] = new_x
-                self.pos[1] = new_y
+            # Стены и лут проверяются по кругу корабля, а не по клетке его центра.
+            # Если корабль уже задевает стену (например, после смены уровня), даем ему выйти.
+            radius = self.info.radius
+            if not grid.circle_hits_wall(new_x, new_y, radius) or grid.circle_hits_wall(self.x, self.y, radius):
+                self.x = new_x
+                self.y = new_y
 
-            if 0 <= ship_row < grid.height and 0 <= ship_col < grid.width and grid.grid[ship_row][ship_col] == '@':
+            for row, col in grid.loot_in_circle(self.x, self.y, radius):
+                grid.collect_loot(row, col)
                 loot_collected += 1
-                grid.grid[ship_row][ship_col] = '.'
-                loot_sound.play()
+                if loot_sound:
+                    loot_sound.play()
 
             if self.thrust:
                 acc = angle_to_vector(self.angle)
-                self.vel[0] += acc[0] * 0.1
-                self.vel[1] += acc[1] * 0.1
-            self.vel[0] *= 0.99
-            self.vel[1] *= 0.99
+                self.vx += acc[0] * 0.1
+                self.vy += acc[1] * 0.1
+            self.vx *= 0.99
+            self.vy *= 0.99
         return loot_collected
 
     def set_thrust(self, on, started, ship_thrust_sound):
@@ -118,27 +153,17 @@ class Ship:
         Args:
             on: True для включения тяги, False для выключения.
             started: Флаг, указывающий, началась ли игра.
-            ship_thrust_sound: Звук тяги корабля.
+            ship_thrust_sound: Звук тяги корабля (или None).
         """
         self.thrust = on
+        if not ship_thrust_sound:
+            return
         if on and started:
             ship_thrust_sound.play()
         else:
             ship_thrust_sound.stop()
 
-    def increment_angle_vel(self):
-        """
-        Увеличение угловой скорости вращения корабля.
-        """
-        self.angle_vel += 0.05
-
-    def decrement_angle_vel(self):
-        """
-        Уменьшение угловой скорости вращения корабля.
-        """
-        self.angle_vel -= 0.05
-
-    def shoot(self, missile_group, started, missile_image, missile_info, missile_sound, ship_info):
+    def shoot(self, missile_group, started, missile_image, missile_info, missile_sound, ship_info, pool=None):
         """
         Выстрел ракеты.
         Args:
@@ -148,23 +173,38 @@ class Ship:
             missile_info: Объект ImageInfo, содержащий информацию об изображении ракеты.
             missile_sound: Звук выстрела ракеты.
             ship_info:  Объект ImageInfo, содержащий информацию об изображении корабля.
+            pool: Пул ракет Pool (необязательно); без него ракета создается заново.
+        Returns:
+            Созданная ракета или None, если игра не началась.
         """
         if started:
             forward = angle_to_vector(-self.angle)
-            missile_pos = [self.pos[0] + self.radius * forward[0], self.pos[1] + self.radius * forward[1]]
-            missile_vel = [self.vel[0] + 6 * forward[0], self.vel[1] + 6 * forward[1]]
-            missile = Sprite(missile_pos, missile_vel, self.angle, 0, missile_image, missile_info, missile_sound)
+            radius = self.info.radius
+            missile_pos = (self.x + radius * forward[0], self.y + radius * forward[1])
+            missile_vel = (self.vx + 6 * forward[0], self.vy + 6 * forward[1])
+            if pool:
+                missile = pool.acquire(missile_pos, missile_vel, self.angle, 0, missile_image, missile_info, missile_sound)
+            else:
+                missile = Sprite(missile_pos, missile_vel, self.angle, 0, missile_image, missile_info, missile_sound)
             missile_group.add(missile)
             self.set_image(self.flight_image, ship_info, (92, 92))
-            self.is_shooting = True
+            return missile
+        return None
+
+    def save_position(self):
+        """
+        Запоминает текущую позицию перед шагом симуляции (для интерполяции при отрисовке).
+        """
+        self.prev_x = self.x
+        self.prev_y = self.y
 
     def get_position(self):
         """
         Возвращает текущую позицию корабля.
         Returns:
-            Список [x, y], представляющий позицию корабля.
+            Кортеж (x, y), представляющий позицию корабля.
         """
-        return self.pos
+        return self.x, self.y
 
     def get_radius(self):
         """
@@ -172,21 +212,21 @@ class Ship:
         Returns:
             Радиус корабля (int).
         """
-        return self.radius
+        return self.info.radius
+
     def set_image(self, image, ship_info, size=None):
         """
         Устанавливает новое изображение для корабля.
         Args:
             image: Объект pygame.Surface, представляющий изображение корабля.
-            ship_info: Объект ImageInfo, содержащий информацию об изображении корабля.
+            ship_info: Объект ImageInfo - описатель типа корабля.
             size: Новый размер изображения (необязательно).
         """
-        if size:
+        if size and image is not None and image.get_size() != tuple(size):
             self.image = pygame.transform.scale(image, size)
         else:
             self.image = image
-        self.image_center = ship_info.get_center()
-        self.image_size = ship_info.get_size()
+        self.info = ship_info
 
     def reset_image(self, ship_info):
         """
@@ -195,16 +235,34 @@ class Ship:
             ship_info:  Объект ImageInfo, содержащий информацию об изображении корабля.
         """
         self.set_image(self.original_image, ship_info, (92, 92))
-        self.is_shooting = False
 
-    def set_target_position(self, pos):
+    def set_target_position(self, pos, width, height, wrap=False):
         """
         Устанавливает целевую позицию для движения к мыши.
         Args:
-            pos: Позиция мыши [x, y].
+            pos: Позиция мыши [x, y] в мировых координатах.
+            width: Ширина игрового поля.
+            height: Высота игрового поля.
+            wrap: Лететь к цели кратчайшим путем через край поля (для полей больше экрана,
+                где цель за краем видна по ту сторону шва). По умолчанию - прямо к точке.
+        """
+        self.wrap_steering = wrap
+        self.target_pos = [pos[0] % width, pos[1] % height] if wrap else pos
+        dx, dy = self._target_delta(width, height)
+        self.initial_distance = math.sqrt(dx ** 2 + dy ** 2)
+
+    def _target_delta(self, width, height):
+        """
+        Вектор от корабля к цели.
+        Args:
+            width: Ширина игрового поля.
+            height: Высота игрового поля.
+        Returns:
+            Кортеж (dx, dy).
         """
-        self.target_pos = pos
-        self.initial_distance = dist(self.pos, self.target_pos)
+        if self.wrap_steering:
+            return wrapped_delta((self.x, self.y), self.target_pos, width, height)
+        return self.target_pos[0] - self.x, self.target_pos[1] - self.y
 
     def reset(self, width, height):
         """
@@ -213,7 +271,8 @@ class Ship:
             width: Ширина игрового поля.
             height: Высота игрового поля.
         """
-        self.pos = [width / 2, height / 2]
-        self.vel = [0, 0]
+        self.x = self.prev_x = width / 2
+        self.y = self.prev_y = height / 2
+        self.vx = self.vy = 0.0
         self.angle = 0
         self.target_pos = None
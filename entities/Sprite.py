@@ -1,13 +1,17 @@
-import pygame
-import math
-
+from utils.RotationCache import rotation_cache
 from utils.vector import dist
 
 
 class Sprite:
     """
     Базовый класс для игровых спрайтов.
+    Компактный объект: поля хранятся в слотах (без словаря экземпляра),
+    позиция и скорость - отдельными числами с плавающей точкой, а общие для
+    всех объектов одного типа данные (радиус, время жизни и т.п.) не
+    копируются, а берутся из описателя типа ImageInfo.
     """
+    __slots__ = ("x", "y", "prev_x", "prev_y", "vx", "vy", "angle", "angle_vel", "image", "info", "age")
+
     def __init__(self, pos, vel, ang, ang_vel, image, info, sound=None):
         """
         Инициализация спрайта.
@@ -18,62 +22,110 @@ class Sprite:
             ang: Начальный угол поворота спрайта (в радианах).
             ang_vel: Угловая скорость вращения спрайта (в радианах в секунду).
             image: Объект pygame.Surface, представляющий изображение спрайта.
-            info: Объект ImageInfo, содержащий информацию об изображении.
+            info: Объект ImageInfo - описатель типа (общий для всех спрайтов этого типа).
             sound: Объект pygame.mixer.Sound (необязательно), звук, воспроизводимый при создании спрайта.
         """
-        self.pos = list(pos)  # Создаем копию, чтобы не изменять исходный список
-        self.vel = list(vel)  # Создаем копию, чтобы не изменять исходный список
+        self.reset(pos, vel, ang, ang_vel, image, info, sound)
+
+    def reset(self, pos, vel, ang, ang_vel, image, info, sound=None):
+        """
+        Повторная инициализация спрайта на месте (используется пулом объектов).
+        Аргументы те же, что у конструктора.
+        """
+        self.x = self.prev_x = float(pos[0])
+        self.y = self.prev_y = float(pos[1])
+        self.vx = float(vel[0])
+        self.vy = float(vel[1])
         self.angle = ang
         self.angle_vel = ang_vel
         self.image = image
-        self.image_center = info.get_center()
-        self.image_size = info.get_size()
-        self.radius = info.get_radius()
-        self.lifespan = info.get_lifespan()
-        self.animated = info.get_animated()
+        self.info = info
         self.age = 0
         if sound:
             sound.play()
 
-    def draw(self, screen):
+    @property
+    def pos(self):
+        """Текущая позиция (x, y)."""
+        return self.x, self.y
+
+    @property
+    def prev_pos(self):
+        """Позиция до последнего шага симуляции (x, y)."""
+        return self.prev_x, self.prev_y
+
+    @property
+    def vel(self):
+        """Скорость (x, y)."""
+        return self.vx, self.vy
+
+    @property
+    def radius(self):
+        return self.info.radius
+
+    @property
+    def lifespan(self):
+        return self.info.lifespan
+
+    def blit_item(self, pos=None):
+        """
+        Готовит спрайт к пакетной отрисовке, не обращаясь к экрану.
+        Args:
+            pos: Позиция для отрисовки [x, y] (необязательно, по умолчанию текущая позиция).
+        Returns:
+            Кортеж (изображение, левый верхний угол) для Surface.blits.
+        """
+        if pos is None:
+            pos = self.pos
+        if self.info.animated:
+            # Предполагается, что анимированные изображения обрабатываются иначе. Это заполнитель.
+            return self.image, pos  # Базовая отрисовка, требует правильной обработки анимации
+        rotated_image = rotation_cache.get(self.image, self.angle)
+        return rotated_image, rotated_image.get_rect(center=pos).topleft
+
+    def draw(self, screen, pos=None):
         """
         Отрисовка спрайта на экране.
         Args:
             screen: Объект pygame.Surface, представляющий экран для отрисовки.
+            pos: Позиция для отрисовки [x, y] (необязательно, по умолчанию текущая позиция).
+        Returns:
+            Прямоугольник экрана, на котором нарисован спрайт (pygame.Rect).
         """
-        if self.animated:
-            # Предполагается, что анимированные изображения обрабатываются иначе. Это заполнитель.
-            screen.blit(self.image, self.pos)  # Базовая отрисовка, требует правильной обработки анимации
-        else:
-            img_rect = self.image.get_rect(center=self.image_center)
-            rotated_image = pygame.transform.rotate(self.image, math.degrees(self.angle))
-            new_rect = rotated_image.get_rect(center=self.pos)
-            screen.blit(rotated_image, new_rect.topleft)
+        return screen.blit(*self.blit_item(pos))
 
-    def update(self, width, height):
+    def update(self, width, height, steps=1):
         """
         Обновление состояния спрайта.
         Args:
             width: Ширина игрового поля.
             height: Высота игрового поля.
+            steps: На сколько шагов продвинуть спрайт сразу (для грубой симуляции вдали от камеры).
         Returns:
             True, если спрайт достиг конца своего жизненного цикла, False в противном случае.
         """
         # Обновляем угол
-        self.angle += self.angle_vel
+        self.angle += self.angle_vel * steps
         # Обновляем позицию
-        self.pos[0] = (self.pos[0] + self.vel[0]) % width
-        self.pos[1] = (self.pos[1] + self.vel[1]) % height
-        self.age += 1
-        return self.age >= self.lifespan
+        self.x = (self.x + self.vx * steps) % width
+        self.y = (self.y + self.vy * steps) % height
+        self.age += steps
+        return self.age >= self.info.lifespan
+
+    def save_position(self):
+        """
+        Запоминает текущую позицию перед шагом симуляции (для интерполяции при отрисовке).
+        """
+        self.prev_x = self.x
+        self.prev_y = self.y
 
     def get_position(self):
         """
         Возвращает текущую позицию спрайта.
         Returns:
-            Список [x, y], представляющий позицию спрайта.
+            Кортеж (x, y), представляющий позицию спрайта.
         """
-        return self.pos
+        return self.x, self.y
 
     def get_radius(self):
         """
@@ -81,7 +133,7 @@ class Sprite:
         Returns:
             Радиус спрайта (int).
         """
-        return self.radius
+        return self.info.radius
 
     def collide(self, other):
         """
@@ -91,5 +143,5 @@ class Sprite:
         Returns:
             True, если спрайты сталкиваются, False в противном случае.
         """
-        distance = dist(self.pos, other.get_position())
-        return distance <= (self.radius + other.get_radius())
+        distance = dist((self.x, self.y), other.get_position())
+        return distance <= (self.info.radius + other.get_radius())
@@ -0,0 +1,65 @@
+class SpriteGroup(dict):
+    """
+    Группа спрайтов на обычных объектах Python: упорядоченное множество
+    (словарь без значений) с групповыми операциями. Обход идет в порядке
+    добавления, а не по адресам объектов, поэтому запуск с тем же зерном
+    и теми же командами повторяется точно.
+    Тот же интерфейс предоставляет EntityStore на массивах NumPy.
+    """
+    def __init__(self, sprites=()):
+        super().__init__((sprite, None) for sprite in sprites)
+        self.expired = []  # Переиспользуемый список удаленных за шаг спрайтов
+
+    def add(self, sprite):
+        """Добавляет спрайт в конец группы."""
+        self[sprite] = None
+
+    def remove(self, sprite):
+        """Удаляет спрайт из группы (KeyError, если его там нет)."""
+        del self[sprite]
+
+    def discard(self, sprite):
+        """Удаляет спрайт из группы, если он там есть."""
+        self.pop(sprite, None)
+
+    def save_positions(self):
+        """Запоминает позиции всех спрайтов перед шагом симуляции."""
+        for sprite in self:
+            sprite.save_position()
+
+    def step(self, width, height, region=None, tick=0, coarse=1):
+        """
+        Обновляет каждый спрайт один раз и удаляет отжившие.
+        Args:
+            width: Ширина игрового поля.
+            height: Высота игрового поля.
+            region: Область полной симуляции (cx, cy, half_w, half_h) или None - все поле.
+                Спрайты вне области обновляются раз в coarse шагов сразу на coarse шагов.
+            tick: Номер текущего шага (для грубой симуляции).
+            coarse: Период обновления спрайтов вне области.
+        Returns:
+            Список удаленных спрайтов (действителен до следующего вызова step).
+        """
+        expired = self.expired
+        expired.clear()
+        if region is None:
+            for sprite in self:
+                if sprite.update(width, height):
+                    expired.append(sprite)
+        else:
+            cx, cy, half_w, half_h = region
+            far_steps = coarse if tick % coarse == 0 else 0
+            for sprite in self:
+                dx = abs(sprite.x - cx)
+                dy = abs(sprite.y - cy)
+                if min(dx, width - dx) <= half_w and min(dy, height - dy) <= half_h:
+                    steps = 1
+                elif far_steps:
+                    steps = far_steps
+                else:
+                    continue
+                if sprite.update(width, height, steps):
+                    expired.append(sprite)
+        for sprite in expired:  # Удаляем после обхода, без копирования множества
+            self.remove(sprite)
+        return expired
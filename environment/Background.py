@@ -1,35 +1,90 @@
+import pygame
+
+
 class Background:
     """
-    Класс, представляющий фон игрового поля.
+    Класс, представляющий фон игрового поля: неподвижная туманность и
+    движущийся слой обломков (параллакс).
+    Туманность один раз переводится в непрозрачную поверхность формата экрана,
+    а обломки один раз раскладываются на широкую полосу, так что кадр фона -
+    это один непрозрачный blit и один blit части полосы. Подготовленные
+    туманности хранятся в кэше и переживают рестарты и смену уровней.
     """
-    def __init__(self, image):
+    def __init__(self, size, debris_image=None, speed=0.25):
         """
         Инициализация фона.
         Args:
-            image: Объект pygame.Surface, представляющий изображение фона.
+            size: Размер экрана (w, h).
+            debris_image: Объект pygame.Surface со слоем обломков (необязательно).
+            speed: Скорость обломков в пикселях за шаг симуляции.
         """
-        self.image = image
-        self.rect = image.get_rect()
-        self.rect.topleft = (0, 0)  # Позиция в верхнем левом углу
+        self.width, self.height = size
+        self.speed = speed
+        self.layers = {}  # исходная туманность -> непрозрачная поверхность формата экрана
+        self.strip = None
+        self.set_debris(debris_image)
 
-    def draw(self, screen):
+    def _surface(self, size, flags=0):
         """
-        Отрисовка фона на экране.
+        Создает поверхность в формате экрана (если окно уже открыто).
+        Args:
+            size: Размер (w, h).
+            flags: Флаги pygame.Surface.
+        Returns:
+            Объект pygame.Surface.
+        """
+        display = pygame.display.get_surface()
+        if display is None:
+            return pygame.Surface(size, flags)
+        surface = pygame.Surface(size, flags)
+        return surface.convert_alpha() if flags & pygame.SRCALPHA else surface.convert(display)
+
+    def set_debris(self, debris_image):
+        """
+        Раскладывает обломки на полосу шириной в два экрана. Две копии стоят
+        там же, где их раньше рисовали два отдельных blit (на полэкрана левее
+        и правее смещения), поэтому кадр - это окно полосы шириной в экран.
+        Args:
+            debris_image: Объект pygame.Surface или None.
+        """
+        self.debris_image = debris_image
+        if debris_image is None:
+            self.strip = None
+            return
+        self.strip = self._surface((2 * self.width, debris_image.get_height()), pygame.SRCALPHA)
+        self.strip.fill((0, 0, 0, 0))
+        self.strip.blit(debris_image, (self.width // 2, 0))
+        self.strip.blit(debris_image, (self.width // 2 + self.width, 0))
+
+    def layer_for(self, nebula):
+        """
+        Возвращает непрозрачную туманность, подготавливая ее только при первом запросе.
         Args:
-            screen: Объект pygame.Surface, представляющий экран для отрисовки.
+            nebula: Объект pygame.Surface с туманностью.
+        Returns:
+            Непрозрачный pygame.Surface размера экрана.
         """
-        screen.blit(self.image, self.rect)
+        layer = self.layers.get(nebula)
+        if layer is None:
+            layer = self._surface((self.width, self.height))
+            layer.fill((0, 0, 0))
+            layer.blit(nebula, (0, 0))
+            self.layers[nebula] = layer
+        return layer
 
-    def set_image(self, new_image):
+    def draw(self, screen, nebula, time_value):
         """
-        Изменение изображения фона.
+        Отрисовка фона на экране.
         Args:
-            new_image: Новый объект pygame.Surface для использования в качестве фона.
+            screen: Объект pygame.Surface, на котором рисуем.
+            nebula: Объект pygame.Surface с туманностью уровня.
+            time_value: Время в шагах симуляции (задает смещение обломков).
         """
-        self.image = new_image
-        self.rect = new_image.get_rect()
-        self.rect.topleft = (0, 0)
+        screen.blit(self.layer_for(nebula), (0, 0))
+        if self.strip is not None:
+            offset = int(time_value * self.speed) % self.width
+            screen.blit(self.strip, (0, 0), (self.width - offset, 0, self.width, self.strip.get_height()))
 
-    def reset(self):
-        """Сбрасывает сетку к начальному состоянию."""
-        self.grid = [["." for _ in range(self.width)] for _ in range(self.height)]
+    def clear(self):
+        """Забывает подготовленные туманности (например, после смены разрешения)."""
+        self.layers.clear()
@@ -1,11 +1,70 @@
+from collections import OrderedDict
+
 import pygame
 
+EMPTY, WALL, LOOT = 0, 1, 2
+CELL_CHARS = ".#@"  # Символ клетки в текстовом уровне по ее типу
+CELL_TYPES = {char: kind for kind, char in enumerate(CELL_CHARS)}
+
+
+class GridRow:
+    """
+    Строка сетки для доступа grid[row][col] поверх массива клеток.
+    """
+    __slots__ = ("grid", "row")
+
+    def __init__(self, grid, row):
+        self.grid = grid
+        self.row = row
+
+    def __getitem__(self, col):
+        if not 0 <= col < self.grid.width:
+            raise IndexError("col out of range")
+        return CELL_CHARS[self.grid.cells[self.row * self.grid.width + col]]
+
+    def __setitem__(self, col, value):
+        if not 0 <= col < self.grid.width:
+            raise IndexError("col out of range")
+        self.grid.set_cell(self.row, col, value)
+
+    def __len__(self):
+        return self.grid.width
+
+    def __iter__(self):
+        start = self.row * self.grid.width
+        return (CELL_CHARS[kind] for kind in self.grid.cells[start:start + self.grid.width])
+
+    def count(self, value):
+        start = self.row * self.grid.width
+        return self.grid.cells.count(CELL_TYPES[value], start, start + self.grid.width)
+
+
+class GridView:
+    """
+    Представление сетки в виде списка строк, как раньше (grid.grid[row][col]).
+    """
+    __slots__ = ("grid",)
+
+    def __init__(self, grid):
+        self.grid = grid
+
+    def __getitem__(self, row):
+        if not 0 <= row < self.grid.height:
+            raise IndexError("row out of range")
+        return GridRow(self.grid, row)
+
+    def __len__(self):
+        return self.grid.height
+
+    def __iter__(self):
+        return (GridRow(self.grid, row) for row in range(self.grid.height))
+
 
 class Grid:
     """
     Класс, представляющий сетку игрового поля.
     """
-    def __init__(self, width, height, cell_size, wall_image, loot_image):
+    def __init__(self, width, height, cell_size, wall_image, loot_image, chunk_cells=16, max_chunks=16):
         """
         Инициализация сетки.
         Args:
@@ -14,34 +73,187 @@ class Grid:
             cell_size: Размер одной ячейки в пикселях.
             wall_image: Объект pygame.Surface, представляющий изображение стены.
             loot_image: Объект pygame.Surface, представляющий изображение добычи.
+            chunk_cells: Сторона чанка в клетках (сетка рисуется по чанкам).
+            max_chunks: Сколько отрисованных чанков держать в памяти.
         """
         self.width = width
         self.height = height
         self.cell_size = cell_size
-        self.grid = [["." for _ in range(width)] for _ in range(height)]
-        self.wall_image = wall_image
-        self.loot_image = loot_image
+        self.cells = bytearray(width * height)  # Тип каждой клетки, по строкам
+        self.wall_mask = 0  # Битовая маска стен: бит row * width + col
+        self.loot_mask = 0  # Битовая маска клеток с лутом
+        self.loot_count = 0  # Количество лута, поддерживается при каждом изменении клетки
+        self.grid = GridView(self)  # Доступ вида grid[row][col] -> ".", "#" или "@"
+        self.wall_image = self._fit_image(wall_image)
+        self.loot_image = self._fit_image(loot_image)
+        self.chunk_cells = chunk_cells
+        self.max_chunks = max_chunks
+        # Отрисованные чанки (chunk_row, chunk_col) -> прозрачный слой; давно не видимые выгружаются
+        self.chunks = OrderedDict()
+        self.dirty_cells = set()  # Клетки (row, col), изменившиеся с последней отрисовки
+
+    def _fit_image(self, image):
+        """
+        Масштабирует изображение клетки под размер ячейки (один раз, при создании сетки).
+        Args:
+            image: Объект pygame.Surface или None.
+        Returns:
+            Изображение размера cell_size x cell_size или None.
+        """
+        if image is not None and image.get_size() != (self.cell_size, self.cell_size):
+            image = pygame.transform.scale(image, (self.cell_size, self.cell_size))
+        return image
+
+    def _draw_cell(self, layer, row, col):
+        """
+        Перерисовывает одну клетку на слое ее чанка.
+        Args:
+            layer: Слой чанка (pygame.Surface).
+            row: Номер строки ячейки.
+            col: Номер столбца ячейки.
+        """
+        x = (col % self.chunk_cells) * self.cell_size
+        y = (row % self.chunk_cells) * self.cell_size
+        layer.fill((0, 0, 0, 0), (x, y, self.cell_size, self.cell_size))
+        kind = self.cells[row * self.width + col]
+        if kind == WALL:
+            image = self.wall_image
+        elif kind == LOOT:
+            image = self.loot_image
+        else:
+            image = None
+        if image is not None:
+            layer.blit(image, (x, y))
+
+    def _build_chunk(self, chunk_row, chunk_col):
+        """
+        Отрисовывает клетки чанка на новый прозрачный слой.
+        Args:
+            chunk_row: Номер строки чанка.
+            chunk_col: Номер столбца чанка.
+        Returns:
+            Слой чанка (pygame.Surface).
+        """
+        first_row = chunk_row * self.chunk_cells
+        first_col = chunk_col * self.chunk_cells
+        rows = min(self.chunk_cells, self.height - first_row)
+        cols = min(self.chunk_cells, self.width - first_col)
+        layer = pygame.Surface((cols * self.cell_size, rows * self.cell_size), pygame.SRCALPHA)
+        cells = self.cells
+        for row in range(first_row, first_row + rows):
+            start = row * self.width
+            for col in range(first_col, first_col + cols):
+                if cells[start + col] != EMPTY:
+                    self._draw_cell(layer, row, col)
+        return layer
+
+    def _chunk(self, chunk_row, chunk_col):
+        """
+        Возвращает слой чанка, отрисовывая его при первом обращении
+        и выгружая давно не видимые чанки сверх лимита.
+        Args:
+            chunk_row: Номер строки чанка.
+            chunk_col: Номер столбца чанка.
+        Returns:
+            Слой чанка (pygame.Surface).
+        """
+        key = (chunk_row, chunk_col)
+        layer = self.chunks.get(key)
+        if layer is None:
+            layer = self.chunks[key] = self._build_chunk(chunk_row, chunk_col)
+            while len(self.chunks) > self.max_chunks:
+                self.chunks.popitem(last=False)
+        else:
+            self.chunks.move_to_end(key)
+        return layer
+
+    def _flush_dirty(self):
+        """Перерисовывает изменившиеся клетки в уже отрисованных чанках."""
+        size = self.chunk_cells
+        for row, col in self.dirty_cells:
+            layer = self.chunks.get((row // size, col // size))
+            if layer is not None:  # невыгруженный чанк отрисуется целиком при показе
+                self._draw_cell(layer, row, col)
+        self.dirty_cells.clear()
+
+    @staticmethod
+    def _spans(start, view, total):
+        """
+        Разбивает видимый отрезок зацикленного поля на непрерывные куски.
+        Args:
+            start: Начало видимой области в мировых координатах (0 <= start < total).
+            view: Длина видимой области.
+            total: Длина поля.
+        Returns:
+            Список кортежей (начало, конец, сдвиг на экране).
+        """
+        end = start + view
+        if end <= total:
+            return [(start, end, -start)]
+        return [(start, total, -start), (0, min(end - total, start), total - start)]
 
-    def draw(self, screen):
+    def blit_items(self, view_size, camera, items):
         """
-        Отрисовка сетки на экране.
+        Добавляет видимые чанки в список пакетной отрисовки, перед этим
+        перерисовав изменившиеся клетки; сам экран не трогает.
+        Args:
+            view_size: Размер экрана (w, h).
+            camera: Объект Camera или None (сетка рисуется от угла поля).
+            items: Список кортежей (слой, левый верхний угол) для Surface.blits.
+        """
+        if self.dirty_cells:
+            self._flush_dirty()
+        view_width, view_height = view_size
+        cam_x, cam_y = (camera.x, camera.y) if camera else (0, 0)
+        chunk_px = self.chunk_cells * self.cell_size
+        spans_x = self._spans(cam_x, view_width, self.width * self.cell_size)
+        spans_y = self._spans(cam_y, view_height, self.height * self.cell_size)
+        for top, bottom, offset_y in spans_y:
+            for left, right, offset_x in spans_x:
+                for chunk_row in range(int(top // chunk_px), int((bottom - 1) // chunk_px) + 1):
+                    for chunk_col in range(int(left // chunk_px), int((right - 1) // chunk_px) + 1):
+                        items.append((self._chunk(chunk_row, chunk_col),
+                                      (chunk_col * chunk_px + offset_x, chunk_row * chunk_px + offset_y)))
+
+    def draw(self, screen, camera=None):
+        """
+        Отрисовка сетки на экране: по одному blit на каждый видимый чанк,
+        перед которыми перерисовываются только изменившиеся клетки.
         Args:
             screen: Объект pygame.Surface, представляющий экран для отрисовки.
+            camera: Объект Camera (необязательно; без нее сетка рисуется от угла поля).
         """
-        for row in range(self.height):
-            for col in range(self.width):
-                x = col * self.cell_size
-                y = row * self.cell_size
-                if self.grid[row][col] == "#":
-                    wall_image_scaled = pygame.transform.scale(
-                        self.wall_image, (self.cell_size, self.cell_size)
-                    )
-                    screen.blit(wall_image_scaled, (x, y))
-                elif self.grid[row][col] == "@":
-                    loot_image_scaled = pygame.transform.scale(
-                        self.loot_image, (self.cell_size, self.cell_size)
-                    )
-                    screen.blit(loot_image_scaled, (x, y))
+        items = []
+        self.blit_items(screen.get_size(), camera, items)
+        screen.blits(items, doreturn=False)
+
+    def set_cell(self, row, col, value):
+        """
+        Изменяет содержимое клетки и помечает ее для перерисовки.
+        Args:
+            row: Номер строки ячейки.
+            col: Номер столбца ячейки.
+            value: Новое содержимое клетки ("." - пусто, "#" - стена, "@" - лут).
+        """
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            return
+        index = row * self.width + col
+        old = self.cells[index]
+        kind = CELL_TYPES[value]
+        if old == kind:
+            return
+        self.cells[index] = kind
+        if old == WALL:
+            self.wall_mask &= ~(1 << index)
+        elif old == LOOT:
+            self.loot_mask &= ~(1 << index)
+            self.loot_count -= 1
+        if kind == WALL:
+            self.wall_mask |= 1 << index
+        elif kind == LOOT:
+            self.loot_mask |= 1 << index
+            self.loot_count += 1
+        self.dirty_cells.add((row, col))
 
     def add_obstacle(self, row, col):
         """
@@ -50,8 +262,30 @@ class Grid:
             row: Номер строки ячейки.
             col: Номер столбца ячейки.
         """
-        if 0 <= row < self.height and 0 <= col < self.width:
-            self.grid[row][col] = "#"
+        self.set_cell(row, col, "#")
+
+    def add_loot(self, row, col):
+        """
+        Добавление лута на сетку.
+        Args:
+            row: Номер строки ячейки.
+            col: Номер столбца ячейки.
+        """
+        self.set_cell(row, col, "@")
+
+    def collect_loot(self, row, col):
+        """
+        Забирает лут из клетки, если он там есть.
+        Args:
+            row: Номер строки ячейки.
+            col: Номер столбца ячейки.
+        Returns:
+            True, если лут был собран, False в противном случае.
+        """
+        if 0 <= row < self.height and 0 <= col < self.width and self.cells[row * self.width + col] == LOOT:
+            self.set_cell(row, col, ".")
+            return True
+        return False
 
     def is_obstacle(self, x, y):
         """
@@ -65,21 +299,111 @@ class Grid:
         col = int(x / self.cell_size)
         row = int(y / self.cell_size)
         if 0 <= row < self.height and 0 <= col < self.width:
-            return self.grid[row][col] == "#"
+            return self.cells[row * self.width + col] == WALL
         else:
             return False
 
+    def circle_mask(self, x, y, radius):
+        """
+        Возвращает битовую маску клеток, которые задевает круг.
+        Маска строится по строкам (отрезок столбцов на строку), поэтому
+        проверка круга против всех стен или всего лута - одна операция "&".
+        Сетка покрывает все зацикленное поле, поэтому круг у края задевает
+        и клетки с противоположной стороны.
+        Args:
+            x: X-координата центра в пикселях.
+            y: Y-координата центра в пикселях.
+            radius: Радиус в пикселях.
+        Returns:
+            Битовая маска (int), бит row * width + col.
+        """
+        size = self.cell_size
+        width = self.width
+        full_row = (1 << width) - 1
+        mask = 0
+        for row in range(int((y - radius) // size), int((y + radius) // size) + 1):
+            top = row * size
+            # Расстояние по вертикали от центра до ближайшей точки строки
+            dy = top - y if y < top else (y - top - size if y > top + size else 0)
+            if dy > radius:
+                continue
+            half = (radius * radius - dy * dy) ** 0.5
+            first_col = int((x - half) // size)
+            count = int((x + half) // size) - first_col + 1
+            if count >= width:
+                bits = full_row
+            else:
+                start = first_col % width
+                bits = ((1 << count) - 1) << start
+                if start + count > width:  # отрезок уходит за правый край - остаток слева
+                    bits = (bits | (bits >> width)) & full_row
+            mask |= bits << ((row % self.height) * width)
+        return mask
+
+    def cells_from_mask(self, mask):
+        """
+        Перечисляет клетки битовой маски.
+        Args:
+            mask: Битовая маска (int).
+        Returns:
+            Список пар (row, col).
+        """
+        cells = []
+        while mask:
+            low = mask & -mask
+            cells.append(divmod(low.bit_length() - 1, self.width))
+            mask ^= low
+        return cells
+
+    def cells_in_circle(self, x, y, radius):
+        """
+        Клетки, которые задевает круг.
+        Args:
+            x: X-координата центра в пикселях.
+            y: Y-координата центра в пикселях.
+            radius: Радиус в пикселях.
+        Returns:
+            Список пар (row, col).
+        """
+        return self.cells_from_mask(self.circle_mask(x, y, radius))
+
+    def circle_hits_wall(self, x, y, radius):
+        """
+        Проверка, задевает ли круг хотя бы одну стену.
+        Args:
+            x: X-координата центра в пикселях.
+            y: Y-координата центра в пикселях.
+            radius: Радиус в пикселях.
+        Returns:
+            True, если круг пересекает стену.
+        """
+        return bool(self.circle_mask(x, y, radius) & self.wall_mask)
+
+    def loot_in_circle(self, x, y, radius):
+        """
+        Клетки с лутом, которые задевает круг.
+        Args:
+            x: X-координата центра в пикселях.
+            y: Y-координата центра в пикселях.
+            radius: Радиус в пикселях.
+        Returns:
+            Список пар (row, col).
+        """
+        return self.cells_from_mask(self.circle_mask(x, y, radius) & self.loot_mask)
+
     def get_loot_count(self):
         """
-        Подсчитывает количество лута на карте.
+        Возвращает количество лута на карте (счетчик ведется при изменении клеток).
         Returns:
             Количество лута на карте (int).
         """
-        loot_count = 0
-        for row in self.grid:
-            loot_count += row.count("@")
-        return loot_count
+        return self.loot_count
 
     def reset(self):
         """Сбрасывает сетку к начальному состоянию."""
-        self.grid = [["." for _ in range(self.width)] for _ in range(self.height)]
+        self.cells = bytearray(self.width * self.height)
+        self.wall_mask = 0
+        self.loot_mask = 0
+        self.loot_count = 0
+        self.chunks.clear()
+        self.dirty_cells.clear()
@@ -0,0 +1,23 @@
+def load_level(filename):
+    """Загружает уровень из файла."""
+    level_data = []
+    try:
+        with open(filename, 'r') as file:
+            for line in file:
+                level_data.append(line.strip())  # Удаляем лишние пробелы и переносы строк
+    except FileNotFoundError:
+        print(f"Ошибка: Файл уровня '{filename}' не найден.")
+        return None  # Или можно создать уровень по умолчанию
+    return level_data
+
+
+def generate_level(level_data, grid):
+    try:
+        for row_index, row in enumerate(level_data):
+            for col_index, cell in enumerate(row):
+                if cell == '#':
+                    grid.add_obstacle(row_index, col_index)
+                elif cell == '@':
+                    grid.add_loot(row_index, col_index)  # Place Loot
+    except Exception as e:
+        print(f"Ошибка при создании уровня: {e}")
@@ -0,0 +1,243 @@
+import mmap
+import os
+import struct
+import zlib
+
+from environment.Level import load_level
+
+
+class CompiledLevel:
+    """
+    Разобранный уровень: битовая маска стен и список клеток с лутом.
+    """
+    __slots__ = ("width", "height", "walls", "loot")
+
+    def __init__(self, width, height, walls, loot):
+        """
+        Args:
+            width: Ширина уровня в клетках.
+            height: Высота уровня в клетках.
+            walls: Битовая маска стен (bytes), по строкам, младший бит - первая клетка.
+            loot: Кортеж клеток (row, col) с лутом.
+        """
+        self.width = width
+        self.height = height
+        self.walls = walls
+        self.loot = loot
+
+    def is_wall(self, row, col):
+        """
+        Проверка, есть ли в клетке стена.
+        Args:
+            row: Номер строки.
+            col: Номер столбца.
+        Returns:
+            True, если в клетке стена.
+        """
+        if 0 <= row < self.height and 0 <= col < self.width:
+            bit = row * self.width + col
+            return bool(self.walls[bit >> 3] & (1 << (bit & 7)))
+        return False
+
+    def wall_cells(self):
+        """
+        Перечисляет клетки со стенами.
+        Returns:
+            Генератор пар (row, col).
+        """
+        width = self.width
+        for byte_index, byte in enumerate(self.walls):
+            while byte:
+                low = byte & -byte
+                bit = byte_index * 8 + low.bit_length() - 1
+                yield divmod(bit, width)
+                byte ^= low
+
+    def apply(self, grid):
+        """
+        Заполняет сетку стенами и лутом уровня.
+        Args:
+            grid: Объект Grid.
+        """
+        for row, col in self.wall_cells():
+            grid.add_obstacle(row, col)
+        for row, col in self.loot:
+            grid.add_loot(row, col)
+
+
+class LevelCompiler:
+    """
+    Компилятор текстовых уровней в двоичный формат с кэшем.
+    Файл: заголовок (сигнатура, версия, размеры, число лута, CRC32 данных),
+    битовая маска стен и координаты лута (по два uint16). Скомпилированные
+    файлы лежат в cache_dir и пересобираются, если текстовый файл новее;
+    читаются через mmap. Разобранные уровни хранятся в памяти, так что
+    рестарт и смена уровня не обращаются к диску.
+    """
+    MAGIC = b"MEYL"
+    VERSION = 1
+    HEADER = struct.Struct("<4sBxHHHI")  # сигнатура, версия, ширина, высота, число лута, CRC32
+    CELL = struct.Struct("<HH")
+
+    def __init__(self, cache_dir=os.path.join(".cache", "levels")):
+        """
+        Инициализация.
+        Args:
+            cache_dir: Папка для скомпилированных уровней (None - только кэш в памяти).
+        """
+        self.cache_dir = cache_dir
+        self.levels = {}  # путь к текстовому файлу -> CompiledLevel
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.compiles = 0
+
+    def compile(self, level_data):
+        """
+        Компилирует текст уровня в двоичный формат.
+        Args:
+            level_data: Список строк уровня ("#" - стена, "@" - лут).
+        Returns:
+            Двоичное представление уровня (bytes).
+        """
+        width = max((len(row) for row in level_data), default=0)
+        height = len(level_data)
+        walls = bytearray((width * height + 7) // 8)
+        loot = bytearray()
+        loot_count = 0
+        for row_index, row in enumerate(level_data):
+            for col_index, cell in enumerate(row):
+                if cell == "#":
+                    bit = row_index * width + col_index
+                    walls[bit >> 3] |= 1 << (bit & 7)
+                elif cell == "@":
+                    loot += self.CELL.pack(row_index, col_index)
+                    loot_count += 1
+        body = bytes(walls) + bytes(loot)
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, width, height, loot_count, zlib.crc32(body))
+        return header + body
+
+    def parse(self, data):
+        """
+        Разбирает и проверяет двоичный уровень.
+        Args:
+            data: Двоичные данные (bytes, mmap или memoryview).
+        Returns:
+            Объект CompiledLevel.
+        Raises:
+            ValueError: Если данные повреждены или в другом формате.
+        """
+        if len(data) < self.HEADER.size:
+            raise ValueError("файл уровня слишком короткий")
+        magic, version, width, height, loot_count, checksum = self.HEADER.unpack_from(data)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError("неизвестный формат файла уровня")
+        mask_size = (width * height + 7) // 8
+        body = data[self.HEADER.size:]
+        if len(body) != mask_size + loot_count * self.CELL.size:
+            raise ValueError("неверный размер файла уровня")
+        if zlib.crc32(body) != checksum:
+            raise ValueError("неверная контрольная сумма файла уровня")
+        walls = bytes(body[:mask_size])
+        loot = tuple(self.CELL.iter_unpack(body[mask_size:]))
+        for row, col in loot:
+            if row >= height or col >= width:
+                raise ValueError("лут за пределами уровня")
+        return CompiledLevel(width, height, walls, loot)
+
+    def _compiled_path(self, path):
+        """
+        Возвращает путь к скомпилированному файлу уровня.
+        Args:
+            path: Путь к текстовому файлу уровня.
+        Returns:
+            Путь к файлу .bin в папке кэша.
+        """
+        name = os.path.splitext(os.path.basename(path))[0]
+        # Одноименные уровни из разных папок не должны затирать друг друга
+        source = zlib.crc32(os.path.abspath(path).encode())
+        return os.path.join(self.cache_dir, f"{name}_{source:08x}.bin")
+
+    def _read_compiled(self, path, compiled_path):
+        """
+        Читает скомпилированный уровень, если он есть и не старше текстового.
+        Args:
+            path: Путь к текстовому файлу уровня.
+            compiled_path: Путь к скомпилированному файлу.
+        Returns:
+            Объект CompiledLevel или None.
+        """
+        try:
+            if os.path.getmtime(compiled_path) < os.path.getmtime(path):
+                return None
+            with open(compiled_path, "rb") as file:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return self.parse(data)
+        except (OSError, ValueError):
+            return None
+
+    def _write_compiled(self, compiled_path, data):
+        """
+        Сохраняет скомпилированный уровень (атомарно, через временный файл).
+        Args:
+            compiled_path: Путь к скомпилированному файлу.
+            data: Двоичные данные уровня.
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{compiled_path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, compiled_path)
+        except OSError as e:
+            print(f"Не удалось сохранить скомпилированный уровень: {e}")
+
+    def load(self, path):
+        """
+        Возвращает разобранный уровень, компилируя его только при необходимости.
+        Args:
+            path: Путь к текстовому файлу уровня.
+        Returns:
+            Объект CompiledLevel или None, если уровня нет.
+        """
+        level = self.levels.get(path)
+        if level is not None:
+            self.memory_hits += 1
+            return level
+        compiled_path = self._compiled_path(path) if self.cache_dir else None
+        if compiled_path and os.path.exists(path):
+            level = self._read_compiled(path, compiled_path)
+        if level is not None:
+            self.disk_hits += 1
+        else:
+            level_data = load_level(path)
+            if not level_data:
+                return None
+            data = self.compile(level_data)
+            level = self.parse(data)
+            self.compiles += 1
+            if compiled_path:
+                self._write_compiled(compiled_path, data)
+        self.levels[path] = level
+        return level
+
+    def invalidate(self, path=None):
+        """
+        Забывает разобранные уровни (например, после правки файла в редакторе).
+        Args:
+            path: Путь к текстовому файлу уровня (None - все уровни).
+        """
+        if path is None:
+            self.levels.clear()
+        else:
+            self.levels.pop(path, None)
+
+    def stats(self):
+        """
+        Возвращает статистику загрузок.
+        Returns:
+            Словарь с ключами "memory_hits", "disk_hits", "compiles".
+        """
+        return {"memory_hits": self.memory_hits, "disk_hits": self.disk_hits, "compiles": self.compiles}
+
+
+level_cache = LevelCompiler()
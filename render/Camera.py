@@ -0,0 +1,75 @@
+class Camera:
+    """
+    Окно просмотра на игровое поле, которое может быть больше экрана.
+    Камера следует за точкой (обычно кораблем) и переводит мировые
+    координаты в экранные с учетом зацикливания поля. Если поле не
+    больше экрана, камера стоит в (0, 0) и координаты не меняются.
+    """
+    def __init__(self, view_width, view_height, margin=100):
+        """
+        Инициализация камеры.
+        Args:
+            view_width: Ширина экрана в пикселях.
+            view_height: Высота экрана в пикселях.
+            margin: Запас за краем экрана, в пределах которого объект еще рисуется.
+        """
+        self.view_width = view_width
+        self.view_height = view_height
+        self.margin = margin
+        self.x = 0
+        self.y = 0
+        self.world_width = view_width
+        self.world_height = view_height
+
+    def follow(self, world, pos):
+        """
+        Ставит камеру так, чтобы точка была в центре экрана.
+        Args:
+            world: Объект World (нужен размер поля).
+            pos: Позиция в мировых координатах (x, y).
+        """
+        self.world_width = world.width
+        self.world_height = world.height
+        # Целые координаты, чтобы чанки сетки и фон не расходились на пиксель при округлении
+        self.x = int((pos[0] - self.view_width / 2) % world.width) if world.width > self.view_width else 0
+        self.y = int((pos[1] - self.view_height / 2) % world.height) if world.height > self.view_height else 0
+
+    def to_screen(self, pos):
+        """
+        Переводит мировые координаты в экранные.
+        Args:
+            pos: Позиция в мировых координатах (x, y).
+        Returns:
+            Позиция на экране (x, y); объект за правым/нижним краем поля
+            оказывается слева/сверху, если там его ближайшая копия.
+        """
+        x = (pos[0] - self.x) % self.world_width
+        y = (pos[1] - self.y) % self.world_height
+        if x > self.view_width + self.margin:
+            x -= self.world_width
+        if y > self.view_height + self.margin:
+            y -= self.world_height
+        return x, y
+
+    def to_world(self, pos):
+        """
+        Переводит экранные координаты (например, щелчок мыши) в мировые.
+        Args:
+            pos: Позиция на экране (x, y).
+        Returns:
+            Позиция в мировых координатах [x, y] в пределах поля (точка за швом
+            переносится на другую сторону поля).
+        """
+        return [(pos[0] + self.x) % self.world_width, (pos[1] + self.y) % self.world_height]
+
+    def visible(self, screen_pos, radius):
+        """
+        Проверка, попадает ли объект на экран.
+        Args:
+            screen_pos: Позиция на экране (x, y).
+            radius: Радиус объекта в пикселях.
+        Returns:
+            True, если объект хотя бы частично виден.
+        """
+        return (-radius <= screen_pos[0] <= self.view_width + radius
+                and -radius <= screen_pos[1] <= self.view_height + radius)
@@ -0,0 +1,104 @@
+import pygame
+
+from render.TextRenderer import TextRenderer
+
+BUDGET_MS = 1000 / 60  # бюджет кадра при 60 FPS - линия на графике
+
+
+class ProfilerOverlay:
+    """
+    Оверлей профайлера: график времени последних кадров, время областей
+    замера в последнем кадре, число объектов и выделения памяти.
+    Панель пересобирается раз в несколько кадров (цифры успевают читаться,
+    а сама панель почти не стоит времени), в остальных кадрах это один blit.
+    """
+    def __init__(self, profiler, pos=(10, 110), width=300, graph_height=60, refresh=10, text_renderer=None):
+        """
+        Инициализация.
+        Args:
+            profiler: Объект Profiler.
+            pos: Левый верхний угол панели (x, y).
+            width: Ширина панели.
+            graph_height: Высота графика времени кадров.
+            refresh: Раз во сколько кадров пересобирать панель.
+            text_renderer: Объект TextRenderer (необязательно).
+        """
+        self.profiler = profiler
+        self.pos = pos
+        self.width = width
+        self.graph_height = graph_height
+        self.refresh = refresh
+        self.text = text_renderer or TextRenderer()
+        self.surface = None
+        self.frame = 0
+
+    def visible(self):
+        """Показан ли оверлей."""
+        return self.profiler.visible
+
+    def _lines(self):
+        """
+        Строки текста панели.
+        Returns:
+            Список пар (текст слева, текст справа).
+        """
+        profiler = self.profiler
+        frames = profiler.frames
+        lines = []
+        if frames:
+            ordered = sorted(frames)
+            lines.append((f"кадр (сред {sum(frames) / len(frames):.1f}, max {ordered[-1]:.1f})",
+                          f"{frames[-1]:.2f} мс"))
+        for name, ms in sorted(profiler.last.items(), key=lambda item: -item[1]):
+            lines.append((name, f"{ms:.2f} мс"))
+        for name, value in profiler.counts.items():
+            lines.append((name, str(value)))
+        lines.append(("блоки памяти за кадр", f"{profiler.allocations:+d}"))
+        lines.append(("сборки мусора за кадр", str(profiler.collections)))
+        if profiler.tracing:
+            lines.append(("запись трассы, событий", str(len(profiler.trace))))
+        return lines
+
+    def _compose(self):
+        """Собирает панель: график и текст."""
+        font = self.text.font(16)
+        lines = self._lines()
+        line_height = font.get_linesize()
+        height = self.graph_height + 8 + line_height * len(lines) + 4
+        if self.surface is None or self.surface.get_height() != height:
+            self.surface = pygame.Surface((self.width, height), pygame.SRCALPHA)
+        surface = self.surface
+        surface.fill((0, 0, 0, 170))
+
+        # График: столбик на кадр, высота в масштабе двух бюджетов кадра
+        frames = self.profiler.frames
+        scale = self.graph_height / (2 * BUDGET_MS)
+        bottom = 4 + self.graph_height
+        x = self.width - 4 - len(frames)
+        for ms in frames:
+            color = (90, 220, 90) if ms <= BUDGET_MS else (240, 80, 60)
+            top = bottom - min(self.graph_height, int(ms * scale))
+            pygame.draw.line(surface, color, (x, bottom), (x, top))
+            x += 1
+        budget_y = bottom - int(BUDGET_MS * scale)
+        pygame.draw.line(surface, (255, 255, 255, 120), (4, budget_y), (self.width - 4, budget_y))
+
+        y = bottom + 4
+        for left, right in lines:  # Строки меняются каждый раз, в кэш TextRenderer их не кладем
+            surface.blit(font.render(left, True, (255, 255, 255)), (6, y))
+            value = font.render(right, True, (255, 255, 255))
+            surface.blit(value, (self.width - 6 - value.get_width(), y))
+            y += line_height
+
+    def draw(self, screen):
+        """
+        Отрисовка панели.
+        Args:
+            screen: Объект pygame.Surface, на котором рисуем.
+        Returns:
+            Прямоугольник экрана, занятый панелью.
+        """
+        if self.surface is None or self.frame % self.refresh == 0:
+            self._compose()
+        self.frame += 1
+        return screen.blit(self.surface, self.pos)
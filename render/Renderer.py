@@ -0,0 +1,331 @@
+import math
+
+import pygame
+
+from environment.Background import Background
+from render.Camera import Camera
+from render.TextRenderer import TextRenderer, HudCounter
+
+WHITE = (255, 255, 255)
+
+
+def _surface_key(item):
+    """Ключ сортировки элементов пакетной отрисовки по изображению."""
+    return id(item[0])
+
+
+class Renderer:
+    """
+    Тонкий слой отрисовки: рисует состояние мира (World) на экране,
+    интерполируя позиции объектов между двумя шагами симуляции.
+    В режиме грязных прямоугольников (dirty_rects=True) во время игры фон,
+    обломки и сетка собираются в один неподвижный слой, а каждый кадр
+    восстанавливаются только участки под объектами и изменившимися клетками,
+    и на дисплей отправляются только они (см. present).
+    Кадр строится в два этапа: сначала собирается список пакетной отрисовки
+    (изображение, позиция) без обращения к экрану (draw_list), затем он
+    выводится одним вызовом Surface.blits (submit).
+    """
+    def __init__(self, screen, images, dirty_rects=False, sort_blits=False):
+        """
+        Инициализация отрисовщика.
+        Args:
+            screen: Объект pygame.Surface, представляющий экран для отрисовки.
+            images: Словарь изображений экрана: "nebula" (список фонов по уровням),
+                "debris", "splash", "game_over", "instr_loot", "instr_wall", "instr_asteroid".
+                Изображения могут появиться позже (фоновая загрузка); пока их нет, они не рисуются.
+            dirty_rects: Обновлять ли только изменившиеся участки экрана (для слабых машин
+                и программной отрисовки, где узкое место - заливка всего экрана).
+            sort_blits: Группировать ли объекты каждого слоя по изображению перед выводом
+                (одинаковые кадры идут подряд; порядок перекрытия внутри слоя меняется).
+        """
+        self.screen = screen
+        self.images = images
+        self.width, self.height = screen.get_size()
+        self.camera = Camera(self.width, self.height)
+        self.background = Background((self.width, self.height), images["debris"])
+        self.dirty_rects = dirty_rects
+        self.sort_blits = sort_blits
+        self.base = None  # Неподвижный фон без сетки (режим грязных прямоугольников)
+        self.backdrop = None  # Неподвижный фон с сеткой
+        self.backdrop_key = None  # От чего зависит backdrop; при смене он собирается заново
+        self.drawn = []  # Участки экрана, занятые объектами в прошлом кадре
+        self.updates = None  # Участки для present (None - весь экран)
+        self.extents = {}  # изображение -> половина его диагонали (радиус отсечения при любом повороте)
+        self.overlay = None  # Оверлей профайлера (ProfilerOverlay), рисуется поверх кадра
+        self.text = TextRenderer()
+        self.hud = [
+            (HudCounter(self.text, "Lives: ", (50, 50)), "lives"),
+            (HudCounter(self.text, "Score: ", (680, 50)), "score"),
+            (HudCounter(self.text, "Loot: ", (350, 50)), "loot_collected"),
+        ]
+
+    def nebula_for(self, level):
+        """
+        Возвращает фон уровня.
+        Args:
+            level: Номер уровня (начиная с 1).
+        Returns:
+            Объект pygame.Surface (фон первого уровня, если для уровня нет своего).
+        """
+        nebula_images = self.images["nebula"]
+        if level - 1 < len(nebula_images) and nebula_images[level - 1]:
+            return nebula_images[level - 1]
+        return nebula_images[0]
+
+    def lerp_position(self, obj, alpha, world):
+        """
+        Интерполирует позицию объекта между предыдущим и текущим шагом.
+        Args:
+            obj: Объект с атрибутами pos и prev_pos.
+            alpha: Доля шага, прошедшая с последнего обновления (0..1).
+            world: Объект World (нужен размер поля).
+        Returns:
+            Позиция для отрисовки (x, y).
+        """
+        prev = obj.prev_pos
+        pos = obj.pos
+        dx = pos[0] - prev[0]
+        dy = pos[1] - prev[1]
+        # Объект перешел через край поля - не растягиваем его через весь экран
+        if abs(dx) > world.width / 2 or abs(dy) > world.height / 2:
+            return pos
+        return prev[0] + dx * alpha, prev[1] + dy * alpha
+
+    def draw_list(self, world, alpha):
+        """
+        Собирает список пакетной отрисовки камней, ракет, взрывов и корабля
+        (с отсечением объектов вне экрана). Экран при этом не трогается.
+        Args:
+            world: Объект World.
+            alpha: Доля шага, прошедшая с последнего обновления (0..1).
+        Returns:
+            Список пар (изображение, левый верхний угол) в порядке слоев.
+        """
+        camera = self.camera
+        to_screen = camera.to_screen
+        visible = camera.visible
+        lerp = self.lerp_position
+        extents = self.extents
+        items = []
+        for group in (world.rock_group, world.missile_group):
+            start = len(items)
+            for sprite in group:
+                pos = to_screen(lerp(sprite, alpha, world))
+                # Отсекаем по рисуемому изображению, а не по радиусу столкновения:
+                # повернутый кадр не выходит за половину диагонали исходного
+                image = sprite.image
+                extent = extents.get(image)
+                if extent is None:
+                    extent = extents[image] = math.hypot(*image.get_size()) / 2
+                if visible(pos, extent):  # Объекты вне экрана не рисуем
+                    items.append(sprite.blit_item(pos))
+            if self.sort_blits:
+                items[start:] = sorted(items[start:], key=_surface_key)
+        world.explosion_group.blit_items(camera, world.time, items)
+        items.append(world.ship.blit_item(to_screen(lerp(world.ship, alpha, world))))
+        return items
+
+    def submit(self, items, rects=False):
+        """
+        Выводит список пакетной отрисовки на экран одним вызовом Surface.blits.
+        Args:
+            items: Список пар (изображение, позиция) или троек (изображение, позиция, область).
+            rects: Нужны ли прямоугольники нарисованного (режим грязных прямоугольников).
+        Returns:
+            Список прямоугольников экрана (pygame.Rect), если rects=True, иначе None.
+        """
+        if not items:
+            return [] if rects else None
+        return self.screen.blits(items, doreturn=rects)
+
+    def draw(self, world, alpha=1.0, show_instructions=False):
+        """
+        Отрисовка кадра.
+        Args:
+            world: Объект World.
+            alpha: Доля шага, прошедшая с последнего обновления (0..1).
+            show_instructions: Показывать ли справку на заставке.
+        """
+        screen = self.screen
+        camera = self.camera
+        camera.follow(world, self.lerp_position(world.ship, alpha, world))
+        if self.dirty_rects and world.started:
+            self.draw_dirty(world, alpha)
+        else:
+            self.draw_full(world, alpha, show_instructions)
+        if self.overlay is not None and self.overlay.visible():
+            rect = self.overlay.draw(screen)
+            if self.updates is not None:
+                self.updates.append(rect)
+                self.drawn.append(rect)  # В следующем кадре панель стирается вместе с объектами
+
+    def draw_full(self, world, alpha, show_instructions=False):
+        """
+        Полный кадр: фон, объекты, сетка, HUD и заставка.
+        Args:
+            world: Объект World.
+            alpha: Доля шага, прошедшая с последнего обновления (0..1).
+            show_instructions: Показывать ли справку на заставке.
+        """
+        screen = self.screen
+        # Полный кадр; после него неподвижный фон режима грязных прямоугольников надо показать заново
+        self.updates = None
+        self.backdrop_key = None
+        self.background.draw(screen, self.nebula_for(world.current_level), world.time + alpha)
+        items = self.draw_list(world, alpha)
+        world.grid.blit_items((self.width, self.height), self.camera, items)  # Сетка лежит поверх объектов
+        self.submit(items)
+
+        # draw UI
+        for counter, attribute in self.hud:
+            counter.draw(screen, getattr(world, attribute))
+
+        if not world.started:
+            if world.game_over:
+                self.draw_game_over(world)
+            else:
+                screen.blit(self.images["splash"], (50, 50))
+                if show_instructions:
+                    self.draw_instructions()
+
+    def _build_backdrop(self, world):
+        """
+        Собирает неподвижный фон: туманность, обломки и сетку уровня.
+        Args:
+            world: Объект World.
+        """
+        if self.base is None:
+            self.base = pygame.Surface((self.width, self.height), 0, self.screen)
+            self.backdrop = pygame.Surface((self.width, self.height), 0, self.screen)
+        self.background.draw(self.base, self.nebula_for(world.current_level), 0)  # Обломки в этом режиме не движутся
+        self.backdrop.blit(self.base, (0, 0))
+        world.grid.draw(self.backdrop, self.camera)
+
+    def _patch_grid(self, world):
+        """
+        Переносит изменившиеся клетки сетки на неподвижный фон и экран.
+        Args:
+            world: Объект World.
+        Returns:
+            Список прямоугольников экрана с измененными клетками.
+        """
+        grid = world.grid
+        if not grid.dirty_cells:
+            return []
+        size = grid.cell_size
+        rects = [pygame.Rect(self.camera.to_screen((col * size, row * size)), (size, size))
+                 for row, col in grid.dirty_cells]
+        backdrop = self.backdrop
+        for rect in rects:
+            backdrop.set_clip(rect)
+            backdrop.blit(self.base, rect, rect)
+            grid.draw(backdrop, self.camera)  # Первый вызов перерисует клетки на слоях чанков
+        backdrop.set_clip(None)
+        for rect in rects:
+            self.screen.blit(backdrop, rect, rect)
+        return rects
+
+    def draw_dirty(self, world, alpha):
+        """
+        Кадр в режиме грязных прямоугольников: стираем объекты прошлого кадра
+        неподвижным фоном, рисуем объекты и HUD, запоминаем измененные участки.
+        Args:
+            world: Объект World.
+            alpha: Доля шага, прошедшая с последнего обновления (0..1).
+        """
+        screen = self.screen
+        key = (world.current_level, world.grid, self.camera.x, self.camera.y,
+               id(self.nebula_for(world.current_level)))
+        if key != self.backdrop_key:
+            # Новый уровень, сдвиг камеры или догрузился фон: обновляем весь экран
+            self._build_backdrop(world)
+            self.backdrop_key = key
+            screen.blit(self.backdrop, (0, 0))
+            updates = [screen.get_rect()]
+            full = True
+        else:
+            updates = self._patch_grid(world)
+            for rect in self.drawn:
+                screen.blit(self.backdrop, rect, rect)
+            updates.extend(self.drawn)
+            full = False
+        # Надписи лежат поверх объектов, как в полном кадре: фон под ними восстанавливаем
+        # до отрисовки объектов, а сами надписи рисуем последними
+        hud_rects = [counter.rect.copy() for counter, _ in self.hud]
+        if not full:
+            for rect in hud_rects:
+                screen.blit(self.backdrop, rect, rect)
+        items = self.draw_list(world, alpha)
+        bounds = screen.get_rect()
+        self.drawn = [rect for rect in (bounds.clip(pygame.Rect(dest, image.get_size())) for image, dest in items)
+                      if rect]
+        # Под объектами - фон без сетки: сетка ляжет поверх них один раз, как в полном кадре
+        screen.blits([(self.base, rect, rect) for rect in self.drawn], doreturn=False)
+        self.submit(items)
+        for rect in self.drawn:  # Сетка лежит поверх объектов, как в полном кадре
+            screen.set_clip(rect)
+            world.grid.draw(screen, self.camera)
+        screen.set_clip(None)
+        updates.extend(self.drawn)
+        for (counter, attribute), old in zip(self.hud, hud_rects):
+            counter.draw(screen, getattr(world, attribute))
+            updates.append(old.union(counter.rect))
+        self.updates = updates
+
+    def present(self):
+        """Выводит кадр на дисплей: весь экран или только изменившиеся участки."""
+        if self.updates is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.updates)
+
+    def draw_game_over(self, world):
+        """
+        Отрисовка экрана Game Over со счетом.
+        Args:
+            world: Объект World.
+        """
+        screen = self.screen
+        if self.images.get("game_over"):
+            screen.blit(self.images["game_over"], (0, 0))  # Отображаем экран Game Over
+        if world.levels_up:
+            final_level_text = self.text.render("Вы прошли все уровни!", 38, WHITE)
+            level_rect = final_level_text.get_rect(center=(self.width // 2, self.height // 2 - 200))
+            screen.blit(final_level_text, level_rect)
+        # Отображаем счет на экране Game Over
+        final_score_text = self.text.render(f"Score: {world.score}", 38, WHITE)
+        final_loot_text = self.text.render(f"Loot: {world.loot_collected}", 38, WHITE)
+        score_rect = final_score_text.get_rect(center=(self.width // 2, self.height // 2 - 150))
+        loot_rect = final_loot_text.get_rect(center=(self.width // 2, self.height // 2 - 100))
+        screen.blit(final_score_text, score_rect)
+        screen.blit(final_loot_text, loot_rect)
+
+    def draw_instructions(self):
+        """Отрисовка справки на заставке."""
+        screen = self.screen
+        line_spacing = 30
+        x_offset = 50
+        y_start = 220
+
+        instruction_texts = [
+            "1. Стрелять пробелом",
+            "2. Двигаться : щелчек левой кнопкой мыши",
+            "3. Собирайте лут:",
+            "4. Избегайте стен:",
+            "5. Разрушайте пончики:"
+        ]
+
+        for i, text in enumerate(instruction_texts):
+            text_surface = self.text.render(text, 24, WHITE)
+            screen.blit(text_surface, (x_offset, y_start + i * line_spacing))
+
+        # Blit images for loot and wall (если они уже загружены)
+        icons = [
+            ("instr_loot", (x_offset + 150, y_start + 2 * line_spacing - 10)),  # Сдвиг -10 для выравнивания
+            ("instr_wall", (x_offset + 150, y_start + 3 * line_spacing - 5)),
+            ("instr_asteroid", (x_offset + 190, y_start + 4 * line_spacing - 15)),  # Уменьшаем сдвиг
+        ]
+        for name, pos in icons:
+            if self.images.get(name):
+                screen.blit(self.images[name], pos)
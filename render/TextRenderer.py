@@ -0,0 +1,152 @@
+import pygame
+
+
+class TextRenderer:
+    """
+    Отрисовка текста с кэшем шрифтов и готовых надписей.
+    Шрифты создаются один раз, надписи с ключом (размер шрифта, текст, цвет)
+    отрисовываются один раз. Числа можно выводить из атласа глифов цифр,
+    тогда меняющийся счет не создает новых поверхностей.
+    """
+    DIGITS = "0123456789-"
+
+    def __init__(self, font_name=None, max_entries=256):
+        """
+        Инициализация.
+        Args:
+            font_name: Имя файла шрифта (None - шрифт pygame по умолчанию).
+            max_entries: Максимальное число надписей в кэше.
+        """
+        self.font_name = font_name
+        self.max_entries = max_entries
+        self.fonts = {}  # size -> pygame.font.Font
+        self.surfaces = {}  # (size, text, color) -> pygame.Surface
+        self.glyphs = {}  # (size, color) -> словарь символ -> Surface
+
+    def font(self, size):
+        """
+        Возвращает шрифт нужного размера, создавая его только при первом запросе.
+        Args:
+            size: Размер шрифта.
+        Returns:
+            Объект pygame.font.Font.
+        """
+        font = self.fonts.get(size)
+        if font is None:
+            font = self.fonts[size] = pygame.font.Font(self.font_name, size)
+        return font
+
+    def render(self, text, size, color=(255, 255, 255)):
+        """
+        Возвращает надпись, отрисовывая ее только при первом запросе.
+        Args:
+            text: Текст.
+            size: Размер шрифта.
+            color: Цвет текста (r, g, b).
+        Returns:
+            Объект pygame.Surface с надписью.
+        """
+        key = (size, text, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            if len(self.surfaces) >= self.max_entries:
+                # Самая старая надпись (словарь хранит порядок добавления)
+                del self.surfaces[next(iter(self.surfaces))]
+            surface = self.surfaces[key] = self.font(size).render(text, True, color)
+        return surface
+
+    def digit_glyphs(self, size, color):
+        """
+        Возвращает атлас глифов цифр для шрифта и цвета.
+        Args:
+            size: Размер шрифта.
+            color: Цвет текста (r, g, b).
+        Returns:
+            Словарь символ -> pygame.Surface.
+        """
+        key = (size, color)
+        glyphs = self.glyphs.get(key)
+        if glyphs is None:
+            font = self.font(size)
+            glyphs = self.glyphs[key] = {ch: font.render(ch, True, color) for ch in self.DIGITS}
+        return glyphs
+
+    def blit_number(self, screen, value, pos, size, color=(255, 255, 255)):
+        """
+        Выводит целое число из глифов цифр, не создавая новых поверхностей.
+        Args:
+            screen: Объект pygame.Surface, на котором рисуем.
+            value: Целое число.
+            pos: Левый верхний угол (x, y).
+            size: Размер шрифта.
+            color: Цвет текста (r, g, b).
+        Returns:
+            Ширина выведенного числа в пикселях.
+        """
+        glyphs = self.digit_glyphs(size, color)
+        x, y = pos
+        start = x
+        for ch in str(value):
+            glyph = glyphs[ch]
+            screen.blit(glyph, (x, y))
+            x += glyph.get_width()
+        return x - start
+
+
+class HudCounter:
+    """
+    Надпись вида "Подпись: число" для HUD. Надпись собирается на заранее
+    созданной поверхности из подписи и глифов цифр и пересобирается только
+    при смене значения, так что в остальных кадрах это один blit.
+    """
+    def __init__(self, text_renderer, label, pos, size=38, color=(255, 255, 255), max_digits=6):
+        """
+        Args:
+            text_renderer: Объект TextRenderer.
+            label: Подпись, например "Score: ".
+            pos: Левый верхний угол надписи (x, y).
+            size: Размер шрифта.
+            color: Цвет текста (r, g, b).
+            max_digits: На сколько цифр рассчитана поверхность (при большем числе она пересоздается).
+        """
+        self.text_renderer = text_renderer
+        self.label = label
+        self.pos = pos
+        self.size = size
+        self.color = color
+        self.max_digits = max_digits
+        self.value = None
+        self.surface = None
+        self.rect = pygame.Rect(pos, (0, 0))  # Область экрана, занятая надписью
+
+    def _compose(self, value):
+        """
+        Собирает надпись для нового значения.
+        Args:
+            value: Целое число.
+        """
+        text_renderer = self.text_renderer
+        label = text_renderer.render(self.label, self.size, self.color)
+        digits = len(str(value))
+        if self.surface is None or digits > self.max_digits:
+            self.max_digits = max(self.max_digits, digits)
+            digit_width = max(g.get_width() for g in text_renderer.digit_glyphs(self.size, self.color).values())
+            self.surface = pygame.Surface(
+                (label.get_width() + self.max_digits * digit_width, label.get_height()), pygame.SRCALPHA
+            )
+        self.surface.fill((0, 0, 0, 0))
+        self.surface.blit(label, (0, 0))
+        width = text_renderer.blit_number(self.surface, value, (label.get_width(), 0), self.size, self.color)
+        self.rect.size = (label.get_width() + width, label.get_height())
+        self.value = value
+
+    def draw(self, screen, value):
+        """
+        Отрисовка надписи.
+        Args:
+            screen: Объект pygame.Surface, на котором рисуем.
+            value: Текущее значение (int).
+        """
+        if value != self.value:
+            self._compose(value)
+        screen.blit(self.surface, self.pos)
@@ -0,0 +1,61 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from utils.AssetManager import AssetManager
+
+
+def save_image(directory, color):
+    surface = pygame.Surface((8, 6), pygame.SRCALPHA)
+    surface.fill(color)
+    pygame.image.save(surface, os.path.join(directory, "cat.png"))
+
+
+def load(tmp_path, size=None):
+    """Загрузка новым менеджером, как при следующем запуске игры."""
+    assets = AssetManager(str(tmp_path / "cache"))
+    image = assets.image(str(tmp_path), "cat.png", size, True, False)
+    return image, assets.stats()
+
+
+def test_disk_cache_hit_and_memory_hit(tmp_path):
+    save_image(str(tmp_path), (255, 0, 0, 255))
+    image, stats = load(tmp_path)
+    assert stats["decodes"] == 1 and stats["disk_hits"] == 0
+    cached, stats = load(tmp_path)
+    assert stats["decodes"] == 0 and stats["disk_hits"] == 1
+    assert pygame.image.tobytes(cached, "RGBA") == pygame.image.tobytes(image, "RGBA")
+    assets = AssetManager(str(tmp_path / "cache"))
+    first = assets.image(str(tmp_path), "cat.png", None, True, False)
+    assert assets.image(str(tmp_path), "cat.png", None, True, False) is first
+    assert assets.stats()["memory_hits"] == 1
+
+
+def test_changed_source_invalidates_cached_variant(tmp_path):
+    save_image(str(tmp_path), (255, 0, 0, 255))
+    load(tmp_path)
+    save_image(str(tmp_path), (0, 0, 255, 255))
+    image, stats = load(tmp_path)
+    assert stats["decodes"] == 1
+    assert tuple(image.get_at((0, 0))) == (0, 0, 255, 255)
+
+
+def test_each_size_is_its_own_variant(tmp_path):
+    save_image(str(tmp_path), (0, 255, 0, 255))
+    load(tmp_path)
+    image, stats = load(tmp_path, (16, 12))
+    assert stats["decodes"] == 1 and image.get_size() == (16, 12)
+    assert load(tmp_path, (16, 12))[1]["disk_hits"] == 1
+
+
+def test_corrupt_cache_file_is_decoded_again(tmp_path):
+    save_image(str(tmp_path), (0, 255, 0, 255))
+    load(tmp_path)
+    cache_dir = tmp_path / "cache"
+    for path in cache_dir.iterdir():
+        path.write_bytes(path.read_bytes()[:-5])
+    image, stats = load(tmp_path)
+    assert stats["decodes"] == 1 and image.get_size() == (8, 6)
+    assert load(tmp_path)[1]["disk_hits"] == 1  # кэш переписан исправным
@@ -0,0 +1,44 @@
+from benchmarks.Benchmark import Benchmark, percentile, summarize
+
+
+class Slotted:
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = 0
+
+    def update(self):
+        self.calls += 1
+        return self.calls
+
+
+class Plain:
+    def draw(self):
+        return "drawn"
+
+
+def test_percentiles_use_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 0.5) == 50 and percentile(values, 0.9) == 90 and percentile(values, 1.0) == 100
+    assert percentile([], 0.5) == 0.0
+    assert summarize([3.0, 1.0, 2.0]) == {"total": 6.0, "mean": 2.0, "p50": 2.0, "p90": 3.0, "p99": 3.0, "max": 3.0}
+
+
+def test_wrap_times_subsystems_and_close_restores_classes():
+    bench = Benchmark("test")
+    plain, slotted = Plain(), Slotted()
+    bench.wrap(plain, "draw", "draw")
+    bench.wrap(slotted, "update", "update")
+    bench.wrap(slotted, "update", "update")  # повторная обертка ничего не меняет
+    for record in (False, True, True):
+        bench.begin_frame()
+        assert plain.draw() == "drawn"
+        slotted.update()
+        bench.end_frame(record)
+    assert slotted.calls == 3  # метод класса обернут один раз
+    report = bench.report()
+    assert report["frames"] == 2 and set(report["subsystems_ms"]) == {"draw", "update"}
+    assert len(bench.subsystems["update"]) == 2
+    bench.close()
+    assert "update" in vars(Slotted) and Slotted.update.__name__ == "update"
+    assert Plain.draw.__name__ == "draw" and "draw" in vars(plain)  # обертка стоит только на объекте
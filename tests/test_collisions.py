@@ -0,0 +1,55 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from engine import settings
+from engine.World import World
+from entities.Sprite import Sprite
+
+ROCKS = [[100, 100], [160, 100], [600, 500]]
+# Ракета 0 задевает только камень 1, ракета 1 - камни 0 и 1
+MISSILES = [[190, 100], [130, 100]]
+
+
+def make_world(backend):
+    """Мир с камнями и ракетами в одних и тех же местах, корабль в стороне от них."""
+    world = World(seed=1, backend=backend)
+    world.start()
+    for pos in ROCKS:
+        world.rock_group.add(Sprite(pos, [0, 0], 0, 0, None, settings.asteroid_info))
+    for pos in MISSILES:
+        world.missile_group.add(Sprite(pos, [0, 0], 0, 0, None, settings.missile_info))
+    return world
+
+
+def index_pairs(world):
+    """Пары широкой фазы как номера (камень, ракета) в группах."""
+    rocks = [tuple(rock.pos) for rock in world.rock_group]
+    missiles = [tuple(missile.pos) for missile in world.missile_group]
+    if world.backend == "numpy":
+        pairs = world.rock_group.pairs(world.missile_group)
+    else:
+        world.rock_hash.sync(world.rock_group)
+        pairs = world.rock_hash.pairs(world.missile_group)
+    return [(rocks.index(tuple(rock.pos)), missiles.index(tuple(missile.pos))) for rock, missile in pairs]
+
+
+def outcome(world):
+    """Результат разрешения столкновений, который должен совпадать у всех хранилищ."""
+    hits = world.resolve_collisions()
+    return (hits,
+            sorted(tuple(rock.pos) for rock in world.rock_group),
+            [tuple(missile.pos) for missile in world.missile_group],
+            [list(records) for records in world.explosion_group.records])
+
+
+def test_pairs_in_missile_then_rock_order():
+    for backend in ("python", "numpy"):
+        assert index_pairs(make_world(backend)) == [(1, 0), (0, 1), (1, 1)], backend
+
+
+def test_backends_resolve_collisions_identically():
+    python, numpy = outcome(make_world("python")), outcome(make_world("numpy"))
+    assert python == numpy
+    assert python[0] == (0, 2)
+    assert python[1] == [(600.0, 500.0)]
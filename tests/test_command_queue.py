@@ -0,0 +1,57 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from engine.CommandQueue import CommandQueue
+from engine.InputLog import InputLog
+from engine.World import World
+
+
+def started_world():
+    world = World(seed=1)
+    world.commands.start()
+    world.step()
+    return world
+
+
+def test_same_group_commands_coalesce_to_the_last():
+    queue = CommandQueue()
+    queue.target([1, 1])
+    queue.thrust(True)
+    queue.target([2, 2])
+    queue.thrust(False)
+    queue.shoot()
+    queue.shoot()
+    assert queue.pending == [(InputLog.TARGET, [2, 2], False), (InputLog.THRUST_OFF, None, False),
+                             (InputLog.SHOOT, None, False)]
+    assert queue.stats() == {"pending": 3, "coalesced": 3, "dropped": 0}
+
+
+def test_exact_commands_are_kept_as_is():
+    queue = CommandQueue()
+    queue.push(InputLog.SHOOT, exact=True)
+    queue.push(InputLog.SHOOT, exact=True)
+    queue.shoot()
+    assert len(queue) == 3 and queue.coalesced == 0
+
+
+def test_world_executes_one_target_per_step():
+    world = started_world()
+    world.commands.target([100, 100])
+    world.commands.target([200, 150])
+    world.step()
+    assert world.ship.target_pos == [200, 150]
+    assert len(world.commands) == 0
+
+
+def test_shot_rate_limit():
+    world = started_world()
+    world.commands.shot_interval = 3
+    fired = []
+    for _ in range(7):
+        world.commands.shoot()
+        world.step()
+        fired.append(world.events.count("shoot"))
+        world.events.clear()
+    assert fired == [1, 0, 0, 1, 0, 0, 1]
+    assert world.commands.stats()["dropped"] == 4
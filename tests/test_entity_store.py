@@ -0,0 +1,45 @@
+import pytest
+
+from engine import settings
+from entities.EntityStore import EntityStore
+from entities.Sprite import Sprite
+from entities.SpriteGroup import SpriteGroup
+
+WIDTH, HEIGHT = 800, 600
+
+
+def missiles():
+    return [Sprite([790 - 30 * i, 5 + 20 * i], [6, -4 + i], 0.1 * i, 0.01, None, settings.missile_info)
+            for i in range(8)]
+
+
+def state(group):
+    return sorted((round(float(p[0]), 9), round(float(p[1]), 9)) for p in (entity.pos for entity in group))
+
+
+def test_swap_remove_keeps_views_valid():
+    store = EntityStore(WIDTH, HEIGHT, capacity=2)  # емкость растет при добавлении
+    views = [store.add(sprite) for sprite in missiles()]
+    last = views[-1]
+    store.remove(views[1])
+    assert views[1] not in store and len(store) == 7
+    assert last.index == 1 and tuple(last.pos) == (790 - 30 * 7, 5 + 20 * 7)
+    with pytest.raises(KeyError):
+        store.remove(views[1])
+    store.discard(views[1])
+    assert [view.index for view in store] == list(range(7))
+
+
+@pytest.mark.parametrize("region", [None, (100, 100, 200, 150)])
+def test_step_matches_sprite_group(region):
+    store = EntityStore(WIDTH, HEIGHT)
+    group = SpriteGroup()
+    for a, b in zip(missiles(), missiles()):
+        store.add(a)
+        group.add(b)
+    for tick in range(settings.missile_info.lifespan + 1):
+        removed_store = store.step(WIDTH, HEIGHT, region, tick, coarse=4)
+        removed_group = group.step(WIDTH, HEIGHT, region, tick, coarse=4)
+        assert len(removed_store) == len(removed_group)
+        assert state(store) == state(group)
+    assert len(store) == len(group) < 8
@@ -0,0 +1,70 @@
+import math
+import os
+import random
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from engine import settings
+from entities.Ship import Ship
+from environment.Grid import Grid
+
+
+def make_grid(width=16, height=12, cell_size=50):
+    return Grid(width, height, cell_size, None, None)
+
+
+def touched_cells(grid, x, y, radius):
+    """Клетки, которые задевает круг, перебором всех клеток и копий поля со сдвигом."""
+    size = grid.cell_size
+    field_w, field_h = grid.width * size, grid.height * size
+    cells = []
+    for row in range(grid.height):
+        for col in range(grid.width):
+            for ox in (-field_w, 0, field_w):
+                for oy in (-field_h, 0, field_h):
+                    left, top = col * size + ox, row * size + oy
+                    dx = max(left - x, 0, x - left - size)
+                    dy = max(top - y, 0, y - top - size)
+                    if math.hypot(dx, dy) <= radius:
+                        cells.append((row, col))
+                        break
+                else:
+                    continue
+                break
+    return cells
+
+
+def test_cells_in_circle_matches_brute_force_across_seams():
+    grid = make_grid()
+    rng = random.Random(3)
+    field_w, field_h = grid.width * grid.cell_size, grid.height * grid.cell_size
+    points = [(0, 0), (field_w - 1, field_h - 1), (10, 300), (790, 5), (400, 599)]
+    points += [(rng.uniform(0, field_w), rng.uniform(0, field_h)) for _ in range(60)]
+    for x, y in points:
+        for radius in (3.5, 35.25, 40.5, 120.75):  # не целые, чтобы круг не касался границ клеток
+            assert sorted(grid.cells_in_circle(x, y, radius)) == touched_cells(grid, x, y, radius), (x, y, radius)
+
+
+def test_wall_and_loot_queries_wrap():
+    grid = make_grid()
+    grid.add_obstacle(11, 8)  # нижняя строка
+    grid.add_loot(5, 15)  # правый столбец
+    assert grid.circle_hits_wall(425, 10, 35)  # через верхний край
+    assert not grid.circle_hits_wall(425, 300, 35)
+    assert grid.loot_in_circle(10, 275, 35) == [(5, 15)]  # через левый край
+    grid.collect_loot(5, 15)
+    assert grid.loot_in_circle(10, 275, 35) == []
+
+
+def test_ship_uses_its_circle_for_walls_and_loot():
+    grid = make_grid()
+    width, height = grid.width * grid.cell_size, grid.height * grid.cell_size
+    ship = Ship([340, 325], [0, 0], 0, None, settings.ship_info, None)
+    grid.add_loot(6, 6)  # клетка (300..350, 300..350) под центром
+    grid.add_loot(6, 7)  # соседняя клетка, центр корабля в нее не попадает
+    grid.add_obstacle(6, 8)  # стена в 60 пикселях справа от центра
+    loot = ship.update(True, grid, 0, None, width, height)
+    assert loot == 2 and grid.get_loot_count() == 0
+    ship.vx = 40
+    ship.update(True, grid, 0, None, width, height)
+    assert ship.x == 340  # круг корабля задел бы стену, хотя центр до нее не доходит
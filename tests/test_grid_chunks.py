@@ -0,0 +1,69 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from environment.Grid import Grid
+
+RED = (255, 0, 0, 255)
+GREEN = (0, 255, 0, 255)
+CLEAR = (0, 0, 0, 0)
+
+
+class View:
+    """Камера: левый верхний угол видимой области поля."""
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def tile(color):
+    surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+    surface.fill(color)
+    return surface
+
+
+def make_grid():
+    # 8x8 клеток по 10 пикселей, чанки 4x4 клетки, в памяти не больше двух чанков
+    return Grid(8, 8, 10, tile(RED), tile(GREEN), chunk_cells=4, max_chunks=2)
+
+
+def visible(grid, x=0, y=0, size=(40, 40)):
+    items = []
+    grid.blit_items(size, View(x, y), items)
+    return items
+
+
+def test_dirty_cell_is_redrawn_in_place():
+    grid = make_grid()
+    grid.add_loot(1, 2)
+    (layer, pos), = visible(grid)
+    assert pos == (0, 0) and tuple(layer.get_at((25, 15))) == GREEN
+    grid.add_obstacle(1, 1)
+    grid.collect_loot(1, 2)
+    (again, _), = visible(grid)
+    assert again is layer  # чанк не пересобирается, перерисованы только две клетки
+    assert tuple(layer.get_at((15, 15))) == RED
+    assert tuple(layer.get_at((25, 15))) == CLEAR
+    assert not grid.dirty_cells
+
+
+def test_least_recently_shown_chunk_is_evicted_and_rebuilt():
+    grid = make_grid()
+    first = visible(grid)[0][0]
+    visible(grid, 40, 0)
+    visible(grid, 0, 40)
+    assert list(grid.chunks) == [(0, 1), (1, 0)]
+    grid.add_obstacle(0, 0)  # выгруженный чанк: перерисуется целиком при показе
+    rebuilt = visible(grid)[0][0]
+    assert rebuilt is not first
+    assert tuple(rebuilt.get_at((5, 5))) == RED
+    assert list(grid.chunks) == [(1, 0), (0, 0)]
+
+
+def test_view_across_the_seam_shows_chunks_from_both_edges():
+    grid = make_grid()
+    items = visible(grid, 60, 0)
+    assert [pos for _, pos in items] == [(-20, 0), (20, 0)]
+    assert list(grid.chunks) == [(0, 1), (0, 0)]
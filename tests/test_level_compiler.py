@@ -0,0 +1,63 @@
+import os
+from pathlib import Path
+
+from environment.LevelCompiler import LevelCompiler
+
+LEVEL = ["#..@", ".##.", "@..#"]
+
+
+def write_level(tmp_path):
+    path = tmp_path / "level1.txt"
+    path.write_text("\n".join(LEVEL))
+    return str(path)
+
+
+def check_level(level):
+    assert (level.width, level.height) == (4, 3)
+    assert sorted(level.wall_cells()) == [(0, 0), (1, 1), (1, 2), (2, 3)]
+    assert sorted(level.loot) == [(0, 3), (2, 0)]
+
+
+def compile_once(tmp_path):
+    path = write_level(tmp_path)
+    compiler = LevelCompiler(str(tmp_path / "cache"))
+    check_level(compiler.load(path))
+    compiled_path = compiler._compiled_path(path)
+    assert os.path.exists(compiled_path)
+    return path, compiled_path
+
+
+def reload(tmp_path, path):
+    """Загрузка новым компилятором (без кэша в памяти)."""
+    compiler = LevelCompiler(str(tmp_path / "cache"))
+    check_level(compiler.load(path))
+    assert compiler.load(path) is compiler.load(path)
+    return compiler.stats()
+
+
+def test_compiled_file_is_reused(tmp_path):
+    path, _ = compile_once(tmp_path)
+    assert reload(tmp_path, path) == {"memory_hits": 2, "disk_hits": 1, "compiles": 0}
+
+
+def test_crc_mismatch_recompiles(tmp_path):
+    path, compiled_path = compile_once(tmp_path)
+    data = bytearray(Path(compiled_path).read_bytes())
+    data[-1] ^= 0xFF  # испорченный байт тела
+    Path(compiled_path).write_bytes(bytes(data))
+    assert reload(tmp_path, path)["compiles"] == 1
+    assert reload(tmp_path, path)["disk_hits"] == 1  # файл пересохранен исправным
+
+
+def test_truncated_or_garbage_file_recompiles(tmp_path):
+    path, compiled_path = compile_once(tmp_path)
+    for data in (Path(compiled_path).read_bytes()[:-3], b"MEY", b"not a level at all"):
+        Path(compiled_path).write_bytes(data)
+        assert reload(tmp_path, path)["compiles"] == 1
+
+
+def test_newer_text_file_recompiles(tmp_path):
+    path, compiled_path = compile_once(tmp_path)
+    stat = os.stat(compiled_path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert reload(tmp_path, path)["compiles"] == 1
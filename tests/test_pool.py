@@ -0,0 +1,30 @@
+from engine import settings
+from entities.Sprite import Sprite
+from utils.Pool import Pool
+
+
+def make_missile(pool, pos):
+    return pool.acquire(pos, [1, 2], 0.5, 0, None, settings.missile_info)
+
+
+def test_release_then_acquire_reuses_and_resets_in_place():
+    pool = Pool(Sprite, capacity=4)
+    missile = make_missile(pool, [10, 20])
+    missile.age = 30
+    pool.release(missile)
+    again = make_missile(pool, [300, 400])
+    assert again is missile
+    assert again.pos == (300.0, 400.0) and again.prev_pos == (300.0, 400.0)
+    assert again.vel == (1.0, 2.0) and again.age == 0
+    assert pool.stats() == {"hits": 1, "misses": 1, "released": 1, "dropped": 0, "free": 0, "hit_rate": 0.5}
+
+
+def test_capacity_limits_free_list():
+    pool = Pool(Sprite, capacity=2)
+    missiles = [make_missile(pool, [i, i]) for i in range(3)]
+    pool.release_all(missiles)
+    stats = pool.stats()
+    assert stats["free"] == 2 and stats["released"] == 2 and stats["dropped"] == 1
+    # Свободные объекты выдаются снова, потом пул создает новые
+    assert {id(make_missile(pool, [0, 0])) for _ in range(2)} == {id(m) for m in missiles[:2]}
+    assert make_missile(pool, [0, 0]) not in missiles
@@ -0,0 +1,51 @@
+import json
+
+from utils.Profiler import NULL_SCOPE, Profiler
+
+
+class Worker:
+    def work(self):
+        return 42
+
+
+def test_disabled_profiler_costs_nothing():
+    profiler = Profiler()
+    profiler.hook(Worker, "work")
+    assert "work" in vars(Worker) and Worker.work.__name__ == "work"  # обертка не стоит
+    assert profiler.scope("update") is NULL_SCOPE
+    profiler.begin_frame()
+    profiler.end_frame(rocks=1)
+    assert not profiler.frames
+
+
+def test_scopes_and_hooks_are_measured_per_frame():
+    profiler = Profiler(history=2)
+    profiler.hook(Worker, "work")
+    profiler.toggle()
+    for _ in range(3):
+        profiler.begin_frame()
+        with profiler.scope("update"):
+            assert Worker().work() == 42
+        profiler.end_frame(rocks=5)
+    assert len(profiler.frames) == 2  # история ограничена
+    assert set(profiler.last) == {"update", "Worker.work"}
+    assert profiler.counts == {"rocks": 5}
+    profiler.toggle()
+    assert Worker.work.__name__ == "work"  # обертка снята
+
+
+def test_trace_is_written_with_limit(tmp_path):
+    profiler = Profiler(trace_limit=4)
+    profiler.start_trace()
+    for _ in range(3):
+        profiler.begin_frame()
+        with profiler.scope("draw"):
+            pass
+        profiler.end_frame()
+    path = tmp_path / "trace.json"
+    profiler.stop_trace(str(path))
+    trace = json.loads(path.read_text(encoding="utf-8"))
+    names = [event["name"] for event in trace["traceEvents"] if event["ph"] != "M"]
+    assert names == ["draw", "frame", "memory", "draw"]
+    assert trace["otherData"]["dropped_events"] == 5
+    assert not profiler.enabled and not profiler.tracing
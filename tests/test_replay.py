@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from engine.InputLog import InputLog
+from engine.World import World
+from environment.Grid import LOOT
+
+SEED = 1234
+
+
+def prepare_level_up(world):
+    """Убирает лут и порог очков, чтобы переход на следующий уровень случился на первом же шаге."""
+    grid = world.grid
+    for row in range(grid.height):
+        for col in range(grid.width):
+            if grid.cells[row * grid.width + col] == LOOT:
+                grid.set_cell(row, col, ".")
+    world.score_to_next_level = 0
+
+
+def play(world, ticks):
+    """Играет через очередь команд: цель и выстрел на каждом шаге."""
+    world.commands.start()
+    for tick in range(ticks):
+        world.commands.target([(37 * tick) % world.view_width, (53 * tick) % world.view_height])
+        world.commands.shoot()
+        world.step()
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_replay_across_level_change(backend):
+    world = World(seed=SEED, backend=backend)
+    prepare_level_up(world)
+    log = world.start_recording()
+    play(world, 120)
+    assert world.current_level == 2
+    assert world.time == 120
+    # Каждый шаг записал свою цель, в том числе шаг перехода на уровень
+    ticks = [tick for tick, kind, _ in log.events if kind == InputLog.TARGET]
+    assert ticks == sorted(set(ticks))
+
+    replayed = World(seed=log.seed, backend=backend)
+    prepare_level_up(replayed)
+    InputLog.from_bytes(log.to_bytes()).replay(replayed, world.time)
+    assert replayed.current_level == 2
+    assert InputLog.digest(replayed) == InputLog.digest(world)
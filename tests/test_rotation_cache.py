@@ -0,0 +1,34 @@
+import math
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from utils.RotationCache import RotationCache
+
+
+def test_least_recently_used_frame_is_evicted():
+    image = pygame.Surface((10, 10), pygame.SRCALPHA)
+    frame_bytes = 10 * 10 * image.get_bytesize()
+    cache = RotationCache(resolution=90, max_bytes=2 * frame_bytes)  # повороты на 90° не меняют размер
+    first = cache.get(image, 0)
+    cache.get(image, math.pi / 2)
+    assert cache.get(image, 0) is first  # кадр 0° стал самым свежим
+    cache.get(image, math.pi)  # не помещается - вытесняется 90°
+    assert list(cache.frames) == [(image, 0), (image, 2)]
+    assert cache.bytes == 2 * frame_bytes
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert cache.get(image, 0) is first
+
+
+def test_angles_share_quantized_frames_and_shrinking_limit_evicts():
+    image = pygame.Surface((10, 10), pygame.SRCALPHA)
+    cache = RotationCache(resolution=90)
+    assert cache.get(image, math.radians(44)) is cache.get(image, math.radians(-1))
+    cache.warm_up([image, None])
+    assert len(cache.frames) == 4
+    cache.configure(max_bytes=cache.bytes // 4)
+    assert list(cache.frames) == [(image, 3)]
+    cache.configure(resolution=45)
+    assert not cache.frames and cache.bytes == 0
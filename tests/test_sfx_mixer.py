@@ -0,0 +1,77 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from audio.SfxMixer import SfxMixer
+
+
+class Cache:
+    """Кэш эффектов: у всех имен один длинный тихий звук, чтобы каналы оставались заняты."""
+    def __init__(self):
+        self.sound = pygame.mixer.Sound(buffer=bytes(44100 * 4 * 5))
+
+    def get(self, name):
+        return self.sound
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def mixer():
+    try:
+        pygame.mixer.init(44100, -16, 2)
+    except pygame.error as e:
+        pytest.skip(f"нет аудиоустройства: {e}")
+    clock = Clock()
+    rules = {"shoot": (2, 50, 1), "explosion": (4, 0, 2), "loot": (2, 0, 10)}
+    sfx = SfxMixer(Cache(), channels=3, rules=rules, clock=clock)
+    yield sfx, clock
+    pygame.mixer.stop()
+    pygame.mixer.quit()
+
+
+def test_voice_cap_restarts_oldest_copy(mixer):
+    sfx, clock = mixer
+    channels = []
+    for _ in range(3):
+        channels.append(sfx.play("shoot"))
+        clock.now += 100  # вне окна склейки
+    assert channels[2] is not None and channels[2].get_busy()
+    # Третий выстрел перезапустил канал первого, а не занял свободный третий
+    assert sfx.voices == {0: ("shoot", 1, 200), 1: ("shoot", 1, 100)}
+    assert sfx.stats()["voices"] == 2
+
+
+def test_cooldown_coalesces_repeats(mixer):
+    sfx, clock = mixer
+    assert sfx.play("shoot") is not None
+    clock.now += 10
+    assert sfx.play("shoot") is None
+    assert sfx.stats()["coalesced"] == 1
+
+
+def test_priority_steals_oldest_lower_priority_voice(mixer):
+    sfx, clock = mixer
+    sfx.play("shoot")
+    clock.now += 100
+    sfx.play("explosion")
+    clock.now += 100
+    sfx.play("explosion")
+    clock.now += 100
+    # Каналы заняты: лут забирает канал у самого неважного звука (выстрела)
+    assert sfx.play("loot") is not None
+    assert sfx.voices[0][0] == "loot"
+    assert sfx.stats()["stolen"] == 1
+    # Для звука с приоритетом ниже всех звучащих канала нет
+    assert sfx.play("shoot") is None
+    assert sfx.stats()["dropped"] == 1
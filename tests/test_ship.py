@@ -0,0 +1,33 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from engine import settings
+from entities.Ship import Ship
+from environment.Grid import Grid
+
+
+def fly(ship, width, height, steps):
+    grid = Grid(width // 50, height // 50, 50, None, None)
+    path = []
+    for _ in range(steps):
+        ship.update(True, grid, 0, None, width, height)
+        path.append(ship.x)
+    return path
+
+
+def test_single_screen_flies_straight_to_cursor():
+    ship = Ship([100, 300], [0, 0], 0, None, settings.ship_info, None)
+    ship.set_target_position([700, 300], 800, 600)
+    path = fly(ship, 800, 600, 200)
+    # Цель дальше половины экрана, но корабль не уходит за левый край
+    assert all(100 < x < 700 for x in path)
+
+
+def test_large_world_steers_across_the_seam():
+    ship = Ship([1900, 500], [0, 0], 0, None, settings.ship_info, None)
+    ship.set_target_position([2200, 500], 2000, 1500, wrap=True)
+    assert ship.target_pos == [200, 500] and ship.initial_distance == 300
+    path = fly(ship, 2000, 1500, 200)
+    assert path[0] > 1900  # сразу вправо, к шву
+    assert 100 < path[-1] < 200  # перешел шов и остановился перед целью
@@ -0,0 +1,49 @@
+import random
+
+from utils.SpatialHash import SpatialHash
+
+
+class Body:
+    """Круг с интерфейсом спрайта для широкой фазы."""
+    def __init__(self, pos, radius):
+        self.pos = pos
+        self.radius = radius
+
+    def get_position(self):
+        return self.pos
+
+    def get_radius(self):
+        return self.radius
+
+
+def brute_force(spatial_hash, bodies, pos, radius):
+    return [body for body in bodies
+            if spatial_hash.distance(pos, body.pos) <= radius + body.radius]
+
+
+def test_query_across_partial_seam_row():
+    spatial_hash = SpatialHash(800, 600, 80)
+    rock = Body((400, 540), 40)
+    spatial_hash.insert(rock)
+    # До камня через шов 60 пикселей, меньше суммы радиусов 75
+    assert spatial_hash.query((400, 0), 35) == [rock]
+
+
+def test_query_matches_brute_force_near_edges():
+    rng = random.Random(7)
+    for width, height in ((800, 600), (1000, 700), (2000, 1500)):
+        spatial_hash = SpatialHash(width, height, 80)
+        bodies = []
+        for _ in range(300):
+            # Половина объектов у швов, где последняя строка и столбец неполные
+            x = rng.choice((rng.uniform(0, 60), rng.uniform(width - 60, width), rng.uniform(0, width)))
+            y = rng.choice((rng.uniform(0, 60), rng.uniform(height - 60, height), rng.uniform(0, height)))
+            body = Body((x, y), rng.choice((3, 40)))
+            bodies.append(body)
+            spatial_hash.insert(body)
+        missiles = [Body((rng.uniform(0, width), rng.choice((rng.uniform(0, 5), rng.uniform(height - 45, height)))), 3)
+                    for _ in range(100)]
+        for probe in missiles + [Body((x, y), 35) for x in (0, width / 2, width - 1) for y in (0, height - 1)]:
+            assert spatial_hash.query(probe.pos, probe.radius) == brute_force(spatial_hash, bodies, probe.pos, probe.radius)
+        expected = [(body, missile) for missile in missiles for body in brute_force(spatial_hash, bodies, missile.pos, 3)]
+        assert spatial_hash.pairs(missiles) == expected
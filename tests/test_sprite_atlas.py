@@ -0,0 +1,56 @@
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from utils.AssetManager import AssetManager
+from utils.SpriteAtlas import SpriteAtlas
+
+
+def save_image(directory, name, size, color):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(color)
+    pygame.image.save(surface, os.path.join(directory, name))
+
+
+def make_sprites(tmp_path):
+    source = str(tmp_path)
+    save_image(source, "ship.png", (20, 10), (255, 0, 0, 255))
+    save_image(source, "rock.png", (16, 16), (0, 255, 0, 128))
+    return {
+        "ship": (source, "ship.png", None),
+        "rock": (source, "rock.png", (8, 8)),
+        "ghost": (source, "ghost.png", None),  # файла нет
+    }
+
+
+def test_atlas_round_trip(tmp_path):
+    sprites = make_sprites(tmp_path)
+    atlas = SpriteAtlas(str(tmp_path / "atlas"))
+    assert atlas.ensure(sprites, AssetManager(use_disk_cache=False))
+    assert atlas.get("ship").get_size() == (20, 10)
+    assert atlas.get("rock").get_size() == (8, 8)
+    assert tuple(atlas.get("rock").get_at((4, 4))) == (0, 255, 0, 128)
+
+
+def test_missing_source_keeps_atlas_valid(tmp_path):
+    sprites = make_sprites(tmp_path)
+    assert SpriteAtlas(str(tmp_path / "atlas")).ensure(sprites, AssetManager(use_disk_cache=False))
+    atlas = SpriteAtlas(str(tmp_path / "atlas"))
+    assert atlas.load(sprites)  # без пересборки
+    assert atlas.get("ghost") is None
+    assert atlas.get("ship") is not None and atlas.stats()["sprites"] == 2
+
+
+def test_appearing_or_changed_source_makes_atlas_stale(tmp_path):
+    sprites = make_sprites(tmp_path)
+    assert SpriteAtlas(str(tmp_path / "atlas")).ensure(sprites, AssetManager(use_disk_cache=False))
+    save_image(str(tmp_path), "ghost.png", (4, 4), (0, 0, 255, 255))
+    atlas = SpriteAtlas(str(tmp_path / "atlas"))
+    assert not atlas.load(sprites)
+    assert atlas.ensure(sprites, AssetManager(use_disk_cache=False))
+    assert atlas.get("ghost").get_size() == (4, 4)
+    other = dict(sprites)
+    other["rock"] = (str(tmp_path), "rock.png", (12, 12))
+    assert not SpriteAtlas(str(tmp_path / "atlas")).load(other)
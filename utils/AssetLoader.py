@@ -0,0 +1,80 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AssetLoader:
+    """
+    Фоновая загрузка ресурсов в рабочем потоке.
+    Задачи (декодирование изображений, загрузка звуков) выполняются в потоке,
+    а их результаты доводятся до готовности (например, convert_alpha, которому
+    нужен основной поток) при опросе из игрового цикла.
+    """
+    def __init__(self, workers=1):
+        """
+        Инициализация.
+        Args:
+            workers: Количество рабочих потоков.
+        """
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="assets")
+        self.futures = {}  # имя -> Future
+        self.finalizers = {}  # имя -> функция, вызываемая в основном потоке
+
+    def submit(self, name, func, *args, finalize=None):
+        """
+        Ставит загрузку ресурса в очередь.
+        Args:
+            name: Имя ресурса.
+            func: Функция загрузки (выполняется в рабочем потоке).
+            *args: Аргументы функции.
+            finalize: Функция, которая доводит результат до готовности в основном потоке (необязательно).
+        Returns:
+            Объект Future.
+        """
+        future = self.futures[name] = self.executor.submit(func, *args)
+        if finalize:
+            self.finalizers[name] = finalize
+        return future
+
+    def _finish(self, name):
+        """
+        Забирает результат завершенной задачи и доводит его до готовности.
+        Args:
+            name: Имя ресурса.
+        Returns:
+            Готовый результат (None, если загрузка завершилась ошибкой).
+        """
+        future = self.futures.pop(name)
+        try:
+            value = future.result()
+        except Exception as e:
+            print(f"Ошибка фоновой загрузки '{name}': {e}")
+            value = None
+        finalize = self.finalizers.pop(name, None)
+        if finalize and value is not None:
+            value = finalize(value)
+        return value
+
+    def poll(self):
+        """
+        Доводит до готовности все завершенные задачи (вызывается раз в кадр).
+        Returns:
+            Список пар (имя, ресурс), ставших готовыми с прошлого вызова.
+        """
+        done = [name for name, future in self.futures.items() if future.done()]
+        return [(name, self._finish(name)) for name in done]
+
+    def wait_all(self):
+        """
+        Дожидается всех задач и доводит их до готовности.
+        Returns:
+            Список пар (имя, ресурс), ставших готовыми с прошлого вызова.
+        """
+        for future in list(self.futures.values()):
+            try:
+                future.result()
+            except Exception:
+                pass  # ошибка будет выведена в _finish
+        return self.poll()
+
+    def shutdown(self):
+        """Останавливает рабочие потоки, не дожидаясь незапущенных задач."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
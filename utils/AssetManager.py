@@ -0,0 +1,190 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+
+import pygame
+
+
+class AssetManager:
+    """
+    Загрузчик изображений без повторной работы.
+    Каждый вариант (файл, размер, прозрачность) декодируется и масштабируется один раз
+    и хранится в памяти. Кроме того, варианты сохраняются на диск как сырые пиксели
+    с ключом (хеш исходного файла, размер), и при следующем запуске читаются через
+    mmap и pygame.image.frombuffer без декодирования PNG/JPG и без масштабирования.
+    """
+    MAGIC = b"MEYA"
+    HEADER = struct.Struct("<4sHH4s")  # сигнатура, ширина, высота, формат пикселей
+
+    def __init__(self, cache_dir=os.path.join(".cache", "assets"), use_disk_cache=True):
+        """
+        Инициализация.
+        Args:
+            cache_dir: Папка дискового кэша.
+            use_disk_cache: Сохранять ли и читать ли варианты с диска.
+        """
+        self.cache_dir = cache_dir
+        self.use_disk_cache = use_disk_cache
+        self.images = {}  # (путь, размер, alpha, convert) -> pygame.Surface
+        self.digests = {}  # путь -> хеш содержимого файла
+        self.lock = threading.RLock()  # загрузка может идти из фонового потока
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.decodes = 0
+
+    def _digest(self, path):
+        """
+        Возвращает хеш содержимого исходного файла (считается один раз за запуск).
+        Args:
+            path: Путь к файлу.
+        Returns:
+            Шестнадцатеричная строка SHA-1.
+        """
+        digest = self.digests.get(path)
+        if digest is None:
+            with open(path, "rb") as file:
+                digest = self.digests[path] = hashlib.sha1(file.read()).hexdigest()
+        return digest
+
+    def _cache_path(self, digest, size, pixel_format):
+        """
+        Возвращает путь к файлу варианта в дисковом кэше.
+        Args:
+            digest: Хеш исходного файла.
+            size: Размер варианта (w, h) или None для исходного размера.
+            pixel_format: "RGBA" или "RGB".
+        Returns:
+            Путь к файлу (str).
+        """
+        size_part = f"{size[0]}x{size[1]}" if size else "orig"
+        return os.path.join(self.cache_dir, f"{digest}_{size_part}_{pixel_format.lower()}.raw")
+
+    def _read_cached(self, cache_path, pixel_format):
+        """
+        Читает вариант из дискового кэша без копирования пикселей.
+        Args:
+            cache_path: Путь к файлу варианта.
+            pixel_format: Ожидаемый формат пикселей.
+        Returns:
+            Объект pygame.Surface поверх отображенного в память файла или None.
+        """
+        try:
+            with open(cache_path, "rb") as file:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        if len(data) < self.HEADER.size:
+            data.close()
+            return None
+        magic, width, height, stored_format = self.HEADER.unpack_from(data)
+        expected = self.HEADER.size + width * height * len(pixel_format)
+        if magic != self.MAGIC or stored_format.rstrip(b"\0").decode() != pixel_format or len(data) != expected:
+            data.close()
+            return None
+        return pygame.image.frombuffer(memoryview(data)[self.HEADER.size:], (width, height), pixel_format)
+
+    def _write_cached(self, cache_path, surface, pixel_format):
+        """
+        Сохраняет вариант в дисковый кэш (атомарно, через временный файл).
+        Args:
+            cache_path: Путь к файлу варианта.
+            surface: Объект pygame.Surface.
+            pixel_format: "RGBA" или "RGB".
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            width, height = surface.get_size()
+            header = self.HEADER.pack(self.MAGIC, width, height, pixel_format.encode())
+            temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as file:
+                file.write(header)
+                file.write(pygame.image.tobytes(surface, pixel_format))
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"Не удалось сохранить кэш изображения: {e}")
+
+    def _decode(self, path, size):
+        """
+        Декодирует и масштабирует изображение.
+        Args:
+            path: Путь к файлу.
+            size: Размер (w, h) или None.
+        Returns:
+            Объект pygame.Surface.
+        """
+        surface = pygame.image.load(path)
+        if size and surface.get_size() != size:
+            surface = pygame.transform.scale(surface, size)
+        self.decodes += 1
+        return surface
+
+    def image(self, directory, filename, size=None, alpha=True, convert=True):
+        """
+        Возвращает изображение нужного размера, загружая его только при первом запросе.
+        Args:
+            directory: Папка с файлом.
+            filename: Имя файла.
+            size: Размер (w, h) или None, чтобы оставить исходный.
+            alpha: True - с прозрачностью (convert_alpha), False - непрозрачное (convert).
+            convert: Приводить ли к формату экрана (нужно открытое окно; из фонового потока
+                лучше передавать False и вызывать convert_surface в основном потоке).
+        Returns:
+            Объект pygame.Surface или None при ошибке загрузки.
+        """
+        path = os.path.join(directory, filename)
+        size = tuple(size) if size else None
+        key = (path, size, alpha, convert)
+        with self.lock:
+            surface = self.images.get(key)
+            if surface is not None:
+                self.memory_hits += 1
+                return surface
+            try:
+                pixel_format = "RGBA" if alpha else "RGB"
+                surface = None
+                cache_path = None
+                if self.use_disk_cache:
+                    cache_path = self._cache_path(self._digest(path), size, pixel_format)
+                    surface = self._read_cached(cache_path, pixel_format)
+                if surface is not None:
+                    self.disk_hits += 1
+                else:
+                    surface = self._decode(path, size)
+                    if cache_path:
+                        self._write_cached(cache_path, surface, pixel_format)
+                if convert:
+                    surface = self.convert_surface(surface, alpha)
+            except Exception as e:
+                print(f"Ошибка загрузки изображения: {e}")
+                return None
+            self.images[key] = surface
+            return surface
+
+    @staticmethod
+    def convert_surface(surface, alpha=True):
+        """
+        Приводит изображение к формату экрана для быстрого blit (если окно уже открыто).
+        Args:
+            surface: Объект pygame.Surface или None.
+            alpha: True - convert_alpha, False - convert.
+        Returns:
+            Приведенный pygame.Surface (или исходный, если окна нет).
+        """
+        if surface is None or pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def stats(self):
+        """
+        Возвращает статистику загрузок.
+        Returns:
+            Словарь с ключами "memory_hits", "disk_hits", "decodes", "variants".
+        """
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "decodes": self.decodes,
+            "variants": len(self.images),
+        }
@@ -1,7 +1,11 @@
 class ImageInfo:
     """
     Класс, хранящий информацию об изображении.
+    Служит описателем типа объекта: один экземпляр на тип (камень, ракета,
+    корабль), который все объекты этого типа используют совместно.
     """
+    __slots__ = ("center", "size", "radius", "lifespan", "animated")
+
     def __init__(self, center, size, radius=0, lifespan=None, animated=False):
         """
         Инициализация информации об изображении.
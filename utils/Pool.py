@@ -0,0 +1,74 @@
+class Pool:
+    """
+    Пул объектов одного типа со списком свободных объектов фиксированной емкости.
+    Освобожденные объекты переинициализируются на месте методом reset
+    вместо создания новых.
+    """
+    def __init__(self, factory, capacity=64):
+        """
+        Инициализация пула.
+        Args:
+            factory: Класс (или функция), создающий новый объект; у объектов должен быть
+                метод reset с теми же аргументами.
+            capacity: Максимальное число свободных объектов в пуле.
+        """
+        self.factory = factory
+        self.capacity = capacity
+        self.free = []
+        self.hits = 0  # объект взят из пула
+        self.misses = 0  # пришлось создать новый объект
+        self.released = 0  # объект возвращен в пул
+        self.dropped = 0  # пул полон, объект отдан сборщику мусора
+
+    def acquire(self, *args):
+        """
+        Берет объект из пула (или создает новый) и инициализирует его.
+        Args:
+            *args: Аргументы конструктора/метода reset.
+        Returns:
+            Готовый к использованию объект.
+        """
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.hits += 1
+            return obj
+        self.misses += 1
+        return self.factory(*args)
+
+    def release(self, obj):
+        """
+        Возвращает объект в пул.
+        Args:
+            obj: Объект, который больше не используется.
+        """
+        if len(self.free) < self.capacity:
+            self.free.append(obj)
+            self.released += 1
+        else:
+            self.dropped += 1
+
+    def release_all(self, objects):
+        """
+        Возвращает в пул несколько объектов.
+        Args:
+            objects: Итерируемая коллекция объектов.
+        """
+        for obj in objects:
+            self.release(obj)
+
+    def stats(self):
+        """
+        Возвращает статистику пула для настройки емкости.
+        Returns:
+            Словарь с ключами "hits", "misses", "released", "dropped", "free", "hit_rate".
+        """
+        requests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "released": self.released,
+            "dropped": self.dropped,
+            "free": len(self.free),
+            "hit_rate": self.hits / requests if requests else 0.0,
+        }
@@ -0,0 +1,243 @@
+import gc
+import json
+import os
+import sys
+import time
+from collections import deque
+
+
+class _NullScope:
+    """Пустая область замера: ее отдает выключенный профайлер."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    """Область замера: копит время в кадр профайлера и пишет событие в трассу."""
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, self.start, time.perf_counter())
+        return False
+
+
+class Profiler:
+    """
+    Легкий профайлер игрового цикла.
+    Замеряет именованные области (with profiler.scope("имя")) и методы,
+    подключенные через hook, копит время каждой области за кадр, хранит
+    историю времени кадров для графика, число объектов и выделений памяти
+    и умеет писать трассу в формате Chrome trace events (chrome://tracing,
+    Perfetto). Пока профайлер выключен, scope возвращает общую пустую
+    область, а обертки методов сняты, так что замеры почти ничего не стоят.
+    """
+    def __init__(self, history=240, trace_limit=1_000_000):
+        """
+        Инициализация.
+        Args:
+            history: Сколько последних кадров хранить для графика.
+            trace_limit: Максимальное число событий в трассе (дальше события отбрасываются).
+        """
+        self.visible = False  # показан ли оверлей
+        self.enabled = False  # идет ли сбор (оверлей показан или пишется трасса)
+        self.frames = deque(maxlen=history)  # время последних кадров, мс
+        self.scopes = {}  # область -> время в текущем кадре, с
+        self.last = {}  # область -> время в последнем законченном кадре, мс
+        self.counts = {}  # имя -> число объектов в последнем кадре
+        self.allocations = 0  # прирост выделенных блоков памяти за последний кадр
+        self.collections = 0  # сборок мусора за последний кадр
+        self.hooks = []  # (владелец, имя метода, имя области, исходный атрибут или None)
+        self.trace = None  # список событий трассы (None - трасса не пишется)
+        self.trace_limit = trace_limit
+        self.trace_start = 0.0
+        self.dropped = 0  # сколько событий не поместилось в трассу
+        self.frame_start = 0.0
+        self.blocks = 0
+        self.gc_runs = 0
+
+    def scope(self, name):
+        """
+        Область замера для блока with.
+        Args:
+            name: Имя области.
+        Returns:
+            Контекстный менеджер (общий пустой, если профайлер выключен).
+        """
+        if not self.enabled:
+            return NULL_SCOPE
+        return _Scope(self, name)
+
+    def add(self, name, start, end):
+        """
+        Учитывает замер области.
+        Args:
+            name: Имя области.
+            start: Начало (time.perf_counter()).
+            end: Конец (time.perf_counter()).
+        """
+        self.scopes[name] = self.scopes.get(name, 0.0) + end - start
+        if self.trace is not None:
+            self._trace_event({"name": name, "ph": "X", "ts": (start - self.trace_start) * 1e6,
+                               "dur": (end - start) * 1e6, "pid": 0, "tid": 0})
+
+    def _trace_event(self, event):
+        """
+        Добавляет событие в трассу с учетом лимита.
+        Args:
+            event: Словарь события в формате Chrome trace events.
+        """
+        if len(self.trace) < self.trace_limit:
+            self.trace.append(event)
+        else:
+            self.dropped += 1
+
+    def hook(self, owner, attribute, name=None):
+        """
+        Подключает замер метода. Обертка ставится на класс (или объект) только
+        пока профайлер включен, выключенный профайлер методы не замедляет.
+        Args:
+            owner: Класс или объект, чей метод замеряется.
+            attribute: Имя метода.
+            name: Имя области (по умолчанию "Класс.метод").
+        """
+        if name is None:
+            name = f"{getattr(owner, '__name__', type(owner).__name__)}.{attribute}"
+        hook = [owner, attribute, name, None]
+        self.hooks.append(hook)
+        if self.enabled:
+            self._install(hook)
+
+    def _install(self, hook):
+        """Ставит обертку замера на метод."""
+        owner, attribute, name, _ = hook
+        hook[3] = vars(owner).get(attribute)  # None - метод унаследован, снимать обертку надо удалением
+        original = getattr(owner, attribute)  # у класса - функция, у объекта - привязанный метод
+        add = self.add
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                add(name, start, perf_counter())
+        setattr(owner, attribute, timed)
+
+    def _remove(self, hook):
+        """Снимает обертку замера с метода."""
+        owner, attribute, _, original = hook
+        if original is None:
+            delattr(owner, attribute)
+        else:
+            setattr(owner, attribute, original)
+
+    def _set_enabled(self, enabled):
+        """
+        Включает или выключает сбор (ставит или снимает обертки методов).
+        Args:
+            enabled: Новое состояние.
+        """
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        for hook in self.hooks:
+            if enabled:
+                self._install(hook)
+            else:
+                self._remove(hook)
+        self.scopes.clear()
+        self.frame_start = 0.0
+
+    def toggle(self):
+        """Показывает или прячет оверлей."""
+        self.visible = not self.visible
+        self._set_enabled(self.visible or self.trace is not None)
+
+    def begin_frame(self):
+        """Начинает кадр."""
+        if not self.enabled:
+            return
+        self.scopes.clear()
+        self.frame_start = time.perf_counter()
+        self.blocks = sys.getallocatedblocks()
+        self.gc_runs = sum(stats["collections"] for stats in gc.get_stats())
+
+    def end_frame(self, **counts):
+        """
+        Заканчивает кадр.
+        Args:
+            **counts: Число объектов по видам (например, rocks=12).
+        """
+        if not self.enabled or not self.frame_start:
+            return
+        end = time.perf_counter()
+        self.frames.append((end - self.frame_start) * 1000)
+        self.last = {name: seconds * 1000 for name, seconds in self.scopes.items()}
+        self.counts = counts
+        self.allocations = sys.getallocatedblocks() - self.blocks
+        self.collections = sum(stats["collections"] for stats in gc.get_stats()) - self.gc_runs
+        if self.trace is not None:
+            ts = (self.frame_start - self.trace_start) * 1e6
+            self._trace_event({"name": "frame", "ph": "X", "ts": ts, "dur": (end - self.frame_start) * 1e6,
+                               "pid": 0, "tid": 1})
+            if counts:
+                self._trace_event({"name": "entities", "ph": "C", "ts": ts, "pid": 0, "args": counts})
+            self._trace_event({"name": "memory", "ph": "C", "ts": ts, "pid": 0,
+                               "args": {"allocated_blocks": self.allocations, "gc": self.collections}})
+
+    @property
+    def tracing(self):
+        """Пишется ли трасса."""
+        return self.trace is not None
+
+    def start_trace(self):
+        """Начинает запись трассы (сбор включается, даже если оверлей скрыт)."""
+        self.trace = []
+        self.dropped = 0
+        self.trace_start = time.perf_counter()
+        self._set_enabled(True)
+
+    def stop_trace(self, path):
+        """
+        Заканчивает запись трассы и сохраняет ее в формате Chrome trace events.
+        Args:
+            path: Путь к файлу JSON.
+        Returns:
+            Число сохраненных событий.
+        """
+        events, self.trace = self.trace or [], None
+        self._set_enabled(self.visible)
+        events = [
+            {"name": "process_name", "ph": "M", "pid": 0, "args": {"name": "game"}},
+            {"name": "thread_name", "ph": "M", "pid": 0, "tid": 0, "args": {"name": "scopes"}},
+            {"name": "thread_name", "ph": "M", "pid": 0, "tid": 1, "args": {"name": "frames"}},
+        ] + events
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms",
+                           "otherData": {"dropped_events": self.dropped}}, file)
+        except OSError as e:
+            print(f"Не удалось сохранить трассу: {e}")
+        return len(events)
+
+
+# Общий профайлер игры
+profiler = Profiler()
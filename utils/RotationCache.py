@@ -0,0 +1,123 @@
+import math
+from collections import OrderedDict
+
+import pygame
+
+
+class RotationCache:
+    """
+    Общий кэш повернутых изображений с ключом (изображение, квантованный угол).
+    Спрайты с одним изображением (например, все пончики) используют одни и те же кадры.
+    При превышении лимита памяти вытесняются давно не использованные кадры (LRU).
+    """
+    def __init__(self, resolution=3, max_bytes=64 * 1024 * 1024):
+        """
+        Инициализация кэша.
+        Args:
+            resolution: Шаг квантования угла в градусах.
+            max_bytes: Максимальный объем пикселей повернутых кадров в байтах.
+        """
+        self.resolution = resolution
+        self.steps = max(1, int(round(360 / resolution)))
+        self.max_bytes = max_bytes
+        self.frames = OrderedDict()  # (image, step) -> pygame.Surface
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def configure(self, resolution=None, max_bytes=None):
+        """
+        Меняет параметры кэша. При смене шага квантования кэш очищается.
+        Args:
+            resolution: Новый шаг квантования угла в градусах (необязательно).
+            max_bytes: Новый лимит памяти в байтах (необязательно).
+        """
+        if resolution is not None and resolution != self.resolution:
+            self.resolution = resolution
+            self.steps = max(1, int(round(360 / resolution)))
+            self.clear()
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        """Удаляет все кадры из кэша."""
+        self.frames.clear()
+        self.bytes = 0
+
+    def _step(self, angle):
+        """
+        Квантует угол.
+        Args:
+            angle: Угол в радианах.
+        Returns:
+            Номер шага (int) в диапазоне [0, steps).
+        """
+        return int(round(math.degrees(angle) / self.resolution)) % self.steps
+
+    @staticmethod
+    def _surface_bytes(surface):
+        """
+        Оценивает объем пикселей изображения.
+        Args:
+            surface: Объект pygame.Surface.
+        Returns:
+            Объем в байтах (int).
+        """
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def _evict(self):
+        """Вытесняет самые старые кадры, пока объем не уложится в лимит."""
+        while self.bytes > self.max_bytes and self.frames:
+            _, surface = self.frames.popitem(last=False)
+            self.bytes -= self._surface_bytes(surface)
+
+    def _rotate(self, image, step):
+        """
+        Поворачивает изображение и кладет кадр в кэш.
+        Args:
+            image: Объект pygame.Surface.
+            step: Номер шага квантования.
+        Returns:
+            Повернутый pygame.Surface.
+        """
+        rotated = pygame.transform.rotate(image, step * self.resolution)
+        self.frames[(image, step)] = rotated
+        self.bytes += self._surface_bytes(rotated)
+        self._evict()
+        return rotated
+
+    def get(self, image, angle):
+        """
+        Возвращает изображение, повернутое на угол (с точностью до шага квантования).
+        Args:
+            image: Объект pygame.Surface.
+            angle: Угол в радианах.
+        Returns:
+            Повернутый pygame.Surface.
+        """
+        key = (image, self._step(angle))
+        rotated = self.frames.get(key)
+        if rotated is not None:
+            self.frames.move_to_end(key)
+            self.hits += 1
+            return rotated
+        self.misses += 1
+        return self._rotate(image, key[1])
+
+    def warm_up(self, images):
+        """
+        Заранее вычисляет все повороты для известных изображений (например, при загрузке).
+        Args:
+            images: Список объектов pygame.Surface (None пропускаются).
+        """
+        for image in images:
+            if image is None:
+                continue
+            for step in range(self.steps):
+                if (image, step) not in self.frames:
+                    self._rotate(image, step)
+
+
+# Общий кэш для всех спрайтов и корабля
+rotation_cache = RotationCache()
@@ -0,0 +1,193 @@
+import math
+
+
+class SpatialHash:
+    """
+    Пространственный хеш на равномерной сетке для широкой фазы столкновений.
+    Учитывает зацикливание экрана: ячейки у правого края соседствуют с ячейками у левого.
+    """
+    def __init__(self, width, height, cell_size=80, wrap=True):
+        """
+        Инициализация пространственного хеша.
+        Args:
+            width: Ширина игрового поля в пикселях.
+            height: Высота игрового поля в пикселях.
+            cell_size: Наибольший размер ячейки в пикселях (лучше не меньше суммы двух самых больших
+                радиусов). Ячейки делят поле ровно, без неполной строки у шва, поэтому могут быть меньше.
+            wrap: True, если поле зациклено по краям (тор), False в противном случае.
+        """
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.cols = max(1, int(math.ceil(width / cell_size)))
+        self.rows = max(1, int(math.ceil(height / cell_size)))
+        self.cell_width = width / self.cols
+        self.cell_height = height / self.rows
+        self.wrap = wrap
+        # (col, row) -> словарь объект -> None (упорядоченное множество: обход не зависит от адресов)
+        self.cells = {}
+        self.keys = {}  # объект -> (col, row)
+        self.order = {}  # объект -> номер добавления (результаты идут в порядке группы, а не ячеек)
+        self.added = 0
+        self.max_radius = 0
+
+    def _key(self, pos):
+        """
+        Возвращает ключ ячейки для позиции.
+        Args:
+            pos: Позиция [x, y].
+        Returns:
+            Кортеж (col, row).
+        """
+        col = int(pos[0] // self.cell_width)
+        row = int(pos[1] // self.cell_height)
+        if self.wrap:
+            col %= self.cols
+            row %= self.rows
+        return col, row
+
+    def insert(self, obj):
+        """
+        Добавляет объект в хеш.
+        Args:
+            obj: Объект с методами get_position() и get_radius().
+        """
+        key = self._key(obj.get_position())
+        self.cells.setdefault(key, {})[obj] = None
+        self.keys[obj] = key
+        self.order[obj] = self.added
+        self.added += 1
+        if obj.get_radius() > self.max_radius:
+            self.max_radius = obj.get_radius()
+
+    def remove(self, obj):
+        """
+        Удаляет объект из хеша (если он там есть).
+        Args:
+            obj: Ранее добавленный объект.
+        """
+        key = self.keys.pop(obj, None)
+        if key is None:
+            return
+        del self.order[obj]
+        self._unlink(obj, key)
+
+    def _unlink(self, obj, key):
+        """
+        Убирает объект из ячейки.
+        Args:
+            obj: Объект.
+            key: Ключ ячейки (col, row).
+        """
+        cell = self.cells[key]
+        del cell[obj]
+        if not cell:
+            del self.cells[key]
+
+    def move(self, obj):
+        """
+        Переносит объект в новую ячейку, если он из своей вышел.
+        Args:
+            obj: Ранее добавленный объект.
+        """
+        key = self._key(obj.get_position())
+        old_key = self.keys[obj]
+        if key != old_key:
+            self._unlink(obj, old_key)
+            self.cells.setdefault(key, {})[obj] = None
+            self.keys[obj] = key
+
+    def sync(self, group):
+        """
+        Инкрементально приводит хеш в соответствие с группой спрайтов:
+        удаляет исчезнувшие, добавляет новые, переносит сдвинувшиеся.
+        Args:
+            group: Множество объектов.
+        """
+        for obj in [obj for obj in self.keys if obj not in group]:
+            self.remove(obj)
+        for obj in group:
+            if obj in self.keys:
+                self.move(obj)
+            else:
+                self.insert(obj)
+
+    def clear(self):
+        """Удаляет все объекты из хеша."""
+        self.cells.clear()
+        self.keys.clear()
+        self.order.clear()
+        self.max_radius = 0
+
+    def distance(self, p, q):
+        """
+        Вычисляет расстояние между точками с учетом зацикливания поля.
+        Args:
+            p: Первая точка [x, y].
+            q: Вторая точка [x, y].
+        Returns:
+            Расстояние между точками (float).
+        """
+        dx = abs(p[0] - q[0])
+        dy = abs(p[1] - q[1])
+        if self.wrap:
+            dx = min(dx, self.width - dx)
+            dy = min(dy, self.height - dy)
+        return math.sqrt(dx * dx + dy * dy)
+
+    def _neighbour_keys(self, pos, reach_cols, reach_rows):
+        """
+        Перебирает ключи ячеек в прямоугольнике вокруг позиции.
+        Args:
+            pos: Позиция [x, y].
+            reach_cols: Полуширина прямоугольника в ячейках.
+            reach_rows: Полувысота прямоугольника в ячейках.
+        Returns:
+            Множество ключей (col, row).
+        """
+        col, row = self._key(pos)
+        keys = set()
+        for c in range(col - reach_cols, col + reach_cols + 1):
+            for r in range(row - reach_rows, row + reach_rows + 1):
+                if self.wrap:
+                    keys.add((c % self.cols, r % self.rows))
+                elif 0 <= c < self.cols and 0 <= r < self.rows:
+                    keys.add((c, r))
+        return keys
+
+    def query(self, pos, radius):
+        """
+        Находит все объекты, круг которых пересекается с заданным кругом.
+        Args:
+            pos: Центр круга [x, y].
+            radius: Радиус круга.
+        Returns:
+            Список объектов, с которыми есть пересечение, в порядке их добавления в хеш
+            (при синхронизации с группой - в порядке группы).
+        """
+        reach = radius + self.max_radius
+        found = []
+        for key in self._neighbour_keys(pos, int(reach // self.cell_width) + 1, int(reach // self.cell_height) + 1):
+            cell = self.cells.get(key)
+            if not cell:
+                continue
+            for obj in cell:
+                if self.distance(pos, obj.get_position()) <= radius + obj.get_radius():
+                    found.append(obj)
+        found.sort(key=self.order.__getitem__)
+        return found
+
+    def pairs(self, others):
+        """
+        Находит за один проход все пары столкновений между объектами хеша и другой группой.
+        Args:
+            others: Итерируемая коллекция объектов с get_position() и get_radius().
+        Returns:
+            Список пар (объект из хеша, объект из others) в порядке (номер в others,
+            номер в хеше) - так же, как у EntityStore.pairs.
+        """
+        result = []
+        for other in others:
+            for obj in self.query(other.get_position(), other.get_radius()):
+                result.append((obj, other))
+        return result
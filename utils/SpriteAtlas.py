@@ -0,0 +1,262 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+
+import pygame
+
+
+class SpriteAtlas:
+    """
+    Атлас спрайтов: все масштабированные варианты изображений объектов,
+    упакованные в один или несколько листов. Листы хранятся на диске сырыми
+    пикселями (читаются через mmap, без декодирования PNG и масштабирования),
+    а рядом лежит индекс JSON с прямоугольником каждого спрайта. Спрайты
+    отдаются как подповерхности листа, так что при запуске загружается один
+    файл и все спрайты лежат в памяти рядом.
+    """
+    MAGIC = b"MEYT"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHHH")  # сигнатура, версия, ширина, высота листа (пиксели RGBA)
+    INDEX = "atlas.json"
+
+    def __init__(self, path=os.path.join(".cache", "atlas"), max_size=1024, padding=1):
+        """
+        Инициализация.
+        Args:
+            path: Папка атласа (листы и индекс).
+            max_size: Наибольшая сторона листа в пикселях.
+            padding: Зазор между спрайтами в пикселях.
+        """
+        self.path = path
+        self.max_size = max_size
+        self.padding = padding
+        self.sheets = []  # листы атласа (pygame.Surface)
+        self.sprites = {}  # имя -> подповерхность листа
+        self.index = None  # содержимое индекса JSON
+
+    @staticmethod
+    def _source_key(directory, filename, size):
+        """
+        Описание исходного файла для проверки актуальности атласа.
+        Args:
+            directory: Папка с файлом.
+            filename: Имя файла.
+            size: Размер варианта (w, h) или None.
+        Returns:
+            Словарь (путь, размер варианта, размер и время изменения файла;
+            для отсутствующего файла размер и время - None).
+        """
+        path = os.path.join(directory, filename)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return {"path": path, "size": list(size) if size else None, "bytes": None, "mtime_ns": None}
+        return {"path": path, "size": list(size) if size else None,
+                "bytes": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def pack(self, sizes):
+        """
+        Раскладывает прямоугольники по листам полками: по убыванию высоты,
+        слева направо, новая полка - когда строка заполнена.
+        Args:
+            sizes: Словарь имя -> (w, h).
+        Returns:
+            Кортеж (словарь имя -> (лист, x, y), список размеров листов (w, h)).
+        Raises:
+            ValueError: Если спрайт больше листа.
+        """
+        padding = self.padding
+        places = {}
+        sheets = []  # [ширина, высота] каждого листа
+        x = y = shelf = 0
+        for name in sorted(sizes, key=lambda n: (-sizes[n][1], -sizes[n][0], n)):
+            width, height = sizes[name]
+            if width + padding > self.max_size or height + padding > self.max_size:
+                raise ValueError(f"спрайт {name} больше листа атласа")
+            if not sheets:
+                sheets.append([0, 0])
+            if x + width + padding > self.max_size:  # строка заполнена - новая полка
+                x, y, shelf = 0, y + shelf, 0
+            if y + height + padding > self.max_size:  # лист заполнен - новый лист
+                sheets.append([0, 0])
+                x = y = shelf = 0
+            places[name] = (len(sheets) - 1, x, y)
+            sheet = sheets[-1]
+            sheet[0] = max(sheet[0], x + width)
+            sheet[1] = max(sheet[1], y + height)
+            x += width + padding
+            shelf = max(shelf, height + padding)
+        return places, [tuple(sheet) for sheet in sheets]
+
+    def build(self, sprites, assets):
+        """
+        Собирает атлас: загружает варианты, раскладывает их по листам и
+        сохраняет листы и индекс на диск. Спрайты, которые не удалось
+        загрузить, записываются в индекс как отсутствующие (вместе с описанием
+        источника), чтобы атлас не пересобирался при каждом запуске.
+        Args:
+            sprites: Словарь имя -> (папка, файл, размер или None).
+            assets: Объект AssetManager (декодирует и масштабирует варианты).
+        Returns:
+            True, если атлас сохранен.
+        """
+        images = {}
+        sources = {}
+        missing = {}
+        for name, (directory, filename, size) in sprites.items():
+            image = assets.image(directory, filename, size, True, False)
+            if image is None:
+                # AssetManager уже сообщил об ошибке; без спрайта игра тоже работает
+                missing[name] = {"source": self._source_key(directory, filename, size)}
+                continue
+            images[name] = image
+            sources[name] = self._source_key(directory, filename, size)
+        try:
+            places, sheet_sizes = self.pack({name: image.get_size() for name, image in images.items()})
+        except ValueError as e:
+            print(f"Не удалось собрать атлас: {e}")
+            return False
+        sheets = [pygame.Surface(size, pygame.SRCALPHA) for size in sheet_sizes]
+        for sheet in sheets:
+            sheet.fill((0, 0, 0, 0))
+        index = {"version": self.VERSION, "sheets": [], "sprites": {}, "missing": missing}
+        for name, image in images.items():
+            sheet, x, y = places[name]
+            # MAX по пустому листу - точная копия пикселей, без смешивания полупрозрачных краев
+            sheets[sheet].blit(image, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            index["sprites"][name] = {"sheet": sheet, "rect": [x, y, *image.get_size()], "source": sources[name]}
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            for number, sheet in enumerate(sheets):
+                filename = f"atlas{number}.raw"
+                index["sheets"].append({"file": filename, "size": list(sheet.get_size())})
+                self._write_atomic(filename, self.HEADER.pack(self.MAGIC, self.VERSION, *sheet.get_size())
+                                   + pygame.image.tobytes(sheet, "RGBA"))
+            self._write_atomic(self.INDEX, json.dumps(index, indent=1, ensure_ascii=False).encode("utf-8"))
+        except OSError as e:
+            print(f"Не удалось сохранить атлас: {e}")
+            return False
+        return True
+
+    def _write_atomic(self, filename, data):
+        """
+        Записывает файл атласа через временный файл.
+        Args:
+            filename: Имя файла в папке атласа.
+            data: Содержимое (bytes).
+        """
+        path = os.path.join(self.path, filename)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+    def _read_sheet(self, filename, size):
+        """
+        Читает лист через mmap без копирования пикселей.
+        Args:
+            filename: Имя файла листа.
+            size: Ожидаемый размер (w, h).
+        Returns:
+            Объект pygame.Surface или None, если файл поврежден.
+        """
+        try:
+            with open(os.path.join(self.path, filename), "rb") as file:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        width, height = size
+        if len(data) != self.HEADER.size + width * height * 4 or \
+                self.HEADER.unpack_from(data) != (self.MAGIC, self.VERSION, width, height):
+            data.close()
+            return None
+        return pygame.image.frombuffer(memoryview(data)[self.HEADER.size:], (width, height), "RGBA")
+
+    def load(self, sprites):
+        """
+        Загружает атлас, если он собран из тех же файлов и размеров.
+        Спрайты, отсутствовавшие при сборке, не мешают загрузке, пока их
+        исходные файлы не изменились (get для них возвращает None).
+        Args:
+            sprites: Словарь имя -> (папка, файл, размер или None).
+        Returns:
+            True, если атлас загружен; False, если его нет или он устарел.
+        """
+        try:
+            with open(os.path.join(self.path, self.INDEX), encoding="utf-8") as file:
+                index = json.load(file)
+            missing = index.get("missing", {})
+            if index.get("version") != self.VERSION or set(index["sprites"]) | set(missing) != set(sprites):
+                return False
+            for name, (directory, filename, size) in sprites.items():
+                entry = index["sprites"].get(name) or missing[name]
+                if entry["source"] != self._source_key(directory, filename, size):
+                    return False  # исходный файл или размер варианта изменились (или файл появился)
+        except (OSError, ValueError, KeyError):
+            return False
+        sheets = []
+        for sheet in index["sheets"]:
+            surface = self._read_sheet(sheet["file"], sheet["size"])
+            if surface is None:
+                return False
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()  # формат экрана - быстрый blit
+            sheets.append(surface)
+        self.sheets = sheets
+        self.index = index
+        self.sprites = {name: sheets[entry["sheet"]].subsurface(entry["rect"])
+                        for name, entry in index["sprites"].items()}
+        return True
+
+    def ensure(self, sprites, assets):
+        """
+        Загружает атлас, пересобирая его, если он отсутствует или устарел.
+        Args:
+            sprites: Словарь имя -> (папка, файл, размер или None).
+            assets: Объект AssetManager для пересборки.
+        Returns:
+            True, если атлас загружен.
+        """
+        if self.load(sprites):
+            return True
+        return self.build(sprites, assets) and self.load(sprites)
+
+    def get(self, name):
+        """
+        Возвращает спрайт атласа.
+        Args:
+            name: Имя спрайта.
+        Returns:
+            Подповерхность листа (pygame.Surface) или None, если спрайта нет.
+        """
+        return self.sprites.get(name)
+
+    def stats(self):
+        """
+        Возвращает сведения об атласе.
+        Returns:
+            Словарь с ключами "sheets", "sprites", "bytes", "fill" (доля листов, занятая спрайтами).
+        """
+        area = sum(sheet.get_width() * sheet.get_height() for sheet in self.sheets)
+        used = sum(sprite.get_width() * sprite.get_height() for sprite in self.sprites.values())
+        return {
+            "sheets": len(self.sheets),
+            "sprites": len(self.sprites),
+            "bytes": area * 4,
+            "fill": round(used / area, 3) if area else 0.0,
+        }
+
+
+if __name__ == "__main__":
+    # Сборка атласа: python -m utils.SpriteAtlas [папка атласа]
+    from engine.settings import ATLAS_DIR, ATLAS_SPRITES
+    from utils.AssetManager import AssetManager
+
+    atlas = SpriteAtlas(sys.argv[1] if len(sys.argv) > 1 else ATLAS_DIR)
+    if atlas.build(ATLAS_SPRITES, AssetManager()) and atlas.load(ATLAS_SPRITES):
+        print(f"Атлас собран в {atlas.path}: {atlas.stats()}")
+    else:
+        sys.exit(1)
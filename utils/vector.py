@@ -21,4 +21,24 @@ def dist(p, q):
     Returns:
         Расстояние между точками (float).
     """
-    return math.sqrt(((p[0] - q[0]) ** 2) + ((p[1] - q[1]) ** 2))
\ No newline at end of file
+    return math.sqrt(((p[0] - q[0]) ** 2) + ((p[1] - q[1]) ** 2))
+
+
+def wrapped_delta(p, q, width, height):
+    """
+    Кратчайший вектор от точки p к точке q на зацикленном поле.
+    Args:
+        p: Начальная точка [x, y].
+        q: Конечная точка [x, y].
+        width: Ширина поля.
+        height: Высота поля.
+    Returns:
+        Кортеж (dx, dy); каждая составляющая по модулю не больше половины поля.
+    """
+    dx = (q[0] - p[0]) % width
+    dy = (q[1] - p[1]) % height
+    if dx > width / 2:
+        dx -= width
+    if dy > height / 2:
+        dy -= height
+    return dx, dy
\ No newline at end of file